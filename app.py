@@ -8,31 +8,70 @@ import sys
 import uuid
 import yaml
 import shutil
+import threading
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, wait
 from flask import Flask, render_template, request, jsonify, send_from_directory, url_for
+from werkzeug.utils import secure_filename
 
 # Add the parent directory to sys.path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 # Import modules from the text extraction tool
-from src.config.config_handler import ConfigHandler
+from src.config.config_cache import ConfigCache
 from src.parser.parser_factory import ParserFactory
+from src.parser.extraction_cache import ExtractionCache
 from src.utils.data_processor import DataProcessor
-from src.exporters.excel_exporter import ExcelExporter
-from src.exporters.word_exporter import WordExporter
-from src.exporters.text_exporter import TextExporter
+from src.pipeline import DEFAULT_FORMATS, export_stream
+from web.job_queue import JobQueue, JobWorkerPool
+from web.upload_stream import StreamingUpload, UploadParser
 
 app = Flask(__name__)
 
 # Configure upload and output directories
 UPLOAD_FOLDER = os.path.join(os.path.dirname(__file__), 'uploads')
 OUTPUT_FOLDER = os.path.join(os.path.dirname(__file__), 'outputs')
-ALLOWED_INPUT_EXTENSIONS = {'txt', 'xlsx', 'xls', 'csv', 'docx'}
+ALLOWED_INPUT_EXTENSIONS = {extension.lstrip('.') for extension in ParserFactory.supported_extensions()}
 ALLOWED_CONFIG_EXTENSIONS = {'yaml', 'yml'}
 
+# Number of worker processes used to parse the files of one request
+PARSER_WORKERS = int(os.environ.get('TEXT_EXTRACTOR_WORKERS', '1'))
+
+# Start method of the parser worker processes and of the exporter processes of concurrent
+# exports. Jobs run in worker threads, and forking a multithreaded process can deadlock
+# the child, so processes are not forked from the server process itself.
+PROCESS_START_METHOD = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+
+# Extraction cache shared by all requests, enabled by setting a cache directory
+CACHE_DIR = os.environ.get('TEXT_EXTRACTOR_CACHE_DIR')
+CACHE_SIZE_MB = int(os.environ.get('TEXT_EXTRACTOR_CACHE_SIZE_MB', '1024'))
+extraction_cache = ExtractionCache(CACHE_DIR, CACHE_SIZE_MB * 1024 * 1024) if CACHE_DIR else None
+
+# Configurations of this process with their parsers, by content, so that requests
+# sending a configuration seen before skip loading it and building its parsers
+CONFIG_CACHE_SIZE = int(os.environ.get('TEXT_EXTRACTOR_CONFIG_CACHE_SIZE', '32'))
+config_cache = ConfigCache(CONFIG_CACHE_SIZE)
+
 # Create directories if they don't exist
 os.makedirs(UPLOAD_FOLDER, exist_ok=True)
 os.makedirs(OUTPUT_FOLDER, exist_ok=True)
 
+# Queue of extraction jobs shared by all server processes, and the limits on
+# running jobs (across all processes) and on jobs waiting to run
+JOB_DB_PATH = os.environ.get('TEXT_EXTRACTOR_JOB_DB', os.path.join(OUTPUT_FOLDER, 'jobs.sqlite3'))
+MAX_RUNNING_JOBS = int(os.environ.get('TEXT_EXTRACTOR_MAX_RUNNING_JOBS', '1'))
+MAX_QUEUED_JOBS = int(os.environ.get('TEXT_EXTRACTOR_MAX_QUEUED_JOBS', '100'))
+job_queue = JobQueue(JOB_DB_PATH, MAX_RUNNING_JOBS, MAX_QUEUED_JOBS)
+
+# Threads parsing uploaded input files while the rest of the upload is received. Without
+# a shared extraction cache, the records go to a cache in the session upload directory.
+upload_parser_pool = ThreadPoolExecutor(max_workers=max(PARSER_WORKERS, 1))
+UPLOAD_CACHE_DIR = '.parsed'
+
+# Parses started during uploads by session ID, which the jobs running in this process wait for
+early_parses = {}
+early_parses_lock = threading.Lock()
+
 # Copy sample config to static folder
 SAMPLE_CONFIG_PATH = os.path.join(os.path.dirname(__file__), '..', 'sample_data', 'config_example.yaml')
 STATIC_CONFIG_PATH = os.path.join(os.path.dirname(__file__), 'static', 'sample_config.yaml')
@@ -52,10 +91,10 @@ def sample_config():
 @app.route('/process', methods=['POST'])
 def process_files():
     """
-    Process uploaded files using the text extraction tool.
+    Queue the extraction of uploaded files using the text extraction tool.
     
     Returns:
-        JSON response with success status and download links
+        JSON response with success status, job ID and status URL
     """
     try:
         # Create a unique session ID for this request
@@ -67,54 +106,134 @@ def process_files():
         os.makedirs(session_upload_dir, exist_ok=True)
         os.makedirs(session_output_dir, exist_ok=True)
         
-        # Get export formats
-        export_formats = request.form.get('exportFormats', 'all')
+        # Save the uploaded files as they arrive, each written once to the session directory,
+        # and start parsing every input file as soon as it is complete
+        boundary = request.mimetype_params.get('boundary')
+        if request.mimetype != 'multipart/form-data' or not boundary:
+            return jsonify({'success': False, 'error': 'Expected a multipart/form-data upload'})
         
-        # Save input files
-        input_files = []
-        for file in request.files.getlist('inputFiles'):
-            if file and '.' in file.filename and file.filename.rsplit('.', 1)[1].lower() in ALLOWED_INPUT_EXTENSIONS:
-                file_path = os.path.join(session_upload_dir, file.filename)
-                file.save(file_path)
-                input_files.append(file_path)
+        cache = extraction_cache or ExtractionCache(os.path.join(session_upload_dir, UPLOAD_CACHE_DIR))
+        upload_parser = UploadParser(upload_parser_pool, cache, config_cache, 'configFile')
+        upload = StreamingUpload(
+            lambda field_name, file_name: upload_path(session_upload_dir, field_name, file_name),
+            upload_parser.file_received
+        )
+        upload.receive(request.stream, boundary.encode('latin-1'))
         
+        # Get export formats
+        export_formats = upload.fields.get('exportFormats', ['all'])[0]
+        
+        input_files = [file['path'] for file in upload.files if file['field'] == 'inputFiles']
         if not input_files:
             return jsonify({'success': False, 'error': 'No valid input files uploaded'})
         
-        # Save config file
-        config_file = request.files['configFile']
-        if not config_file or '.' not in config_file.filename or \
-           config_file.filename.rsplit('.', 1)[1].lower() not in ALLOWED_CONFIG_EXTENSIONS:
+        config_paths = [file['path'] for file in upload.files if file['field'] == 'configFile']
+        if not config_paths:
             return jsonify({'success': False, 'error': 'Invalid configuration file'})
         
-        config_path = os.path.join(session_upload_dir, 'config.yaml')
-        config_file.save(config_path)
+        config_path = config_paths[0]
         
-        # Process the files
-        result_files = process_extraction(input_files, config_path, session_output_dir, export_formats)
+        # Queue the extraction; the files are processed by the job workers
+        job_id = job_queue.enqueue({
+            'session_id': session_id,
+            'input_files': input_files,
+            'config_path': config_path,
+            'output_dir': session_output_dir,
+            'export_formats': export_formats,
+            'cache_dir': None if extraction_cache else cache.cache_dir,
+            'content_hashes': upload_parser.content_hashes
+        })
         
-        if not result_files:
-            return jsonify({'success': False, 'error': 'No data could be extracted from the input files'})
+        if job_id is None:
+            shutil.rmtree(session_upload_dir, ignore_errors=True)
+            shutil.rmtree(session_output_dir, ignore_errors=True)
+            return jsonify({'success': False, 'error': 'Too many jobs are waiting, please try again later'}), 503
         
-        # Generate download URLs
-        download_files = []
-        for format_name, file_path in result_files.items():
-            if file_path:
-                file_name = os.path.basename(file_path)
-                download_url = url_for('download_file', session_id=session_id, filename=file_name)
-                download_files.append({
-                    'name': f'Extracted Data ({format_name})',
-                    'url': download_url
-                })
+        with early_parses_lock:
+            # Forget the parses of jobs run by other processes once they are over
+            for done_session_id in [key for key, futures in early_parses.items() if all(f.done() for f in futures)]:
+                del early_parses[done_session_id]
+            early_parses[session_id] = upload_parser.futures
+        
+        worker_pool.start()
+        worker_pool.notify()
         
         return jsonify({
             'success': True,
-            'files': download_files
-        })
-        
+            'job_id': job_id,
+            'status_url': url_for('job_status', job_id=job_id)
+        }), 202
+    
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)})
 
+def upload_path(upload_dir, field_name, file_name):
+    """
+    Get the path to save an uploaded file under.
+    
+    Args:
+        upload_dir: Session upload directory
+        field_name: Form field name of the file
+        file_name: Name of the uploaded file
+        
+    Returns:
+        Path of the file, or None if the file is not accepted
+    """
+    extension = file_name.rsplit('.', 1)[1].lower() if '.' in file_name else ''
+    
+    if field_name == 'inputFiles' and extension in ALLOWED_INPUT_EXTENSIONS:
+        return os.path.join(upload_dir, secure_filename(file_name))
+    
+    if field_name == 'configFile' and extension in ALLOWED_CONFIG_EXTENSIONS:
+        return os.path.join(upload_dir, 'config.yaml')
+    
+    return None
+
+@app.route('/status/<job_id>')
+def job_status(job_id):
+    """
+    Report the status of an extraction job.
+    
+    Args:
+        job_id: Job ID returned by /process
+        
+    Returns:
+        JSON response with the job status ('queued', 'running', 'done' or
+        'failed'), progress percentage and message, and the download links
+        once the job is done
+    """
+    # Jobs queued by another server process may run in this one
+    worker_pool.start()
+    
+    job = job_queue.get(job_id)
+    if job is None:
+        return jsonify({'success': False, 'error': 'Unknown job'}), 404
+    
+    response = {
+        'success': job['status'] != JobQueue.FAILED,
+        'job_id': job_id,
+        'status': job['status'],
+        'progress': job['progress'],
+        'message': job['message']
+    }
+    
+    if job['status'] == JobQueue.QUEUED:
+        response['position'] = job['position']
+    elif job['status'] == JobQueue.FAILED:
+        response['error'] = job['error']
+    elif job['status'] == JobQueue.DONE:
+        # Generate download URLs
+        result = job['result']
+        response['files'] = [
+            {
+                'name': f'Extracted Data ({format_name})',
+                'url': url_for('download_file', session_id=result['session_id'], filename=file_name)
+            }
+            for format_name, file_name in result['files'].items()
+        ]
+    
+    return jsonify(response)
+
 @app.route('/download/<session_id>/<filename>')
 def download_file(session_id, filename):
     """
@@ -130,7 +249,49 @@ def download_file(session_id, filename):
     session_output_dir = os.path.join(OUTPUT_FOLDER, session_id)
     return send_from_directory(session_output_dir, filename, as_attachment=True)
 
-def process_extraction(input_files, config_path, output_dir, export_formats):
+def run_job(payload, progress):
+    """
+    Run a queued extraction job.
+    
+    Args:
+        payload: Job parameters queued by process_files
+        progress: Function recording the job progress from a percentage and a message
+        
+    Returns:
+        Dictionary with the session ID and the output file names by format
+        
+    Raises:
+        ValueError: If no data could be extracted from the input files
+    """
+    # Let the parses started during the upload finish, so their records are taken from the cache
+    with early_parses_lock:
+        futures = early_parses.pop(payload['session_id'], [])
+    if futures:
+        progress(0, 'Parsing files')
+        wait(futures)
+    
+    cache = ExtractionCache(payload['cache_dir']) if payload.get('cache_dir') else extraction_cache
+    
+    result_files = process_extraction(
+        payload['input_files'],
+        payload['config_path'],
+        payload['output_dir'],
+        payload['export_formats'],
+        progress,
+        cache,
+        payload.get('content_hashes')
+    )
+    
+    files = {format_name: os.path.basename(file_path) for format_name, file_path in result_files.items() if file_path}
+    if not files:
+        raise ValueError('No data could be extracted from the input files')
+    
+    return {'session_id': payload['session_id'], 'files': files}
+
+# Worker threads of this process running the queued jobs, started by the first request
+worker_pool = JobWorkerPool(job_queue, run_job, MAX_RUNNING_JOBS)
+
+def process_extraction(input_files, config_path, output_dir, export_formats, progress=None, cache=None, content_hashes=None):
     """
     Process the extraction using the text extraction tool.
     
@@ -139,63 +300,66 @@ def process_extraction(input_files, config_path, output_dir, export_formats):
         config_path: Path to the configuration file
         output_dir: Directory to save output files
         export_formats: Comma-separated list of export formats or "all"
+        progress: Function called with a percentage and a message as the extraction proceeds, if any
+        cache: Extraction cache to use instead of the shared one, if any
+        content_hashes: SHA-256 digests of the input files by path, if known
         
     Returns:
         Dictionary mapping format names to output file paths
     """
+    if progress is None:
+        progress = lambda percent, message: None
+    
     try:
-        # Load configuration
-        config_handler = ConfigHandler()
-        config_data = config_handler.load_config(config_path)
+        # Load configuration, or reuse the one loaded for the same content
+        config = config_cache.load(config_path, (content_hashes or {}).get(config_path))
+        config_handler = config.handler
         
         # Extract data from input files
         all_data = []
-        parser_factory = ParserFactory(config_handler.get_input_config())
+        parser_factory = config.parser_factory(cache or extraction_cache, content_hashes)
         
-        for file_path in input_files:
-            data = parser_factory.parse_file(file_path)
+        progress(0, 'Parsing files')
+        parsed = parser_factory.parse_files(
+            input_files,
+            PARSER_WORKERS,
+            mp_context=multiprocessing.get_context(PROCESS_START_METHOD)
+        )
+        for done, (_, data) in enumerate(parsed, 1):
             if data:
                 all_data.extend(data)
+            # Parsing accounts for most of the job
+            progress(done * 80 // len(input_files), f'Parsed {done} of {len(input_files)} files')
         
         if not all_data:
             return {}
         
         # Process and structure the data
-        processor = DataProcessor(config_handler.get_output_config())
+        progress(80, 'Structuring data')
+        # Values are formatted by export_stream, for the exporters that show formatted values
+        processor = DataProcessor(config_handler.get_output_config(), format_values=False)
         structured_data = processor.process(all_data)
         
         # Determine export formats
         if export_formats.lower() == 'all':
-            formats = ['excel', 'word', 'text']
+            formats = list(DEFAULT_FORMATS)
         else:
             formats = [fmt.strip().lower() for fmt in export_formats.split(',')]
         
-        # Export data to specified formats
-        results = {}
-        
-        # Combine configurations for exporters
-        combined_config = {
-            **config_handler.get_output_config(),
-            **config_handler.get_export_config()
-        }
-        
-        # Export to Excel
-        if 'excel' in formats:
-            exporter = ExcelExporter(combined_config)
-            results['excel'] = exporter.export(structured_data, output_dir)
-        
-        # Export to Word
-        if 'word' in formats:
-            exporter = WordExporter(combined_config)
-            results['word'] = exporter.export(structured_data, output_dir)
-        
-        # Export to Text
-        if 'text' in formats:
-            exporter = TextExporter(combined_config)
-            results['text'] = exporter.export(structured_data, output_dir)
+        # Export data to specified formats, running the exporters concurrently
+        progress(90, 'Exporting data')
+        results, _ = export_stream(
+            structured_data,
+            output_dir,
+            formats,
+            config_handler.get_output_config(),
+            config_handler.get_export_config(),
+            concurrent=True,
+            start_method=PROCESS_START_METHOD
+        )
         
         return results
-        
+    
     except Exception as e:
         print(f"Error in process_extraction: {str(e)}")
         return {}
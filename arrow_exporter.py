@@ -0,0 +1,365 @@
+"""
+Arrow exporter module.
+Exports structured data to the Arrow IPC (Feather) file format.
+"""
+import os
+from typing import Dict, Iterable, List, Any, Optional
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+
+class ArrowExporter:
+    """Exporter for creating Arrow IPC files with typed columns from structured data."""
+    
+    # Section of the export configuration, output file name and format name used in messages
+    CONFIG_SECTION = 'arrow'
+    FILE_NAME = 'extracted_data.arrow'
+    FORMAT_NAME = 'Arrow'
+    
+    # Configuration key and default number of records written per record batch
+    BATCH_SIZE_KEY = 'batch_size'
+    DEFAULT_BATCH_SIZE = 65536
+    
+    # Default compression codec (None, 'lz4' or 'zstd')
+    DEFAULT_COMPRESSION = None
+    
+    # Typed columns hold the values before formatting, so the 'format' of the
+    # output structure fields does not apply (see pipeline.ExportFormatter)
+    FORMATTED_VALUES = False
+    
+    def __init__(self, config: Dict[str, Any]):
+        """
+        Initialize the Arrow exporter with configuration.
+        
+        Args:
+            config: Dictionary containing Arrow export configurations
+        """
+        self.config = config.get(self.CONFIG_SECTION, {})
+        self.output_structure = config.get('structure', [])
+        
+        # Writer of the output file and records not written yet, between open() and close()
+        self.writer = None
+        self.pending = []
+        self.failed = True
+    
+    def export(self, data: List[Dict[str, Any]], output_path: str) -> str:
+        """
+        Export data to the file format.
+        
+        Args:
+            data: List of dictionaries containing structured data
+            output_path: Directory path where the output file will be saved
+            
+        Returns:
+            Path to the created file
+        """
+        return self.export_records(data, output_path)
+    
+    def export_records(self, records: Iterable[Dict[str, Any]], output_path: str) -> str:
+        """
+        Export records to the file format as they are consumed.
+        
+        Args:
+            records: Dictionaries containing structured data
+            output_path: Directory path where the output file will be saved
+            
+        Returns:
+            Path to the created file, or an empty string on error
+        """
+        self.open(output_path)
+        self.write(records)
+        return self.close()
+    
+    def open(self, output_path: str) -> None:
+        """
+        Prepare the export of records in batches.
+        
+        Column types come from the 'type' of the output structure fields ('str',
+        'int', 'float', 'bool', 'date' or 'datetime'). Fields without a type
+        take the type of their values in the first batch, widened when a later
+        batch holds values of another type (see _common_type).
+        
+        Args:
+            output_path: Directory path where the output file will be saved
+        """
+        self.file_name = os.path.join(output_path, self.FILE_NAME)
+        self.batch_size = self.config.get(self.BATCH_SIZE_KEY, self.DEFAULT_BATCH_SIZE)
+        self.compression = self.config.get('compression', self.DEFAULT_COMPRESSION)
+        
+        # Get ordered list of fields and their configured types
+        self.ordered_fields = [item.get('field') for item in self.output_structure if 'field' in item]
+        self.field_types = {
+            item.get('field'): item.get('type')
+            for item in self.output_structure if 'field' in item
+        }
+        
+        self.writer = None
+        self.schema = None
+        self.pending = []
+        self.failed = False
+        
+        # Fields without a configured type whose values written so far are all missing
+        self.null_fields = set()
+        
+        try:
+            if pa is None:
+                raise ImportError(f"{self.FORMAT_NAME} export requires the 'pyarrow' package")
+            
+            # Check the configured types before any record is read
+            for value_type in self.field_types.values():
+                self._arrow_type(value_type)
+        except Exception as e:
+            self._fail(e)
+    
+    def write(self, records: Iterable[Dict[str, Any]]) -> None:
+        """
+        Add a batch of records, writing them out every batch_size records.
+        
+        Args:
+            records: Dictionaries containing structured data
+        """
+        if self.failed:
+            return
+        
+        try:
+            for record in records:
+                self.pending.append(record)
+                if len(self.pending) >= self.batch_size:
+                    self._flush()
+        except Exception as e:
+            self._fail(e)
+    
+    def close(self) -> str:
+        """
+        Write the remaining records and close the file.
+        
+        Returns:
+            Path to the created file, or an empty string on error
+        """
+        if self.failed:
+            return ""
+        
+        try:
+            if self.pending or self.writer is None:
+                self._flush()
+            self.writer.close()
+        except Exception as e:
+            self._fail(e)
+            return ""
+        
+        self.writer = None
+        return self.file_name
+    
+    def _flush(self) -> None:
+        """Convert the pending records to typed columns and write them."""
+        records, self.pending = self.pending, []
+        
+        # If no structure defined, use all fields from first record
+        if not self.ordered_fields and records:
+            self.ordered_fields = list(records[0].keys())
+        
+        # Fields without a configured type are inferred again for every batch and
+        # converted to the schema written so far, or widen it
+        arrays = []
+        for field in self.ordered_fields:
+            arrow_type = self._arrow_type(self.field_types.get(field))
+            arrays.append(self._column_array([record.get(field) for record in records], arrow_type))
+        
+        if self.schema is None:
+            # Columns without any value to infer a type from are strings
+            self.schema = pa.schema([
+                pa.field(field, pa.string() if pa.types.is_null(array.type) else array.type)
+                for field, array in zip(self.ordered_fields, arrays)
+            ])
+            self.null_fields = {
+                field for field, array in zip(self.ordered_fields, arrays)
+                if self.field_types.get(field) is None
+            }
+            self.writer = self._new_writer(self.schema, self.file_name)
+        else:
+            schema = pa.schema([
+                pa.field(field.name, self._common_type(field, array))
+                for field, array in zip(self.schema, arrays)
+            ])
+            if not schema.equals(self.schema):
+                self._rewrite(schema)
+        
+        self.null_fields = {
+            field for field, array in zip(self.ordered_fields, arrays)
+            if field in self.null_fields and array.null_count == len(array)
+        }
+        
+        table = pa.Table.from_arrays(
+            [array.cast(field.type) for array, field in zip(arrays, self.schema)],
+            schema=self.schema
+        )
+        self._write_table(table)
+    
+    def _common_type(self, field: 'pa.Field', array: 'pa.Array') -> 'pa.DataType':
+        """
+        Get the type of a column that can hold both the values written so far and those of a new batch.
+        
+        Columns with a configured type keep it. Columns of missing values only take
+        the type of the new values, integer columns become floating point columns
+        for floating point values, and columns whose type cannot hold the new
+        values become string columns, as values of mixed types within a batch do.
+        
+        Args:
+            field: Column of the schema written so far
+            array: Values of the column in the new batch
+            
+        Returns:
+            Arrow data type of the column
+        """
+        if self.field_types.get(field.name) is not None or pa.types.is_null(array.type):
+            return field.type
+        
+        if field.name in self.null_fields and array.null_count < len(array):
+            return array.type
+        
+        if pa.types.is_integer(field.type) and pa.types.is_floating(array.type):
+            return pa.float64()
+        
+        try:
+            array.cast(field.type)
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+            return pa.string()
+        return field.type
+    
+    def _rewrite(self, schema: 'pa.Schema') -> None:
+        """
+        Convert the records written so far to a wider schema and continue writing with it.
+        
+        The file is written again through a temporary file. This happens at most a
+        few times per column, as each conversion widens the type of a column.
+        
+        Args:
+            schema: New schema of the exported columns
+        """
+        self.writer.close()
+        self.writer = None
+        
+        temp_name = self.file_name + '.tmp'
+        try:
+            self.writer = self._new_writer(schema, temp_name)
+            for table in self._read_tables(self.file_name):
+                self._write_table(table.cast(schema))
+        except Exception:
+            if self.writer is not None:
+                self.writer.close()
+                self.writer = None
+            if os.path.exists(temp_name):
+                os.remove(temp_name)
+            raise
+        
+        os.replace(temp_name, self.file_name)
+        self.schema = schema
+    
+    def _new_writer(self, schema: 'pa.Schema', file_name: str) -> Any:
+        """
+        Create the writer of the output file.
+        
+        Args:
+            schema: Schema of the exported columns
+            file_name: Path of the file to write
+            
+        Returns:
+            Arrow IPC file writer
+        """
+        options = pa.ipc.IpcWriteOptions(compression=self.compression)
+        return pa.ipc.new_file(file_name, schema, options=options)
+    
+    def _write_table(self, table: 'pa.Table') -> None:
+        """Write a table of records as record batches."""
+        self.writer.write_table(table, max_chunksize=self.batch_size)
+    
+    def _read_tables(self, file_name: str) -> Iterable['pa.Table']:
+        """
+        Read back a written file a record batch at a time.
+        
+        Args:
+            file_name: Path of the file
+            
+        Yields:
+            Tables of the records of each record batch
+        """
+        with pa.memory_map(file_name) as source:
+            reader = pa.ipc.open_file(source)
+            for index in range(reader.num_record_batches):
+                yield pa.Table.from_batches([reader.get_batch(index)])
+    
+    def _fail(self, error: Exception) -> None:
+        """Report an export error and stop writing."""
+        print(f"Error exporting to {self.FORMAT_NAME}: {str(error)}")
+        
+        if self.writer is not None:
+            try:
+                self.writer.close()
+            except Exception:
+                pass
+        self.writer = None
+        self.pending = []
+        self.failed = True
+    
+    @staticmethod
+    def _arrow_type(value_type: Optional[str]) -> Optional['pa.DataType']:
+        """
+        Get the Arrow type of an output structure type.
+        
+        Args:
+            value_type: Output structure type, or None to infer it from the values
+            
+        Returns:
+            Arrow data type, or None if it is to be inferred
+            
+        Raises:
+            ValueError: If the type is not supported
+        """
+        if value_type is None:
+            return None
+        
+        arrow_types = {
+            'str': pa.string(),
+            'int': pa.int64(),
+            'float': pa.float64(),
+            'bool': pa.bool_(),
+            'date': pa.date32(),
+            'datetime': pa.timestamp('us'),
+        }
+        if value_type not in arrow_types:
+            raise ValueError(f"Unsupported output type: {value_type}")
+        
+        return arrow_types[value_type]
+    
+    @staticmethod
+    def _column_array(values: List[Any], arrow_type: Optional['pa.DataType']) -> 'pa.Array':
+        """
+        Convert the values of a column to an Arrow array.
+        
+        Args:
+            values: Column values; None and NaN are missing values
+            arrow_type: Type of the column, or None to infer it
+            
+        Returns:
+            Arrow array of the values
+            
+        Raises:
+            pyarrow.ArrowInvalid: If the values cannot be converted to the type
+        """
+        try:
+            array = pa.array(values, from_pandas=True)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            # Values of mixed types, such as 12 and '13', are converted from their text
+            array = pa.array(
+                [None if value is None or value != value else str(value) for value in values],
+                type=pa.string()
+            )
+        
+        # Values are only converted when no information is lost, e.g. '12' or 12.0 to int but not 12.5
+        if arrow_type is not None and array.type != arrow_type:
+            array = array.cast(arrow_type)
+        
+        return array
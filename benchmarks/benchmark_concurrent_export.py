@@ -0,0 +1,68 @@
+"""
+Benchmark for concurrent multi-format export.
+Compares export_stream running the exporters one after another against running them concurrently.
+"""
+import os
+import sys
+import time
+import tempfile
+from typing import Dict, List, Any
+
+# Add the parent directory to sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.pipeline import available_cpus, export_stream, export_concurrently, create_exporters
+
+
+OUTPUT_CONFIG = {
+    'structure': [
+        {'field': 'customer_name', 'display_name': 'Customer Name'},
+        {'field': 'order_id', 'display_name': 'Order ID'},
+        {'field': 'total_amount', 'display_name': 'Total Amount'},
+    ]
+}
+
+FORMATS = ['excel', 'word', 'text']
+
+
+def make_records(count: int) -> List[Dict[str, Any]]:
+    """Build synthetic structured order records."""
+    return [
+        {'customer_name': f'Customer {i % 1000}', 'order_id': f'ORD{i:08d}', 'total_amount': f'${i * 1.5:.2f}'}
+        for i in range(count)
+    ]
+
+
+def timed(func, *args, **kwargs) -> float:
+    """Run a function once and return the elapsed wall time in seconds."""
+    start = time.perf_counter()
+    func(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+def main(sizes: List[int]):
+    """Print the time of each exporter alone, and of all of them sequentially and concurrently."""
+    print(f"CPUs available: {available_cpus()}")
+    print(f"{'rows':>10} " + ' '.join(f"{name + ' (s)':>10}" for name in FORMATS)
+          + f" {'sequential':>11} {'concurrent':>11} {'speedup':>8}")
+    
+    with tempfile.TemporaryDirectory() as output_dir:
+        for rows in sizes:
+            records = make_records(rows)
+            
+            alone = [
+                timed(export_stream, records, output_dir, [name], OUTPUT_CONFIG, {})
+                for name in FORMATS
+            ]
+            sequential = timed(export_stream, records, output_dir, FORMATS, OUTPUT_CONFIG, {})
+            # Called directly, as export_stream only exports concurrently with more than one CPU
+            exporters = create_exporters(FORMATS, OUTPUT_CONFIG, {})
+            concurrent = timed(export_concurrently, records, output_dir, exporters, output_config=OUTPUT_CONFIG)
+            
+            print(f"{rows:>10} " + ' '.join(f"{seconds:>10.2f}" for seconds in alone)
+                  + f" {sequential:>11.2f} {concurrent:>11.2f} {sequential / concurrent:>7.1f}x")
+
+
+if __name__ == '__main__':
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10_000, 100_000]
+    main(sizes)
@@ -0,0 +1,101 @@
+"""
+Benchmark for the DataProcessor.
+Compares DataProcessor.process() and the columnar process_frame() against the original per-record loop.
+"""
+import io
+import os
+import sys
+import time
+import contextlib
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Any
+
+# Add the parent directory to sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.utils.data_processor import DataProcessor
+
+
+STRUCTURE = [
+    {'field': 'customer_name', 'display_name': 'Customer Name', 'required': True},
+    {'field': 'order_id', 'display_name': 'Order ID', 'required': True},
+    {'field': 'quantity', 'display_name': 'Quantity'},
+    {'field': 'total_amount', 'display_name': 'Total Amount', 'format': '${:.2f}', 'required': True},
+]
+
+
+def make_records(count: int) -> List[Dict[str, Any]]:
+    """Build synthetic order records; every tenth record lacks its total amount."""
+    rng = np.random.default_rng(0)
+    amounts = (rng.random(count) * 1000).tolist()
+    records = []
+    for i in range(count):
+        record = {'customer_name': f'Customer {i % 1000}', 'order_id': f'ORD{i:08d}', 'quantity': i % 20}
+        if i % 10:
+            record['total_amount'] = amounts[i]
+        records.append(record)
+    return records
+
+
+def process_rows(data: List[Dict[str, Any]], structure: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """The original per-record processing loop, kept here as the baseline."""
+    structured_data = []
+    for record in data:
+        structured_record = {}
+        for field_config in structure:
+            field_name = field_config.get('field')
+            if not field_name:
+                continue
+            
+            required = field_config.get('required', False)
+            if required and field_name not in record:
+                print(f"Warning: Required field '{field_name}' is missing in record")
+                continue
+            
+            if field_name in record:
+                value = record[field_name]
+                format_str = field_config.get('format')
+                if format_str and isinstance(value, (int, float)):
+                    try:
+                        value = format_str.format(value)
+                    except Exception as e:
+                        print(f"Error formatting value: {str(e)}")
+                structured_record[field_name] = value
+        if structured_record:
+            structured_data.append(structured_record)
+    return structured_data
+
+
+def timed(func, *args):
+    """Run a function once with its output silenced and return its result and wall time in seconds."""
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main(sizes: List[int]):
+    """Print row-path, process() and process_frame() timings for each number of records."""
+    processor = DataProcessor({'structure': STRUCTURE})
+    
+    print(f"{'records':>10} {'rows (s)':>10} {'process (s)':>11} {'frame rows (s)':>14} {'frame (s)':>10} "
+          f"{'speedup':>8} {'identical':>10}")
+    for count in sizes:
+        data = make_records(count)
+        frame = pd.DataFrame(data).dropna()
+        frame_records = frame.to_dict('records')
+        
+        expected, row_time = timed(process_rows, data, STRUCTURE)
+        result, record_time = timed(processor.process, data)
+        expected_frame, frame_row_time = timed(process_rows, frame_records, STRUCTURE)
+        frame_result, frame_time = timed(processor.process_frame, frame)
+        
+        identical = result == expected and frame_result.to_dict('records') == expected_frame
+        print(f"{count:>10} {row_time:>10.3f} {record_time:>11.3f} {frame_row_time:>14.3f} {frame_time:>10.3f} "
+              f"{frame_row_time / frame_time:>7.1f}x {str(identical):>10}")
+
+
+if __name__ == '__main__':
+    sizes = [int(arg) for arg in sys.argv[1:]] or [100_000, 1_000_000]
+    main(sizes)
@@ -0,0 +1,91 @@
+"""
+Benchmark for CLI startup time.
+Measures, in fresh interpreters, the cost of importing the modules the CLI needs and of a
+text-only extraction, against importing every parser and exporter up front.
+"""
+import os
+import sys
+import time
+import statistics
+import subprocess
+from typing import List, Tuple
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+# Modules whose import dominates startup when parsers and exporters are imported eagerly
+HEAVY_MODULES = ['pandas', 'numpy', 'openpyxl', 'docx', 'pyarrow']
+
+CLI_IMPORTS = """
+import src.config.config_handler
+import src.parser.parser_factory
+import src.parser.extraction_cache
+import src.utils.extraction_manifest
+import src.pipeline
+"""
+
+TEXT_RUN = CLI_IMPORTS + """
+import tempfile
+from src.pipeline import iter_extracted, iter_structured, export_stream
+with tempfile.TemporaryDirectory() as directory:
+    path = os.path.join(directory, 'order.txt')
+    with open(path, 'w') as file:
+        file.write('Customer Name: John Smith\\nOrder ID: ORD1\\n')
+    config = {'text_patterns': [
+        {'name': 'customer_name', 'pattern': 'Customer Name: (.*)', 'group': 1},
+        {'name': 'order_id', 'pattern': 'Order ID: (.*)', 'group': 1},
+    ]}
+    output_config = {'structure': [{'field': 'customer_name'}, {'field': 'order_id'}]}
+    records = iter_structured(iter_extracted([path], config), output_config)
+    _, count = export_stream(records, directory, ['text'], output_config, {})
+    assert count == 1
+"""
+
+EAGER_IMPORTS = CLI_IMPORTS + """
+import src.parser.text_parser, src.parser.excel_parser, src.parser.csv_parser, src.parser.word_parser
+import src.utils.data_processor
+import src.exporters.excel_exporter, src.exporters.word_exporter, src.exporters.text_exporter
+import src.exporters.parquet_exporter, src.exporters.arrow_exporter
+"""
+
+REPORT = """
+import sys
+print(','.join(name for name in %r if name in sys.modules))
+""" % HEAVY_MODULES
+
+SCENARIOS = [
+    ('cli imports', CLI_IMPORTS),
+    ('text-only run', TEXT_RUN),
+    ('eager imports', EAGER_IMPORTS),
+]
+
+
+def run(code: str) -> Tuple[float, str]:
+    """Run code in a fresh interpreter from the repository root; return its wall time and output."""
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, '-c', 'import os\n' + code + REPORT],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    seconds = time.perf_counter() - start
+    
+    # The last line lists the heavy modules that were imported
+    lines = result.stdout.splitlines()
+    return seconds, lines[-1] if lines else ''
+
+
+def main(repeat: int):
+    """Print the median startup time of each scenario, net of an empty interpreter, and the heavy modules it loaded."""
+    baseline = statistics.median(run('')[0] for _ in range(repeat))
+    print(f"Empty interpreter: {baseline * 1000:.0f} ms (subtracted below), median of {repeat} runs")
+    print(f"{'scenario':<15} {'time (ms)':>10}  heavy modules imported")
+    
+    for name, code in SCENARIOS:
+        times: List[float] = []
+        for _ in range(repeat):
+            seconds, modules = run(code)
+            times.append(seconds)
+        print(f"{name:<15} {(statistics.median(times) - baseline) * 1000:>10.0f}  {modules or '-'}")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
@@ -0,0 +1,75 @@
+"""
+Benchmark for text pattern matching.
+Compares the single-pass PatternMatcher against running re.finditer once per pattern.
+"""
+import os
+import re
+import sys
+import time
+from typing import Dict, List, Any
+
+# Add the parent directory to sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.parser.pattern_matcher import PatternMatcher
+
+
+def make_patterns(count: int) -> List[Dict[str, Any]]:
+    """Build a list of labelled text pattern configurations."""
+    return [
+        {'name': f'field_{i}', 'pattern': f'Field {i:03d}: (\\d+)', 'type': 'int'}
+        for i in range(count)
+    ]
+
+
+def make_log(lines: int, fields: int) -> str:
+    """Build a log where every line carries one of the labelled fields."""
+    return '\n'.join(
+        f'2025-04-01 12:00:00 INFO worker-{i % 7} Field {i % fields:03d}: {i}'
+        for i in range(lines)
+    )
+
+
+def match_per_pattern(patterns: List[Dict[str, Any]], content: str) -> Dict[str, Any]:
+    """The original extraction loop, scanning the content once per pattern."""
+    record = {}
+    for pattern_config in patterns:
+        for match in re.finditer(pattern_config['pattern'], content):
+            record[pattern_config['name']] = int(match.group(1))
+    return record
+
+
+def match_single_pass(matcher: PatternMatcher, content: str) -> Dict[str, Any]:
+    """Extraction with a precompiled, merged PatternMatcher."""
+    record = {}
+    for name, value in matcher.iter_matches(content):
+        record[name] = value
+    return record
+
+
+def timed(func, *args) -> float:
+    """Run a function once and return the elapsed wall time in seconds."""
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def main(pattern_counts: List[int], lines: int = 200_000):
+    """Print per-pattern and single-pass timings for each pattern count."""
+    print(f"{'patterns':>9} {'log size':>10} {'per-pattern (s)':>16} {'single-pass (s)':>16} {'speedup':>8}")
+    for count in pattern_counts:
+        patterns = make_patterns(count)
+        content = make_log(lines, count)
+        matcher = PatternMatcher(patterns, single_pass=True)
+        
+        assert match_per_pattern(patterns, content) == match_single_pass(matcher, content)
+        
+        per_pattern = timed(match_per_pattern, patterns, content)
+        single_pass = timed(match_single_pass, matcher, content)
+        size = f'{len(content) / 1e6:.1f} MB'
+        print(f"{count:>9} {size:>10} {per_pattern:>16.3f} {single_pass:>16.3f} {per_pattern / single_pass:>7.1f}x")
+
+
+if __name__ == '__main__':
+    counts = [int(arg) for arg in sys.argv[1:]] or [10, 50, 100]
+    main(counts)
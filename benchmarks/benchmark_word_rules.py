@@ -0,0 +1,85 @@
+"""
+Benchmark for Word extraction rule matching.
+Compares the RuleIndex-based WordParser against testing every rule on every paragraph.
+"""
+import os
+import sys
+import time
+import random
+from typing import Dict, List, Any
+
+# Add the parent directory to sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.parser.word_parser import WordParser
+
+
+WORDS = ['contract', 'party', 'agreement', 'clause', 'term', 'payment', 'notice', 'delivery']
+
+
+def make_rules(count: int) -> List[Dict[str, Any]]:
+    """Build a list of Word extraction rules with distinct markers."""
+    return [
+        {'name': f'field_{i}', 'paragraph_contains': f'Field {i}:', 'extract_after': f'Field {i}:'}
+        for i in range(count)
+    ]
+
+
+def make_paragraphs(count: int, rules: int) -> List[str]:
+    """Build contract-like paragraphs, one in ten carrying a rule marker."""
+    rng = random.Random(0)
+    paragraphs = []
+    for i in range(count):
+        text = ' '.join(rng.choice(WORDS) for _ in range(12))
+        if i % 10 == 0:
+            text += f' Field {i % rules}: value {i}'
+        paragraphs.append(text)
+    return paragraphs
+
+
+def extract_naive(rules: List[Dict[str, Any]], paragraphs: List[str]) -> Dict[str, Any]:
+    """The original extraction loop, testing every rule against every paragraph."""
+    record = {}
+    for text in paragraphs:
+        text = text.strip()
+        if not text:
+            continue
+        for rule in rules:
+            if rule['paragraph_contains'] in text:
+                parts = text.split(rule['extract_after'], 1)
+                if len(parts) > 1:
+                    record[rule['name']] = parts[1].strip()
+    return record
+
+
+def extract_indexed(parser: WordParser, paragraphs: List[str]) -> Dict[str, Any]:
+    """Extract the paragraph record the way WordParser.parse does, with the document body already read."""
+    record, _ = parser._extract_body(('paragraph', text) for text in paragraphs)
+    return record
+
+
+def timed(func, *args) -> float:
+    """Run a function once and return the elapsed wall time in seconds."""
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def main(rule_counts: List[int], paragraph_count: int = 20_000):
+    """Print naive and indexed timings for each rule count."""
+    print(f"{'rules':>6} {'paragraphs':>11} {'naive (s)':>10} {'indexed (s)':>12} {'speedup':>8}")
+    for count in rule_counts:
+        rules = make_rules(count)
+        paragraphs = make_paragraphs(paragraph_count, count)
+        parser = WordParser({'word_extraction': rules})
+        
+        assert extract_naive(rules, paragraphs) == extract_indexed(parser, paragraphs)
+        
+        naive = timed(extract_naive, rules, paragraphs)
+        indexed = timed(extract_indexed, parser, paragraphs)
+        print(f"{count:>6} {paragraph_count:>11} {naive:>10.3f} {indexed:>12.3f} {naive / indexed:>7.1f}x")
+
+
+if __name__ == '__main__':
+    counts = [int(arg) for arg in sys.argv[1:]] or [10, 100, 500, 1000]
+    main(counts)
@@ -0,0 +1,190 @@
+"""
+Column mapper module.
+Applies Excel/CSV column mappings to whole DataFrame columns instead of row by row.
+"""
+import pandas as pd
+from typing import Callable, Dict, List, Any, Optional, Sequence, Tuple
+
+
+def make_caster(value_type: str) -> Callable[[pd.Series], pd.Series]:
+    """
+    Get the function converting a column to the specified type, leaving missing values untouched.
+    
+    Args:
+        value_type: Target type ('int', 'float' or 'str')
+        
+    Returns:
+        Function converting a column
+    """
+    if value_type not in ('int', 'float'):
+        return lambda column: column
+    
+    dtype = 'int64' if value_type == 'int' else 'float64'
+    
+    def cast(column: pd.Series) -> pd.Series:
+        # NaN is already a float, so numeric columns can be cast in one step
+        if value_type == 'float' and pd.api.types.is_numeric_dtype(column):
+            return column.astype(dtype)
+        
+        missing = column.isna()
+        if not missing.any():
+            return column.astype(dtype)
+        
+        # Columns with gaps are cast around the gaps, which keep their original value
+        converted = column[~missing].astype(dtype).astype(object)
+        return converted.reindex(column.index).where(~missing, column)
+    
+    return cast
+
+
+class MappingPlan:
+    """Column mappings resolved against one header: column positions and casters."""
+    
+    def __init__(self, header: Tuple[Any, ...], mappings: List[Dict[str, Any]]):
+        """
+        Resolve the mappings against a header.
+        
+        Args:
+            header: Column names, in column order
+            mappings: Complete column mapping configurations
+        """
+        positions = {}
+        for position, name in enumerate(header):
+            # Keep the first of several columns sharing a header
+            if name not in positions:
+                positions[name] = position
+        
+        self.header = header
+        
+        # Target field, source column position and caster of every resolved mapping
+        self.fields = []
+        
+        # Source columns of the mappings that are not in the header
+        self.missing = []
+        
+        for mapping in mappings:
+            source_column = mapping['source_column']
+            if source_column in positions:
+                self.fields.append((
+                    mapping['target_field'],
+                    positions[source_column],
+                    make_caster(mapping.get('type', 'str'))
+                ))
+            elif source_column not in self.missing:
+                self.missing.append(source_column)
+        
+        # Positions of the columns that have to be read
+        self.positions = sorted({position for _, position, _ in self.fields})
+    
+    def map_columns(self, columns: Dict[int, pd.Series], index: Optional[pd.Index] = None) -> pd.DataFrame:
+        """
+        Rename and cast the mapped columns.
+        
+        Args:
+            columns: Source columns keyed by their position in the header
+            index: Index of the resulting DataFrame
+            
+        Returns:
+            DataFrame whose columns are the target fields
+        """
+        return pd.DataFrame(
+            {target_field: cast(columns[position]) for target_field, position, cast in self.fields},
+            index=index
+        )
+    
+    def map_frame(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Select, rename and cast the mapped columns of a DataFrame laid out like the header.
+        
+        Args:
+            df: DataFrame read from the source file
+            
+        Returns:
+            DataFrame whose columns are the target fields
+        """
+        return self.map_columns({position: df.iloc[:, position] for position in self.positions}, df.index)
+
+
+class ColumnMapper:
+    """Columnar engine for applying 'excel_mappings' to a DataFrame."""
+    
+    # Number of mapping plans kept for reuse across files
+    MAX_PLANS = 64
+    
+    def __init__(self, mappings: List[Dict[str, Any]]):
+        """
+        Initialize the column mapper with mapping configurations.
+        
+        Args:
+            mappings: List of Excel/CSV column mapping configurations
+        """
+        # Drop incomplete mappings once instead of re-checking them for every row
+        self.mappings = [
+            mapping for mapping in mappings
+            if mapping.get('source_column') and mapping.get('target_field')
+        ]
+        
+        # Mapping plans keyed by header, so files sharing a header resolve it once
+        self._plans = {}
+    
+    @property
+    def source_columns(self) -> List[str]:
+        """Get the distinct source columns referenced by the mappings, in order."""
+        return list(dict.fromkeys(mapping['source_column'] for mapping in self.mappings))
+    
+    def plan(self, header: Sequence[Any], source: Optional[str] = None) -> MappingPlan:
+        """
+        Get the mapping plan for a header.
+        
+        When a source is given and the header holds some but not all mapped
+        columns, the missing columns are reported for that source.
+        
+        Args:
+            header: Column names, in column order
+            source: Description of where the header was read, for the report
+            
+        Returns:
+            Mapping plan resolved against the header
+        """
+        header = tuple(header)
+        
+        plan = self._plans.get(header)
+        if plan is None:
+            if len(self._plans) >= self.MAX_PLANS:
+                # Drop the oldest plan, unless another thread sharing the parser already did
+                self._plans.pop(next(iter(self._plans), None), None)
+            plan = self._plans[header] = MappingPlan(header, self.mappings)
+        
+        if source is not None and plan.fields and plan.missing:
+            missing = ', '.join(f"'{column}'" for column in plan.missing)
+            print(f"Mapped columns not found in {source}: {missing}")
+        
+        return plan
+    
+    def map_frame(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Select, rename and cast the mapped columns of a DataFrame.
+        
+        Args:
+            df: DataFrame read from the source file
+            
+        Returns:
+            DataFrame whose columns are the target fields
+        """
+        return self.plan(df.columns).map_frame(df)
+    
+    def to_records(self, frame: pd.DataFrame) -> List[Dict[str, Any]]:
+        """
+        Convert a mapped DataFrame into a list of record dictionaries.
+        
+        Args:
+            frame: DataFrame returned by map_frame
+            
+        Returns:
+            List of dictionaries containing extracted data
+        """
+        # A frame without mapped columns yields no data, as the row path did
+        if frame.columns.empty:
+            return []
+        
+        return frame.to_dict('records')
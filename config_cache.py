@@ -0,0 +1,104 @@
+"""
+Configuration cache module.
+Keeps loaded configurations, and the parsers created for them, keyed by file content.
+"""
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional
+
+from .config_handler import ConfigHandler
+from ..parser.parser_factory import ParserFactory
+from ..parser.extraction_cache import ExtractionCache
+
+
+class CachedConfig:
+    """Configuration loaded from a file, with the parser instances created for it."""
+    
+    def __init__(self, handler: ConfigHandler):
+        """
+        Initialize the cached configuration.
+        
+        Args:
+            handler: Configuration handler holding the validated configuration
+        """
+        self.handler = handler
+        
+        # Parser instances by class, shared by all parser factories of this configuration
+        self.parsers = {}
+    
+    def parser_factory(
+        self,
+        cache: Optional[ExtractionCache] = None,
+        content_hashes: Optional[Dict[str, str]] = None
+    ) -> ParserFactory:
+        """
+        Create a parser factory that reuses the parsers of this configuration.
+        
+        Args:
+            cache: Extraction cache used to skip files parsed before, if any
+            content_hashes: SHA-256 digests of file contents by path, if known
+            
+        Returns:
+            Parser factory for the input configuration
+        """
+        return ParserFactory(self.handler.get_input_config(), cache, content_hashes, self.parsers)
+
+
+class ConfigCache:
+    """Bounded LRU cache of loaded configurations, keyed by the hash of the configuration file."""
+    
+    def __init__(self, max_entries: int = 32):
+        """
+        Initialize the configuration cache.
+        
+        Args:
+            max_entries: Maximum number of configurations kept
+        """
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def load(self, config_path: str, content_hash: Optional[str] = None) -> CachedConfig:
+        """
+        Get the configuration of a file, loading it unless the same content was loaded before.
+        
+        Configurations are shared between callers and must not be modified.
+        
+        Args:
+            config_path: Path to the configuration file
+            content_hash: SHA-256 digest of the file content if already known,
+                in which case the file is only read on a miss
+                
+        Returns:
+            Cached configuration
+            
+        Raises:
+            ValueError: If the configuration file cannot be loaded or is invalid
+        """
+        if content_hash is None:
+            try:
+                with open(config_path, 'rb') as file:
+                    content_hash = hashlib.sha256(file.read()).hexdigest()
+            except OSError as e:
+                raise ValueError(f"Error loading configuration file: {str(e)}")
+        
+        with self._lock:
+            entry = self._entries.get(content_hash)
+            if entry is not None:
+                self._entries.move_to_end(content_hash)
+                return entry
+        
+        # Invalid configurations raise here and are not cached
+        handler = ConfigHandler()
+        handler.load_config(config_path)
+        entry = CachedConfig(handler)
+        
+        with self._lock:
+            # Keep the entry of another thread that loaded the same file meanwhile
+            entry = self._entries.setdefault(content_hash, entry)
+            self._entries.move_to_end(content_hash)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        
+        return entry
@@ -53,13 +53,28 @@ class ConfigHandler:
         
         # Validate input section
         input_config = self.config['input']
-        if not any(key in input_config for key in ['text_patterns', 'excel_mappings', 'word_extraction']):
-            raise ValueError("Input section must contain at least one of: 'text_patterns', 'excel_mappings', 'word_extraction'")
+        if not any(key in input_config for key in ['text_patterns', 'excel_mappings', 'word_extraction', 'word_tables']):
+            raise ValueError("Input section must contain at least one of: 'text_patterns', 'excel_mappings', 'word_extraction', 'word_tables'")
+        
+        for key in ['csv_chunk_size', 'excel_chunk_size']:
+            chunk_size = input_config.get(key)
+            if chunk_size is not None and (not isinstance(chunk_size, int) or chunk_size <= 0):
+                raise ValueError(f"'{key}' must be a positive integer")
+        
+        sheets = input_config.get('excel_sheets')
+        if sheets is not None and (not isinstance(sheets, list) or not all(isinstance(name, str) for name in sheets)):
+            raise ValueError("'excel_sheets' must be a list of sheet names")
         
         # Validate output structure
         output_config = self.config['output']
         if 'structure' not in output_config or not output_config['structure']:
             raise ValueError("Output section must contain a non-empty 'structure' list")
+        
+        # Validate export settings; the text export writes its rows with the csv module
+        text_config = (self.config['export'] or {}).get('text') or {}
+        delimiter = text_config.get('delimiter', '|')
+        if not isinstance(delimiter, str) or len(delimiter) != 1:
+            raise ValueError(f"Text export 'delimiter' must be a single character, got {delimiter!r}")
     
     def get_input_config(self) -> Dict[str, Any]:
         """Get the input configuration section."""
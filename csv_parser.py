@@ -3,12 +3,23 @@ Parser module for CSV files.
 Extracts data from CSV files based on column mappings defined in the configuration.
 """
 import pandas as pd
-from typing import Dict, List, Any
+from typing import Dict, Iterator, List, Any
+
+from .column_mapper import ColumnMapper
 
 
 class CSVParser:
     """Parser for extracting data from CSV files using column mappings."""
     
+    # Version of the records produced; bump it when parsing results change
+    VERSION = 1
+    
+    # Input configuration keys that affect the records produced
+    CONFIG_KEYS = ('excel_mappings',)
+    
+    # Number of rows read from the file at a time
+    DEFAULT_CHUNK_SIZE = 100000
+    
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize the CSV parser with configuration.
@@ -17,6 +28,8 @@ class CSVParser:
             config: Dictionary containing Excel/CSV mapping configurations
         """
         self.mappings = config.get('excel_mappings', [])  # Reuse Excel mappings for CSV
+        self.mapper = ColumnMapper(self.mappings)
+        self.chunk_size = config.get('csv_chunk_size', self.DEFAULT_CHUNK_SIZE)
     
     def parse(self, file_path: str) -> List[Dict[str, Any]]:
         """
@@ -31,36 +44,52 @@ class CSVParser:
         results = []
         
         try:
-            # Read CSV file
-            df = pd.read_csv(file_path)
-            
-            # Process each row
-            for _, row in df.iterrows():
-                record = {}
-                
-                for mapping in self.mappings:
-                    source_column = mapping.get('source_column')
-                    target_field = mapping.get('target_field')
-                    value_type = mapping.get('type', 'str')
-                    
-                    if not source_column or not target_field or source_column not in row:
-                        continue
-                    
-                    value = row[source_column]
-                    
-                    # Convert value to specified type
-                    if value_type == 'int' and pd.notna(value):
-                        value = int(value)
-                    elif value_type == 'float' and pd.notna(value):
-                        value = float(value)
-                    
-                    record[target_field] = value
-                
-                # If we found any data, add it to results
-                if record:
-                    results.append(record)
-                
+            results = list(self.iter_records(file_path))
         except Exception as e:
             print(f"Error parsing CSV file {file_path}: {str(e)}")
         
         return results
+    
+    def iter_records(self, file_path: str) -> Iterator[Dict[str, Any]]:
+        """
+        Stream records from a CSV file without holding the whole file in memory.
+        
+        Args:
+            file_path: Path to the CSV file
+            
+        Yields:
+            Dictionaries containing extracted data, one per row
+        """
+        for frame in self.iter_frames(file_path):
+            yield from self.mapper.to_records(frame)
+    
+    def iter_frames(self, file_path: str) -> Iterator[pd.DataFrame]:
+        """
+        Read a CSV file in chunks of at most chunk_size rows.
+        
+        The header is resolved into a mapping plan first, so only the mapped
+        source columns are read and each chunk is mapped by column position
+        before it is yielded.
+        
+        Args:
+            file_path: Path to the CSV file
+            
+        Yields:
+            DataFrames containing extracted data
+        """
+        header = pd.read_csv(file_path, nrows=0).columns
+        plan = self.mapper.plan(header, f"CSV file {file_path}")
+        if not plan.fields:
+            return
+        
+        reader = pd.read_csv(
+            file_path,
+            usecols=plan.positions,
+            chunksize=self.chunk_size
+        )
+        
+        with reader:
+            for chunk in reader:
+                # The chunk holds the used columns in file order, as listed by the plan
+                columns = {position: chunk.iloc[:, i] for i, position in enumerate(plan.positions)}
+                yield plan.map_columns(columns, chunk.index)
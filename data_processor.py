@@ -2,25 +2,50 @@
 Data processor module.
 Structures extracted data according to output configuration.
 """
-from typing import Dict, List, Any
+from collections import Counter
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Any
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 class DataProcessor:
     """Processor for structuring extracted data according to configuration."""
     
-    def __init__(self, config: Dict[str, Any]):
+    def __init__(self, config: Dict[str, Any], format_values: bool = True):
         """
         Initialize the data processor with configuration.
         
         Args:
             config: Dictionary containing output structure configuration
+            format_values: Whether structuring applies the format strings of the
+                fields; otherwise values are left as extracted, to be formatted
+                later with format_batch
         """
         self.structure = config.get('structure', [])
+        
+        # Field name, required flag and format string of each structure entry,
+        # read once instead of for every record
+        self.entries = [
+            (field_config['field'], field_config.get('required', False), field_config.get('format') if format_values else None)
+            for field_config in self.structure if field_config.get('field')
+        ]
+        
+        # Format string of each formatted field; a field listed twice takes its last entry, as in structuring
+        formats = {field_config['field']: field_config.get('format') for field_config in self.structure if field_config.get('field')}
+        self.formats = {field_name: format_str for field_name, format_str in formats.items() if format_str}
+        
+        # Number of missing required fields and formatting errors of the last run, per field
+        self.missing_counts = Counter()
+        self.format_errors = Counter()
     
     def process(self, data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         Process and structure the extracted data.
         
+        Missing required fields and formatting errors are counted and reported
+        once per field rather than once per record.
+        
         Args:
             data: List of dictionaries containing extracted data
             
@@ -30,38 +55,255 @@ class DataProcessor:
         if not self.structure or not data:
             return data
         
-        structured_data = []
+        return list(self.iter_process(data))
+    
+    def iter_process(self, records: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """
+        Structure records one at a time as they are consumed.
+        
+        The warning counts are reported once all records have been consumed.
         
-        for record in data:
-            structured_record = {}
+        Args:
+            records: Dictionaries containing extracted data
             
-            for field_config in self.structure:
-                field_name = field_config.get('field')
-                if not field_name:
-                    continue
-                
-                # Check if field is required but missing
-                required = field_config.get('required', False)
-                if required and field_name not in record:
-                    print(f"Warning: Required field '{field_name}' is missing in record")
-                    continue
-                
-                # Get value from record
-                if field_name in record:
-                    value = record[field_name]
-                    
-                    # Apply formatting if specified
-                    format_str = field_config.get('format')
-                    if format_str and isinstance(value, (int, float)):
-                        try:
-                            value = format_str.format(value)
-                        except Exception as e:
-                            print(f"Error formatting value: {str(e)}")
-                    
-                    structured_record[field_name] = value
+        Yields:
+            Dictionaries containing structured data
+        """
+        if not self.structure:
+            yield from records
+            return
+        
+        self._reset_counts()
+        
+        for record in records:
+            structured_record = self._structure_record(record)
             
             # Only add record if it has data
             if structured_record:
-                structured_data.append(structured_record)
+                yield structured_record
+        
+        self.report()
+    
+    def iter_process_chunks(self, chunks: Iterable[Any]) -> Iterator[Dict[str, Any]]:
+        """
+        Structure a stream of record chunks, each a DataFrame or an iterable of records.
+        
+        DataFrames (as read by the CSV and Excel parsers) are structured a column
+        at a time by the columnar path of process_frame, other chunks record by
+        record. The records yielded are the same as iter_process() over all
+        chunks' records, and the warning counts are reported once for the whole
+        stream once it has been consumed.
+        
+        Args:
+            chunks: DataFrames or iterables of dictionaries containing extracted data
+            
+        Yields:
+            Dictionaries containing structured data
+        """
+        self._reset_counts()
+        
+        for chunk in chunks:
+            if not hasattr(chunk, 'columns'):
+                if not self.structure:
+                    yield from chunk
+                    continue
+                
+                for record in chunk:
+                    structured_record = self._structure_record(record)
+                    if structured_record:
+                        yield structured_record
+                continue
+            
+            # A frame without columns holds no records, and one without output fields no data
+            if chunk.columns.empty:
+                continue
+            
+            frame = self._structure_frame(chunk) if self.structure else chunk
+            if not frame.columns.empty:
+                yield from frame.to_dict('records')
+        
+        self.report()
+    
+    def process_frame(self, frame: 'pd.DataFrame') -> 'pd.DataFrame':
+        """
+        Process and structure a batch of records held as DataFrame columns.
+        
+        The batch is processed a column at a time: every row holds every column,
+        so a missing required field is missing from all rows at once, and each
+        format string is applied down its whole column. The result is the same
+        as processing frame.to_dict('records') with process().
+        
+        Args:
+            frame: DataFrame containing extracted data, one row per record
+            
+        Returns:
+            DataFrame containing structured data, one column per output field
+        """
+        if not self.structure or frame.empty:
+            return frame
+        
+        self._reset_counts()
+        frame = self._structure_frame(frame)
+        self.report()
+        
+        return frame
+    
+    def _structure_record(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Structure one record, counting missing required fields and formatting errors.
+        
+        Args:
+            record: Dictionary containing extracted data
+            
+        Returns:
+            Dictionary containing structured data, empty if no output field is present
+        """
+        structured_record = {}
+        
+        for field_name, required, format_str in self.entries:
+            # Check if field is required but missing
+            if field_name not in record:
+                if required:
+                    self.missing_counts[field_name] += 1
+                continue
+            
+            value = record[field_name]
+            
+            # Apply formatting if specified; missing values (NaN) stay missing
+            if format_str and isinstance(value, (int, float)) and value == value:
+                value = self._format_value(field_name, format_str, value)
+            
+            structured_record[field_name] = value
+        
+        return structured_record
+    
+    def _structure_frame(self, frame: 'pd.DataFrame') -> 'pd.DataFrame':
+        """
+        Structure a DataFrame a column at a time, counting missing required fields and formatting errors.
+        
+        Args:
+            frame: DataFrame containing extracted data, one row per record
+            
+        Returns:
+            DataFrame containing structured data, without columns if no output field is present
+        """
+        # pandas is only imported by callers that hold DataFrames, keeping it out of record streaming
+        import pandas as pd
+        
+        columns = {}
+        
+        for field_name, required, format_str in self.entries:
+            if field_name not in frame.columns:
+                if required:
+                    self.missing_counts[field_name] += len(frame)
+                continue
+            
+            column = frame[field_name]
+            if format_str:
+                column = pd.Series(self._format_column(field_name, format_str, column), index=frame.index, dtype=object)
+            
+            # A field listed twice keeps its first position and its last value
+            columns[field_name] = column
+        
+        # Without any output field no record has data
+        if not columns:
+            return pd.DataFrame()
+        
+        return pd.DataFrame(columns, index=frame.index)
+    
+    def format_batch(self, records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Apply the format strings of the fields to records structured without formatting.
+        
+        The records are copied rather than changed, so that the values before
+        formatting remain available to exporters of typed columns. Formatting
+        errors are counted, to be reported by report().
+        
+        Args:
+            records: Dictionaries containing structured data
+            
+        Returns:
+            Dictionaries containing formatted structured data, or records itself
+            if no field has a format string
+        """
+        if not self.formats:
+            return records
+        
+        formatted = []
+        for record in records:
+            record = dict(record)
+            for field_name, format_str in self.formats.items():
+                value = record.get(field_name)
+                if isinstance(value, (int, float)) and value == value:
+                    record[field_name] = self._format_value(field_name, format_str, value)
+            formatted.append(record)
+        
+        return formatted
+    
+    def _format_column(self, field_name: str, format_str: str, column: 'pd.Series') -> List[Any]:
+        """
+        Apply a format string to the numeric values of a column.
+        
+        Args:
+            field_name: Output field name
+            format_str: Format string of the field
+            column: Values of the field
+            
+        Returns:
+            Formatted values
+        """
+        import numpy as np
+        
+        values = column.tolist()
+        format_value = format_str.format
+        
+        try:
+            # NumPy numeric columns only hold ints and floats, so no value needs checking;
+            # only float columns can hold missing values (NaN), which stay missing
+            if isinstance(column.dtype, np.dtype) and column.dtype.kind in 'iub':
+                return [format_value(value) for value in values]
+            if isinstance(column.dtype, np.dtype) and column.dtype.kind == 'f':
+                return [format_value(value) if value == value else value for value in values]
+            return [format_value(value) if isinstance(value, (int, float)) and value == value else value for value in values]
+        except Exception:
+            pass
+        
+        # Some values cannot be formatted, so format value by value and keep those as they are
+        return [
+            self._format_value(field_name, format_str, value) if isinstance(value, (int, float)) and value == value else value
+            for value in values
+        ]
+    
+    def _format_value(self, field_name: str, format_str: str, value: Any) -> Any:
+        """
+        Apply a format string to a value, keeping the value if it cannot be formatted.
+        
+        Args:
+            field_name: Output field name
+            format_str: Format string of the field
+            value: Value to format
+            
+        Returns:
+            Formatted value
+        """
+        try:
+            return format_str.format(value)
+        except Exception as e:
+            # Only the first error of each field is printed; the rest are counted
+            if not self.format_errors[field_name]:
+                print(f"Error formatting value of field '{field_name}': {str(e)}")
+            self.format_errors[field_name] += 1
+            return value
+    
+    def _reset_counts(self) -> None:
+        """Clear the warning counts of the previous run."""
+        self.missing_counts = Counter()
+        self.format_errors = Counter()
+    
+    def report(self) -> None:
+        """Print one warning per field for the missing required fields and formatting errors."""
+        for field_name, count in self.missing_counts.items():
+            print(f"Warning: Required field '{field_name}' is missing in {count} record(s)")
         
-        return structured_data
+        for field_name, count in self.format_errors.items():
+            print(f"Warning: {count} value(s) of field '{field_name}' could not be formatted")
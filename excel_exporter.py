@@ -4,12 +4,23 @@ Exports structured data to Excel format.
 """
 import os
 import pandas as pd
-from typing import Dict, List, Any
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.cell.cell import TIME_TYPES
+from openpyxl.compat.numbers import NUMERIC_TYPES
+from openpyxl.styles import PatternFill
+from typing import Dict, Iterable, List, Any, Optional
 
 
 class ExcelExporter:
     """Exporter for creating Excel files from structured data."""
     
+    # Maximum number of rows of an Excel worksheet
+    MAX_SHEET_ROWS = 1048576
+    
+    # Maximum length of an Excel worksheet name
+    MAX_SHEET_NAME_LENGTH = 31
+    
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize the Excel exporter with configuration.
@@ -19,6 +30,9 @@ class ExcelExporter:
         """
         self.config = config.get('excel', {})
         self.output_structure = config.get('structure', [])
+        
+        # Workbook being written, between open() and close()
+        self.workbook = None
     
     def export(self, data: List[Dict[str, Any]], output_path: str) -> str:
         """
@@ -31,64 +45,201 @@ class ExcelExporter:
         Returns:
             Path to the created Excel file
         """
+        return self.export_records(data, output_path)
+    
+    def export_records(self, records: Iterable[Dict[str, Any]], output_path: str) -> str:
+        """
+        Export records to Excel format as they are consumed.
+        
+        Args:
+            records: Dictionaries containing structured data
+            output_path: Directory path where the output file will be saved
+            
+        Returns:
+            Path to the created Excel file, or an empty string on error
+        """
+        self.open(output_path)
+        self.write(records)
+        return self.close()
+    
+    def open(self, output_path: str) -> None:
+        """
+        Start a write-only workbook whose rows are appended in batches.
+        
+        In write-only mode openpyxl streams rows to the file instead of keeping
+        a cell object for each of them, so memory use does not grow with the
+        number of rows.
+        
+        Args:
+            output_path: Directory path where the output file will be saved
+        """
+        # Get Excel-specific settings
+        self.sheet_name = self.config.get('sheet_name', 'Extracted Data')
+        self.include_header = self.config.get('include_header', True)
+        
+        # Create mapping of field names to display names
+        self.field_to_display = {
+            item.get('field'): item.get('display_name', item.get('field'))
+            for item in self.output_structure if 'field' in item
+        }
+        
+        # Get ordered list of fields
+        self.ordered_fields = [item.get('field') for item in self.output_structure if 'field' in item]
+        
+        # Create output file path
+        self.file_name = os.path.join(output_path, 'extracted_data.xlsx')
+        self.sheet = None
+        self.sheet_count = 0
+        self.sheet_rows = 0
+        
         try:
-            # Create DataFrame from data
-            df = pd.DataFrame(data)
+            # Header styling
+            header_color = self.config.get('style', {}).get('header_color')
+            self.header_fill = self._header_fill(header_color) if header_color else None
             
-            # Reorder and rename columns based on output structure
-            if self.output_structure:
-                # Create mapping of field names to display names
-                field_to_display = {
-                    item.get('field'): item.get('display_name', item.get('field'))
-                    for item in self.output_structure if 'field' in item
-                }
-                
-                # Get ordered list of fields
-                ordered_fields = [item.get('field') for item in self.output_structure if 'field' in item]
-                
-                # Filter to only include fields that exist in the data
-                ordered_fields = [field for field in ordered_fields if field in df.columns]
+            self.workbook = Workbook(write_only=True)
+        except Exception as e:
+            self._fail(e)
+    
+    def write(self, records: Iterable[Dict[str, Any]]) -> None:
+        """
+        Append a batch of records to the workbook.
+        
+        A new worksheet is started whenever the current one is full.
+        
+        Args:
+            records: Dictionaries containing structured data
+        """
+        if self.workbook is None:
+            return
+        
+        try:
+            for record in records:
+                if self.sheet is None:
+                    self._start(record)
                 
-                # Reorder columns
-                if ordered_fields:
-                    df = df[ordered_fields]
+                if self.sheet_rows == self.MAX_SHEET_ROWS:
+                    self._add_sheet()
                 
-                # Rename columns
-                df = df.rename(columns=field_to_display)
-            
-            # Get Excel-specific settings
-            sheet_name = self.config.get('sheet_name', 'Extracted Data')
-            include_header = self.config.get('include_header', True)
-            
-            # Create output file path
-            file_name = os.path.join(output_path, 'extracted_data.xlsx')
+                self.sheet.append([self._cell_value(record.get(field)) for field in self.ordered_fields])
+                self.sheet_rows += 1
+        except Exception as e:
+            self._fail(e)
+    
+    def close(self) -> str:
+        """
+        Finish and save the workbook.
+        
+        Returns:
+            Path to the created Excel file, or an empty string on error
+        """
+        if self.workbook is None:
+            return ""
+        
+        try:
+            if self.sheet is None:
+                self._start(None)
             
             # Export to Excel
-            with pd.ExcelWriter(file_name, engine='openpyxl') as writer:
-                df.to_excel(
-                    writer,
-                    sheet_name=sheet_name,
-                    index=False,
-                    header=include_header
-                )
-                
-                # Apply styling if specified
-                if include_header and 'style' in self.config:
-                    workbook = writer.book
-                    worksheet = writer.sheets[sheet_name]
-                    
-                    # Apply header styling
-                    header_color = self.config.get('style', {}).get('header_color')
-                    if header_color:
-                        # Note: This is a simplified version. In a real implementation,
-                        # we would use openpyxl's styling capabilities more extensively.
-                        for col in range(1, len(df.columns) + 1):
-                            cell = worksheet.cell(row=1, column=col)
-                            # This is a placeholder for actual styling
-                            # In a real implementation, we would set the fill color
-            
-            return file_name
-            
+            self.workbook.save(self.file_name)
         except Exception as e:
-            print(f"Error exporting to Excel: {str(e)}")
+            self._fail(e)
             return ""
+        
+        self.workbook = None
+        return self.file_name
+    
+    def _start(self, first_record: Optional[Dict[str, Any]]) -> None:
+        """
+        Add the first worksheet, once the first record (if any) is known.
+        
+        Args:
+            first_record: First record to be written, or None if there are none
+        """
+        # If no structure defined, use all fields from first record
+        if not self.ordered_fields and first_record:
+            self.ordered_fields = list(first_record.keys())
+        
+        self._add_sheet()
+    
+    def _add_sheet(self) -> None:
+        """Add a worksheet and write its header row if requested."""
+        self.sheet_count += 1
+        
+        # Sheets after the first are numbered, within Excel's sheet name length
+        title = self.sheet_name
+        if self.sheet_count > 1:
+            suffix = f" ({self.sheet_count})"
+            title = title[:self.MAX_SHEET_NAME_LENGTH - len(suffix)] + suffix
+        
+        self.sheet = self.workbook.create_sheet(title)
+        self.sheet_rows = 0
+        
+        # Write header if requested
+        if self.include_header:
+            header = []
+            for field in self.ordered_fields:
+                cell = WriteOnlyCell(self.sheet, value=self.field_to_display.get(field, field))
+                if self.header_fill is not None:
+                    cell.fill = self.header_fill
+                header.append(cell)
+            
+            self.sheet.append(header)
+            self.sheet_rows += 1
+    
+    def _fail(self, error: Exception) -> None:
+        """Report an export error and stop writing."""
+        print(f"Error exporting to Excel: {str(error)}")
+        
+        if self.workbook is not None:
+            self.workbook.close()
+        self.workbook = None
+    
+    @staticmethod
+    def _header_fill(color: Any) -> Optional[PatternFill]:
+        """
+        Build the solid fill of the header cells.
+        
+        Args:
+            color: Hexadecimal RGB color such as "#CCCCCC" or "#CCC", with or
+                without the leading "#", or an aRGB color such as "FFCCCCCC"
+            
+        Returns:
+            Pattern fill with the color, or None if the color is not valid, in
+            which case the headers are exported without a fill
+        """
+        value = str(color).strip().lstrip('#').upper()
+        
+        if len(value) == 3:
+            value = ''.join(digit * 2 for digit in value)
+        if len(value) == 6:
+            value = 'FF' + value
+        
+        if len(value) != 8 or any(digit not in '0123456789ABCDEF' for digit in value):
+            print(f"Warning: Ignoring invalid Excel header color {color!r}; expected a hexadecimal color such as \"#CCCCCC\"")
+            return None
+        
+        return PatternFill(fill_type='solid', start_color=value, end_color=value)
+    
+    @staticmethod
+    def _cell_value(value: Any) -> Any:
+        """
+        Convert a record value to a value openpyxl can write.
+        
+        Args:
+            value: Record value
+            
+        Returns:
+            The value, None for missing values, or its string form for other objects
+        """
+        if value is None or isinstance(value, str):
+            return value
+        
+        # Missing values are written as empty cells, as pandas does
+        if pd.api.types.is_scalar(value) and pd.isna(value):
+            return None
+        
+        if isinstance(value, NUMERIC_TYPES + TIME_TYPES):
+            return value
+        
+        return str(value)
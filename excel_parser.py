@@ -2,13 +2,29 @@
 Parser module for Excel files.
 Extracts data from Excel files based on column mappings defined in the configuration.
 """
+import os
+from functools import partial
+import openpyxl
 import pandas as pd
-from typing import Dict, List, Any
+import xlrd
+from openpyxl.cell.cell import TYPE_ERROR, TYPE_NUMERIC
+from typing import Callable, Dict, Iterator, List, Any, Tuple
+
+from .column_mapper import ColumnMapper, MappingPlan
 
 
 class ExcelParser:
     """Parser for extracting data from Excel files using column mappings."""
     
+    # Version of the records produced; bump it when parsing results change
+    VERSION = 1
+    
+    # Input configuration keys that affect the records produced
+    CONFIG_KEYS = ('excel_mappings', 'excel_sheets')
+    
+    # Number of rows mapped at a time
+    DEFAULT_CHUNK_SIZE = 100000
+    
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize the Excel parser with configuration.
@@ -17,6 +33,9 @@ class ExcelParser:
             config: Dictionary containing Excel mapping configurations
         """
         self.mappings = config.get('excel_mappings', [])
+        self.mapper = ColumnMapper(self.mappings)
+        self.sheets = config.get('excel_sheets')
+        self.chunk_size = config.get('excel_chunk_size', self.DEFAULT_CHUNK_SIZE)
     
     def parse(self, file_path: str) -> List[Dict[str, Any]]:
         """
@@ -31,36 +50,200 @@ class ExcelParser:
         results = []
         
         try:
-            # Read Excel file
-            df = pd.read_excel(file_path)
-            
-            # Process each row
-            for _, row in df.iterrows():
-                record = {}
-                
-                for mapping in self.mappings:
-                    source_column = mapping.get('source_column')
-                    target_field = mapping.get('target_field')
-                    value_type = mapping.get('type', 'str')
-                    
-                    if not source_column or not target_field or source_column not in row:
-                        continue
-                    
-                    value = row[source_column]
-                    
-                    # Convert value to specified type
-                    if value_type == 'int' and pd.notna(value):
-                        value = int(value)
-                    elif value_type == 'float' and pd.notna(value):
-                        value = float(value)
-                    
-                    record[target_field] = value
-                
-                # If we found any data, add it to results
-                if record:
-                    results.append(record)
-                
+            results = list(self.iter_records(file_path))
         except Exception as e:
             print(f"Error parsing Excel file {file_path}: {str(e)}")
         
         return results
+    
+    def iter_records(self, file_path: str) -> Iterator[Dict[str, Any]]:
+        """
+        Stream records from an Excel file without loading the whole workbook.
+        
+        Args:
+            file_path: Path to the Excel file
+            
+        Yields:
+            Dictionaries containing extracted data, one per row
+        """
+        for frame in self.iter_frames(file_path):
+            yield from self.mapper.to_records(frame)
+    
+    def iter_frames(self, file_path: str) -> Iterator[pd.DataFrame]:
+        """
+        Read the configured sheets of an Excel file in chunks of at most chunk_size rows.
+        
+        The workbook is read row by row (openpyxl read-only mode for .xlsx, xlrd
+        on-demand mode for .xls). Only the cells of mapped columns are converted,
+        and sheets without any mapped column are skipped after their header row.
+        
+        Args:
+            file_path: Path to the Excel file
+            
+        Yields:
+            DataFrames containing extracted data
+        """
+        _, ext = os.path.splitext(file_path.lower())
+        sheets = self._iter_xls_sheets(file_path) if ext == '.xls' else self._iter_xlsx_sheets(file_path)
+        
+        for name, rows, convert in sheets:
+            yield from self._iter_sheet_frames(rows, convert, f"sheet '{name}' of Excel file {file_path}")
+    
+    def _iter_sheet_frames(self, rows: Iterator[Tuple[Any, ...]], convert: Callable[[Any], Any], source: str) -> Iterator[pd.DataFrame]:
+        """
+        Map the rows of one sheet in chunks, using the mapping plan of its header row.
+        
+        Args:
+            rows: Rows of raw cells of the sheet
+            convert: Function converting a raw cell to its value
+            source: Description of the sheet, for reporting missing columns
+            
+        Yields:
+            DataFrames containing extracted data
+        """
+        # Like pandas, blank rows are skipped and the first other row is the header
+        header = next((row for row in rows if not self._is_blank(row)), None)
+        if header is None:
+            return
+        
+        plan = self.mapper.plan([convert(cell) for cell in header], source)
+        if not plan.fields:
+            return
+        
+        columns = {position: [] for position in plan.positions}
+        count = 0
+        
+        for row in rows:
+            if self._is_blank(row):
+                continue
+            
+            # Only the cells of mapped columns are converted
+            for position, values in columns.items():
+                values.append(convert(row[position]) if position < len(row) else None)
+            count += 1
+            
+            if count == self.chunk_size:
+                yield self._map_chunk(plan, columns)
+                columns = {position: [] for position in plan.positions}
+                count = 0
+        
+        if count:
+            yield self._map_chunk(plan, columns)
+    
+    @staticmethod
+    def _map_chunk(plan: MappingPlan, columns: Dict[int, List[Any]]) -> pd.DataFrame:
+        """Map a chunk of cell values, gathered by column position, to the target fields."""
+        return plan.map_columns({position: pd.Series(values) for position, values in columns.items()})
+    
+    def _iter_xlsx_sheets(self, file_path: str) -> Iterator[Tuple[str, Iterator[Tuple[Any, ...]], Callable[[Any], Any]]]:
+        """
+        Open an .xlsx workbook in read-only mode and get the rows of each configured sheet.
+        
+        Args:
+            file_path: Path to the Excel file
+            
+        Yields:
+            Tuples of the sheet name, a row iterator and the cell conversion function, one per sheet
+        """
+        workbook = openpyxl.load_workbook(file_path, read_only=True, data_only=True, keep_links=False)
+        
+        try:
+            for name in self._select_sheets(workbook.sheetnames, file_path):
+                sheet = workbook[name]
+                # Stored sheet dimensions may be wrong, so let openpyxl work them out
+                sheet.reset_dimensions()
+                yield name, sheet.iter_rows(), self._convert_xlsx_cell
+        finally:
+            workbook.close()
+    
+    def _iter_xls_sheets(self, file_path: str) -> Iterator[Tuple[str, Iterator[Tuple[Any, ...]], Callable[[Any], Any]]]:
+        """
+        Open an .xls workbook on demand and get the rows of each configured sheet.
+        
+        Args:
+            file_path: Path to the Excel file
+            
+        Yields:
+            Tuples of the sheet name, a row iterator and the cell conversion function, one per sheet
+        """
+        workbook = xlrd.open_workbook(file_path, on_demand=True)
+        convert = partial(self._convert_xls_cell, datemode=workbook.datemode)
+        
+        try:
+            for name in self._select_sheets(workbook.sheet_names(), file_path):
+                sheet = workbook.sheet_by_name(name)
+                yield name, (sheet.row(index) for index in range(sheet.nrows)), convert
+                workbook.unload_sheet(name)
+        finally:
+            workbook.release_resources()
+    
+    def _select_sheets(self, sheet_names: List[str], file_path: str) -> List[str]:
+        """
+        Get the names of the sheets to read.
+        
+        Args:
+            sheet_names: Names of the sheets in the workbook
+            file_path: Path to the Excel file
+            
+        Returns:
+            Configured sheet names present in the workbook, or all sheet names
+        """
+        if not self.sheets:
+            return sheet_names
+        
+        selected = []
+        for name in self.sheets:
+            if name in sheet_names:
+                selected.append(name)
+            else:
+                print(f"Sheet '{name}' not found in Excel file {file_path}")
+        
+        return selected
+    
+    @staticmethod
+    def _is_blank(row: Tuple[Any, ...]) -> bool:
+        """Check whether every cell of a row (openpyxl or xlrd) is empty."""
+        return all(cell.value is None or cell.value == '' for cell in row)
+    
+    @staticmethod
+    def _convert_xlsx_cell(cell: Any) -> Any:
+        """
+        Convert an openpyxl cell to a value the way pandas.read_excel does.
+        
+        Args:
+            cell: Read-only openpyxl cell
+            
+        Returns:
+            Cell value: None if empty, NaN for errors and int for integral numbers
+        """
+        if cell.value is None or cell.value == '':
+            return None
+        if cell.data_type == TYPE_ERROR:
+            return float('nan')
+        if cell.data_type == TYPE_NUMERIC and cell.value == int(cell.value):
+            return int(cell.value)
+        return cell.value
+    
+    @staticmethod
+    def _convert_xls_cell(cell: Any, datemode: int) -> Any:
+        """
+        Convert an xlrd cell to a value the way pandas.read_excel does.
+        
+        Args:
+            cell: xlrd cell
+            datemode: Date mode of the workbook
+            
+        Returns:
+            Cell value: None if empty, NaN for errors, datetime for dates and int for integral numbers
+        """
+        if cell.ctype in (xlrd.XL_CELL_EMPTY, xlrd.XL_CELL_BLANK) or cell.value == '':
+            return None
+        if cell.ctype == xlrd.XL_CELL_ERROR:
+            return float('nan')
+        if cell.ctype == xlrd.XL_CELL_BOOLEAN:
+            return bool(cell.value)
+        if cell.ctype == xlrd.XL_CELL_DATE:
+            return xlrd.xldate.xldate_as_datetime(cell.value, datemode)
+        if cell.ctype == xlrd.XL_CELL_NUMBER and cell.value == int(cell.value):
+            return int(cell.value)
+        return cell.value
@@ -0,0 +1,189 @@
+"""
+Extraction cache module.
+Stores parsed records on disk, keyed by file content and parser configuration.
+"""
+import os
+import json
+import pickle
+import zlib
+import hashlib
+import tempfile
+from typing import Dict, List, Any, Optional
+
+
+class ExtractionCache:
+    """On-disk cache of parsed records with a size limit and LRU eviction."""
+    
+    # Size of the blocks read when hashing file content
+    HASH_BLOCK_SIZE = 1024 * 1024
+    
+    def __init__(self, cache_dir: str, max_size: int = 1024 * 1024 * 1024):
+        """
+        Initialize the extraction cache.
+        
+        Args:
+            cache_dir: Directory where cache entries are stored
+            max_size: Maximum total size of the cache entries in bytes
+        """
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+        self._size = None
+        
+        os.makedirs(cache_dir, exist_ok=True)
+    
+    def make_key(
+        self,
+        file_path: str,
+        parser: object,
+        config: Dict[str, Any],
+        content_hash: Optional[str] = None
+    ) -> str:
+        """
+        Build the cache key of a file for a parser.
+        
+        The key covers the file content, the configuration keys the parser
+        reads and the parser version, so changing any of them misses the cache.
+        
+        Args:
+            file_path: Path to the file to parse
+            parser: Parser instance that will parse the file
+            config: Input configuration
+            content_hash: SHA-256 digest of the file content if already known,
+                e.g. computed while the file was uploaded
+            
+        Returns:
+            Hexadecimal cache key
+        """
+        if content_hash is None:
+            content_hash = self.hash_file(file_path)
+        
+        relevant_config = {key: config.get(key) for key in getattr(parser, 'CONFIG_KEYS', config.keys())}
+        config_hash = hashlib.sha256(
+            json.dumps(relevant_config, sort_keys=True, default=str).encode('utf-8')
+        ).hexdigest()
+        
+        parser_id = f"{type(parser).__name__}:{getattr(parser, 'VERSION', 0)}"
+        return hashlib.sha256(f'{parser_id}:{config_hash}:{content_hash}'.encode('utf-8')).hexdigest()
+    
+    @classmethod
+    def hash_file(cls, file_path: str) -> str:
+        """
+        Hash the content of a file.
+        
+        Args:
+            file_path: Path to the file
+            
+        Returns:
+            Hexadecimal SHA-256 digest of the file content
+        """
+        digest = hashlib.sha256()
+        
+        with open(file_path, 'rb') as file:
+            for block in iter(lambda: file.read(cls.HASH_BLOCK_SIZE), b''):
+                digest.update(block)
+        
+        return digest.hexdigest()
+    
+    def get(self, key: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Get the records cached under a key.
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            List of dictionaries containing extracted data, or None on a miss
+        """
+        entry_path = self._entry_path(key)
+        
+        try:
+            with open(entry_path, 'rb') as file:
+                data = pickle.loads(zlib.decompress(file.read()))
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"Ignoring unreadable cache entry {entry_path}: {str(e)}")
+            return None
+        
+        # Mark the entry as recently used for LRU eviction
+        try:
+            os.utime(entry_path)
+        except OSError:
+            pass
+        
+        return data
+    
+    def put(self, key: str, data: List[Dict[str, Any]]) -> None:
+        """
+        Store records in the cache, evicting old entries if it grows too large.
+        
+        Args:
+            key: Cache key
+            data: List of dictionaries containing extracted data
+        """
+        entry_path = self._entry_path(key)
+        payload = zlib.compress(pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL))
+        
+        try:
+            os.makedirs(os.path.dirname(entry_path), exist_ok=True)
+            
+            # Write to a temporary file first so that readers never see a partial entry
+            fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(entry_path), suffix='.tmp')
+            with os.fdopen(fd, 'wb') as file:
+                file.write(payload)
+            os.replace(temp_path, entry_path)
+        except OSError as e:
+            print(f"Error writing cache entry {entry_path}: {str(e)}")
+            return
+        
+        if self._size is None:
+            self._size = self._scan_size()
+        else:
+            self._size += len(payload)
+        
+        if self._size > self.max_size:
+            self.evict()
+    
+    def evict(self) -> None:
+        """Remove the least recently used entries until the cache fits its size limit."""
+        entries = []
+        
+        for shard in os.scandir(self.cache_dir):
+            if not shard.is_dir():
+                continue
+            for entry in os.scandir(shard.path):
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        
+        size = sum(entry_size for _, entry_size, _ in entries)
+        
+        for _, entry_size, entry_path in sorted(entries):
+            if size <= self.max_size:
+                break
+            try:
+                os.remove(entry_path)
+            except FileNotFoundError:
+                pass
+            size -= entry_size
+        
+        self._size = size
+    
+    def _scan_size(self) -> int:
+        """Get the total size of the cache entries on disk."""
+        size = 0
+        
+        for root, _, filenames in os.walk(self.cache_dir):
+            for filename in filenames:
+                try:
+                    size += os.path.getsize(os.path.join(root, filename))
+                except FileNotFoundError:
+                    continue
+        
+        return size
+    
+    def _entry_path(self, key: str) -> str:
+        """Get the file path of a cache entry, sharded by the first characters of its key."""
+        return os.path.join(self.cache_dir, key[:2], f'{key}.bin')
@@ -0,0 +1,201 @@
+"""
+Extraction manifest module.
+Remembers the files processed by a previous run so that only new or changed files are parsed again.
+"""
+import os
+import json
+import pickle
+import zlib
+import hashlib
+import tempfile
+from typing import Dict, List, Any, Optional
+
+from ..parser.extraction_cache import ExtractionCache
+
+
+class ExtractionManifest:
+    """Manifest of processed files with their size, modification time and content hash."""
+    
+    # Name of the manifest file in the output directory
+    FILE_NAME = '.extraction_manifest'
+    
+    # Version of the manifest file layout; manifests of other versions are discarded
+    FORMAT_VERSION = 2
+    
+    def __init__(self, manifest_path: str, config: Dict[str, Any]):
+        """
+        Initialize the manifest, loading the previous run's entries if they are still valid.
+        
+        The manifest file only holds the size, modification time and content hash
+        of each file. The records of each file are stored in a file of their own
+        in the directory manifest_path + '.records', so that a run only reads the
+        records of the unchanged files and only writes those of the changed ones.
+        
+        Args:
+            manifest_path: Path to the manifest file
+            config: Settings that affect the extracted records (input configuration
+                and parser versions); entries recorded with other settings are discarded
+        """
+        self.manifest_path = manifest_path
+        self.records_dir = manifest_path + '.records'
+        self.config_hash = hashlib.sha256(
+            json.dumps(config, sort_keys=True, default=str).encode('utf-8')
+        ).hexdigest()
+        self.entries = {}
+        
+        # Stat results and content hashes of the files to parse, taken by lookup before parsing
+        self._states = {}
+        
+        self._load()
+    
+    def _load(self) -> None:
+        """Load the entries of the manifest file, if it exists and matches the configuration."""
+        try:
+            with open(self.manifest_path, 'rb') as file:
+                manifest = pickle.loads(zlib.decompress(file.read()))
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            print(f"Ignoring unreadable manifest {self.manifest_path}: {str(e)}")
+            return
+        
+        if manifest.get('version') == self.FORMAT_VERSION and manifest.get('config_hash') == self.config_hash:
+            self.entries = manifest.get('files', {})
+    
+    def lookup(self, file_path: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Get the records of a file if it has not changed since the previous run.
+        
+        Files whose size and modification time are unchanged are trusted without
+        being read. Files whose modification time changed are hashed, so that
+        touched but unmodified files are not parsed again.
+        
+        For a file to be parsed again, the size, modification time and content
+        hash are taken now, before parsing, and recorded by update; a file
+        changed while it is parsed is then seen as changed by the next run.
+        
+        Args:
+            file_path: Path to the file
+            
+        Returns:
+            List of dictionaries containing extracted data, or None if the file is
+            new, changed, no longer readable or its records cannot be read
+        """
+        path = os.path.abspath(file_path)
+        entry = self.entries.get(path)
+        
+        try:
+            stat = os.stat(path)
+            content_hash = None
+            
+            if entry is not None and stat.st_size == entry['size']:
+                if stat.st_mtime_ns != entry['mtime']:
+                    content_hash = ExtractionCache.hash_file(path)
+                
+                if content_hash is None or content_hash == entry['hash']:
+                    entry['mtime'] = stat.st_mtime_ns
+                    records = self._read_records(entry)
+                    if records is not None:
+                        return records
+            
+            self._states[path] = (stat, content_hash or ExtractionCache.hash_file(path))
+        except OSError:
+            # Removed or unreadable since the input files were listed; parsing it reports the error
+            self._states.pop(path, None)
+        
+        return None
+    
+    def _read_records(self, entry: Dict[str, Any]) -> Optional[List[Dict[str, Any]]]:
+        """Read the records of a manifest entry, or None if they cannot be read."""
+        if entry['records'] is None:
+            return []
+        
+        records_path = os.path.join(self.records_dir, entry['records'])
+        try:
+            with open(records_path, 'rb') as file:
+                return pickle.loads(zlib.decompress(file.read()))
+        except Exception as e:
+            print(f"Ignoring unreadable manifest records {records_path}: {str(e)}")
+            return None
+    
+    def update(self, file_path: str, records: List[Dict[str, Any]]) -> None:
+        """
+        Record the records extracted from a file.
+        
+        The records are written to their own file at once; the entry is kept
+        by the next save. The file is recorded as lookup found it before it was
+        parsed, or as it is now if it was not looked up. A file that can no
+        longer be read is forgotten.
+        
+        Args:
+            file_path: Path to the file
+            records: List of dictionaries containing extracted data; an empty
+                list only records that the file was processed
+        """
+        path = os.path.abspath(file_path)
+        
+        state = self._states.pop(path, None)
+        try:
+            stat, content_hash = state or (os.stat(path), ExtractionCache.hash_file(path))
+        except OSError:
+            self.entries.pop(path, None)
+            return
+        
+        # Records are stored under the path and content they were extracted from, so
+        # the records of the saved manifest stay intact until it is replaced
+        records_name = None
+        if records:
+            records_name = hashlib.sha256(f'{path}:{content_hash}'.encode('utf-8')).hexdigest() + '.bin'
+            try:
+                os.makedirs(self.records_dir, exist_ok=True)
+                self._write(
+                    os.path.join(self.records_dir, records_name),
+                    zlib.compress(pickle.dumps(records, protocol=pickle.HIGHEST_PROTOCOL))
+                )
+            except OSError as e:
+                print(f"Error writing manifest records of {path}: {str(e)}")
+                self.entries.pop(path, None)
+                return
+        
+        self.entries[path] = {
+            'size': stat.st_size,
+            'mtime': stat.st_mtime_ns,
+            'hash': content_hash,
+            'records': records_name
+        }
+    
+    def save(self, file_paths: List[str]) -> None:
+        """
+        Write the manifest, keeping only the entries of the given files.
+        
+        Record files no longer referenced by an entry are removed afterwards.
+        
+        Args:
+            file_paths: Paths of the files processed by this run
+        """
+        paths = {os.path.abspath(file_path) for file_path in file_paths}
+        self.entries = {path: entry for path, entry in self.entries.items() if path in paths}
+        
+        manifest = {'version': self.FORMAT_VERSION, 'config_hash': self.config_hash, 'files': self.entries}
+        self._write(self.manifest_path, zlib.compress(pickle.dumps(manifest, protocol=pickle.HIGHEST_PROTOCOL)))
+        
+        referenced = {entry['records'] for entry in self.entries.values()}
+        try:
+            names = os.listdir(self.records_dir)
+        except FileNotFoundError:
+            return
+        
+        for name in names:
+            if name not in referenced:
+                try:
+                    os.remove(os.path.join(self.records_dir, name))
+                except OSError:
+                    pass
+    
+    @staticmethod
+    def _write(path: str, payload: bytes) -> None:
+        """Write a file through a temporary file, so that an interrupted run keeps the previous content."""
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix='.tmp')
+        with os.fdopen(fd, 'wb') as file:
+            file.write(payload)
+        os.replace(temp_path, path)
@@ -0,0 +1,322 @@
+"""
+Job queue module for the Text Extractor web interface.
+Runs extraction jobs in background worker threads, with the queue kept in a
+SQLite database shared by all web server processes.
+"""
+import os
+import json
+import time
+import uuid
+import sqlite3
+import threading
+from typing import Callable, Dict, List, Any, Optional
+
+
+class JobQueue:
+    """Queue of extraction jobs stored in a SQLite database."""
+    
+    # Job statuses
+    QUEUED = 'queued'
+    RUNNING = 'running'
+    DONE = 'done'
+    FAILED = 'failed'
+    
+    # Seconds to wait for a lock held by another process
+    LOCK_TIMEOUT = 30
+    
+    def __init__(self, db_path: str, max_running: int = 1, max_queued: int = 100):
+        """
+        Initialize the job queue, creating its database if needed.
+        
+        Args:
+            db_path: Path to the SQLite database file
+            max_running: Maximum number of jobs running at a time, across all processes
+            max_queued: Maximum number of jobs waiting to run
+        """
+        self.db_path = db_path
+        self.max_running = max_running
+        self.max_queued = max_queued
+        
+        with self._connect() as connection:
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS jobs ('
+                'id TEXT PRIMARY KEY, status TEXT NOT NULL, payload TEXT NOT NULL, '
+                'progress INTEGER NOT NULL DEFAULT 0, message TEXT NOT NULL DEFAULT \'\', '
+                'result TEXT, error TEXT, worker_pid INTEGER, '
+                'created REAL NOT NULL, updated REAL NOT NULL)'
+            )
+            connection.execute('CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, created)')
+    
+    def enqueue(self, payload: Dict[str, Any]) -> Optional[str]:
+        """
+        Add a job to the queue.
+        
+        Args:
+            payload: JSON-serializable job parameters
+            
+        Returns:
+            ID of the new job, or None if the queue is full
+        """
+        job_id = str(uuid.uuid4())
+        now = time.time()
+        
+        with self._transaction() as connection:
+            queued = connection.execute('SELECT COUNT(*) FROM jobs WHERE status = ?', (self.QUEUED,)).fetchone()[0]
+            if queued >= self.max_queued:
+                return None
+            
+            connection.execute(
+                'INSERT INTO jobs (id, status, payload, message, created, updated) VALUES (?, ?, ?, ?, ?, ?)',
+                (job_id, self.QUEUED, json.dumps(payload), 'Waiting in queue', now, now)
+            )
+        
+        return job_id
+    
+    def claim(self) -> Optional[Dict[str, Any]]:
+        """
+        Take the oldest queued job and mark it as running in this process.
+        
+        Jobs left running by a process that no longer exists are marked as
+        failed first, so they do not count against the running jobs limit.
+        
+        Returns:
+            Dictionary with the job's 'id' and 'payload', or None if no job
+            is queued or the running jobs limit is reached
+        """
+        with self._transaction() as connection:
+            running = connection.execute(
+                'SELECT id, worker_pid FROM jobs WHERE status = ?', (self.RUNNING,)
+            ).fetchall()
+            
+            active = 0
+            for job_id, worker_pid in running:
+                if self._process_exists(worker_pid):
+                    active += 1
+                else:
+                    connection.execute(
+                        'UPDATE jobs SET status = ?, error = ?, updated = ? WHERE id = ?',
+                        (self.FAILED, 'The job was interrupted', time.time(), job_id)
+                    )
+            
+            if active >= self.max_running:
+                return None
+            
+            row = connection.execute(
+                'SELECT id, payload FROM jobs WHERE status = ? ORDER BY created LIMIT 1', (self.QUEUED,)
+            ).fetchone()
+            if row is None:
+                return None
+            
+            connection.execute(
+                'UPDATE jobs SET status = ?, worker_pid = ?, message = ?, updated = ? WHERE id = ?',
+                (self.RUNNING, os.getpid(), 'Starting', time.time(), row[0])
+            )
+        
+        return {'id': row[0], 'payload': json.loads(row[1])}
+    
+    def update(self, job_id: str, progress: int, message: str) -> None:
+        """
+        Record the progress of a running job.
+        
+        Args:
+            job_id: Job ID
+            progress: Percentage of the job done
+            message: Description of the current step
+        """
+        with self._connect() as connection:
+            connection.execute(
+                'UPDATE jobs SET progress = ?, message = ?, updated = ? WHERE id = ?',
+                (progress, message, time.time(), job_id)
+            )
+    
+    def finish(self, job_id: str, result: Dict[str, Any]) -> None:
+        """
+        Mark a job as done.
+        
+        Args:
+            job_id: Job ID
+            result: JSON-serializable job result
+        """
+        with self._connect() as connection:
+            connection.execute(
+                'UPDATE jobs SET status = ?, progress = 100, message = ?, result = ?, updated = ? WHERE id = ?',
+                (self.DONE, 'Done', json.dumps(result), time.time(), job_id)
+            )
+    
+    def fail(self, job_id: str, error: str) -> None:
+        """
+        Mark a job as failed.
+        
+        Args:
+            job_id: Job ID
+            error: Error message
+        """
+        with self._connect() as connection:
+            connection.execute(
+                'UPDATE jobs SET status = ?, error = ?, updated = ? WHERE id = ?',
+                (self.FAILED, error, time.time(), job_id)
+            )
+    
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the state of a job.
+        
+        Args:
+            job_id: Job ID
+            
+        Returns:
+            Dictionary with the job's 'status', 'progress', 'message', 'result',
+            'error' and, for queued jobs, 'position' in the queue (1 for the
+            next job to run); None if the job does not exist
+        """
+        with self._connect() as connection:
+            row = connection.execute(
+                'SELECT status, progress, message, result, error, created FROM jobs WHERE id = ?', (job_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            
+            status, progress, message, result, error, created = row
+            job = {
+                'status': status,
+                'progress': progress,
+                'message': message,
+                'result': json.loads(result) if result else None,
+                'error': error,
+            }
+            
+            if status == self.QUEUED:
+                job['position'] = connection.execute(
+                    'SELECT COUNT(*) FROM jobs WHERE status = ? AND created <= ?', (self.QUEUED, created)
+                ).fetchone()[0]
+        
+        return job
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection to the database in autocommit mode."""
+        return _ClosingConnection(self.db_path, timeout=self.LOCK_TIMEOUT, isolation_level=None)
+    
+    def _transaction(self) -> '_Transaction':
+        """Open a connection holding the database write lock until the end of the with block."""
+        return _Transaction(self._connect())
+    
+    @staticmethod
+    def _process_exists(pid: Optional[int]) -> bool:
+        """Check whether a process of this machine is running."""
+        if not pid:
+            return False
+        
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            # The process exists but belongs to another user
+            return True
+        
+        return True
+
+
+class _ClosingConnection(sqlite3.Connection):
+    """SQLite connection that is closed at the end of a with block."""
+    
+    def __exit__(self, *exc_info) -> bool:
+        try:
+            return super().__exit__(*exc_info)
+        finally:
+            self.close()
+
+
+class _Transaction:
+    """Immediate transaction committed at the end of a with block, or rolled back on error."""
+    
+    def __init__(self, connection: sqlite3.Connection):
+        self.connection = connection
+    
+    def __enter__(self) -> sqlite3.Connection:
+        self.connection.execute('BEGIN IMMEDIATE')
+        return self.connection
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        try:
+            self.connection.execute('ROLLBACK' if exc_type else 'COMMIT')
+        finally:
+            self.connection.close()
+        return False
+
+
+class JobWorkerPool:
+    """Threads of this process that run the jobs of a job queue."""
+    
+    # Seconds between checks for new jobs queued by other processes
+    POLL_INTERVAL = 1.0
+    
+    def __init__(
+        self,
+        job_queue: JobQueue,
+        handler: Callable[[Dict[str, Any], Callable[[int, str], None]], Dict[str, Any]],
+        workers: int = 1
+    ):
+        """
+        Initialize the worker pool.
+        
+        Args:
+            job_queue: Queue of the jobs to run
+            handler: Function running a job from its payload and a progress
+                callback taking a percentage and a message; it returns the
+                job result or raises an exception if the job fails
+            workers: Number of worker threads
+        """
+        self.job_queue = job_queue
+        self.handler = handler
+        self.workers = workers
+        self.threads: List[threading.Thread] = []
+        self.wakeup = threading.Event()
+        self.lock = threading.Lock()
+    
+    def start(self) -> None:
+        """Start the worker threads, unless they are already running in this process."""
+        with self.lock:
+            if self.threads:
+                return
+            
+            for _ in range(self.workers):
+                thread = threading.Thread(target=self._run, daemon=True)
+                thread.start()
+                self.threads.append(thread)
+    
+    def notify(self) -> None:
+        """Wake up the idle worker threads after a job was queued."""
+        self.wakeup.set()
+    
+    def _run(self) -> None:
+        """Run queued jobs until the process ends."""
+        while True:
+            try:
+                job = self.job_queue.claim()
+            except sqlite3.Error as e:
+                print(f"Error claiming job: {str(e)}")
+                job = None
+            
+            if job is None:
+                self.wakeup.wait(self.POLL_INTERVAL)
+                self.wakeup.clear()
+                continue
+            
+            self._run_job(job)
+    
+    def _run_job(self, job: Dict[str, Any]) -> None:
+        """Run a claimed job and record its result."""
+        job_id = job['id']
+        
+        def progress(percent: int, message: str) -> None:
+            self.job_queue.update(job_id, percent, message)
+        
+        try:
+            result = self.handler(job['payload'], progress)
+        except Exception as e:
+            print(f"Error in job {job_id}: {str(e)}")
+            self.job_queue.fail(job_id, str(e))
+        else:
+            self.job_queue.finish(job_id, result)
@@ -5,23 +5,50 @@ Provides command-line interface and orchestrates the extraction and export proce
 import os
 import sys
 import click
-from typing import Dict, List, Any
+from itertools import chain
+from typing import Dict, List, Any, Optional
 
 # Fix import paths by using relative imports
 from ..src.config.config_handler import ConfigHandler
 from ..src.parser.parser_factory import ParserFactory
-from ..src.utils.data_processor import DataProcessor
-from ..src.exporters.excel_exporter import ExcelExporter
-from ..src.exporters.word_exporter import WordExporter
-from ..src.exporters.text_exporter import TextExporter
+from ..src.parser.extraction_cache import ExtractionCache
+from ..src.utils.extraction_manifest import ExtractionManifest
+from ..src.pipeline import (
+    DEFAULT_BATCH_SIZE, DEFAULT_FORMATS, iter_extracted, iter_structured, iter_structured_files, export_stream
+)
 
 
-@click.command()
+class DefaultCommandGroup(click.Group):
+    """Command group that runs the extract command when no command is named, as before commands existed."""
+    
+    def parse_args(self, ctx: click.Context, args: List[str]) -> List[str]:
+        """Insert the extract command before arguments that do not start with a command name."""
+        if not args or (args[0] not in self.commands and args[0] not in ctx.help_option_names):
+            args = ['extract'] + list(args)
+        return super().parse_args(ctx, args)
+
+
+@click.group(cls=DefaultCommandGroup)
+def main():
+    """
+    Extract data from files and export to specified formats.
+    
+    Without a command, the arguments are those of the extract command.
+    """
+
+
+@main.command()
 @click.option('--input', '-i', required=True, help='Input file or directory path')
 @click.option('--config', '-c', required=True, help='Configuration file path')
 @click.option('--output', '-o', required=True, help='Output directory path')
-@click.option('--formats', '-f', default='all', help='Output formats (comma-separated: excel,word,text or "all")')
-def main(input, config, output, formats):
+@click.option('--formats', '-f', default='all', help='Output formats (comma-separated: excel,word,text,parquet,arrow or "all")')
+@click.option('--workers', '-w', default=1, type=click.IntRange(min=1), help='Number of worker processes used to parse input files')
+@click.option('--cache-dir', default=None, help='Directory of the extraction cache (disabled if not set)')
+@click.option('--cache-size', default=1024, type=click.IntRange(min=1), help='Maximum size of the extraction cache in MB')
+@click.option('--incremental', is_flag=True, help='Only parse files that are new or changed since the previous run into this output directory')
+@click.option('--batch-size', default=DEFAULT_BATCH_SIZE, type=click.IntRange(min=1), help='Number of records streamed to the exporters at a time')
+@click.option('--sequential-export', is_flag=True, help='Run the exporters one after another instead of concurrently')
+def extract(input, config, output, formats, workers, cache_dir, cache_size, incremental, batch_size, sequential_export):
     """
     Extract data from files and export to specified formats.
     
@@ -29,7 +56,13 @@ def main(input, config, output, formats):
         input: Input file or directory path
         config: Configuration file path
         output: Output directory path
-        formats: Output formats (comma-separated: excel,word,text or "all")
+        formats: Output formats (comma-separated: excel,word,text,parquet,arrow or "all")
+        workers: Number of worker processes used to parse input files
+        cache_dir: Directory of the extraction cache, or None to disable it
+        cache_size: Maximum size of the extraction cache in MB
+        incremental: Whether to reuse the results of unchanged files from the previous run
+        batch_size: Number of records streamed to the exporters at a time
+        sequential_export: Run the exporters one after another instead of concurrently
     """
     try:
         # Load configuration
@@ -45,30 +78,53 @@ def main(input, config, output, formats):
             click.echo(f"No supported files found in {input}")
             return
         
-        # Extract data from input files
-        extracted_data = extract_data(input_files, config_handler.get_input_config())
-        if not extracted_data:
+        # Extract and structure the data of the input files
+        cache = ExtractionCache(cache_dir, cache_size * 1024 * 1024) if cache_dir else None
+        if incremental:
+            manifest = ExtractionManifest(
+                os.path.join(output, ExtractionManifest.FILE_NAME),
+                {
+                    'input': config_handler.get_input_config(),
+                    'parsers': ParserFactory.parser_versions()
+                }
+            )
+            extracted_data = extract_incremental(
+                input_files, config_handler.get_input_config(), manifest, workers, cache
+            )
+            structured_data = iter_structured(extracted_data, config_handler.get_output_config())
+        else:
+            structured_data = iter_structured_files(
+                input_files,
+                config_handler.get_input_config(),
+                config_handler.get_output_config(),
+                workers,
+                cache
+            )
+        
+        # Records are streamed, so check for data by reading the first one
+        structured_data = iter(structured_data)
+        first_record = next(structured_data, None)
+        if first_record is None:
             click.echo("No data extracted from input files")
             return
-        
-        # Process and structure the data
-        processor = DataProcessor(config_handler.get_output_config())
-        structured_data = processor.process(extracted_data)
+        structured_data = chain([first_record], structured_data)
         
         # Determine export formats
         export_formats = determine_export_formats(formats)
         
         # Export data to specified formats
-        export_results = export_data(
+        export_results, record_count = export_stream(
             structured_data, 
             output, 
             export_formats, 
             config_handler.get_output_config(),
-            config_handler.get_export_config()
+            config_handler.get_export_config(),
+            batch_size,
+            concurrent=not sequential_export
         )
         
         # Print results
-        click.echo(f"Processed {len(input_files)} files and extracted {len(structured_data)} records")
+        click.echo(f"Processed {len(input_files)} files and extracted {record_count} records")
         for format_name, file_path in export_results.items():
             if file_path:
                 click.echo(f"Exported to {format_name}: {file_path}")
@@ -78,6 +134,75 @@ def main(input, config, output, formats):
         sys.exit(1)
 
 
+@main.command()
+@click.option('--input', '-i', 'inputs', required=True, multiple=True, help='Input directory to watch (can be repeated)')
+@click.option('--config', '-c', required=True, help='Configuration file path')
+@click.option('--output', '-o', required=True, help='Output directory path, receiving one directory per segment')
+@click.option('--formats', '-f', default='all', help='Output formats (comma-separated: excel,word,text,parquet,arrow or "all")')
+@click.option('--workers', '-w', default=1, type=click.IntRange(min=1), help='Number of worker processes used to parse a micro-batch')
+@click.option('--settle', default=1.0, type=click.FloatRange(min=0), help='Seconds a file must stay unchanged before it is extracted')
+@click.option('--poll-interval', default=2.0, type=click.FloatRange(min=0.1), help='Seconds between directory scans when polling')
+@click.option('--polling', is_flag=True, help='Scan the directories periodically instead of using inotify (e.g. on network file systems)')
+@click.option('--max-batch-files', default=100, type=click.IntRange(min=1), help='Maximum number of files extracted per micro-batch')
+@click.option('--roll-interval', default=60.0, type=click.FloatRange(min=0), help='Seconds after which an output segment is closed (0 closes it after every micro-batch)')
+@click.option('--roll-records', default=100000, type=click.IntRange(min=1), help='Number of records after which an output segment is closed')
+@click.option('--batch-size', default=DEFAULT_BATCH_SIZE, type=click.IntRange(min=1), help='Number of records streamed to the exporters at a time')
+def watch(inputs, config, output, formats, workers, settle, poll_interval, polling, max_batch_files, roll_interval, roll_records, batch_size):
+    """
+    Watch directories and extract new or changed files as they appear, until interrupted.
+    
+    Args:
+        inputs: Input directory paths
+        config: Configuration file path
+        output: Output directory path
+        formats: Output formats (comma-separated: excel,word,text,parquet,arrow or "all")
+        workers: Number of worker processes used to parse a micro-batch
+        settle: Seconds a file must stay unchanged before it is extracted
+        poll_interval: Seconds between directory scans when polling
+        polling: Scan the directories periodically instead of using inotify
+        max_batch_files: Maximum number of files extracted per micro-batch
+        roll_interval: Seconds after which an output segment is closed
+        roll_records: Number of records after which an output segment is closed
+        batch_size: Number of records streamed to the exporters at a time
+    """
+    # Imported here so that the extract command does not load it
+    from ..src.watcher import DirectoryWatcher, ExtractionWatcher, RollingOutput
+    
+    try:
+        for input_dir in inputs:
+            if not os.path.isdir(input_dir):
+                raise ValueError(f"Input directory not found: {input_dir}")
+        
+        # Load configuration
+        config_handler = ConfigHandler()
+        config_handler.load_config(config)
+        
+        # Create output directory if it doesn't exist
+        os.makedirs(output, exist_ok=True)
+        
+        watcher = DirectoryWatcher(
+            list(inputs), ParserFactory.is_supported, settle, poll_interval, use_inotify=not polling
+        )
+        rolling_output = RollingOutput(
+            output,
+            determine_export_formats(formats),
+            config_handler.get_output_config(),
+            config_handler.get_export_config(),
+            roll_interval,
+            roll_records
+        )
+        extraction_watcher = ExtractionWatcher(
+            watcher, rolling_output, config_handler.get_input_config(), workers, max_batch_files, batch_size
+        )
+        
+        click.echo(f"Watching {', '.join(inputs)} (press Ctrl+C to stop)")
+        extraction_watcher.run()
+    
+    except Exception as e:
+        click.echo(f"Error: {str(e)}", err=True)
+        sys.exit(1)
+
+
 def get_input_files(input_path: str) -> List[str]:
     """
     Get list of supported input files from the input path.
@@ -88,45 +213,92 @@ def get_input_files(input_path: str) -> List[str]:
     Returns:
         List of file paths
     """
-    supported_extensions = ['.txt', '.xlsx', '.xls', '.csv', '.docx']
-    
     if os.path.isfile(input_path):
-        _, ext = os.path.splitext(input_path.lower())
-        if ext in supported_extensions:
+        if ParserFactory.is_supported(input_path):
             return [input_path]
         else:
             return []
     
     elif os.path.isdir(input_path):
         files = []
-        for root, _, filenames in os.walk(input_path):
-            for filename in filenames:
-                _, ext = os.path.splitext(filename.lower())
-                if ext in supported_extensions:
+        for root, dirnames, filenames in os.walk(input_path):
+            # Walk in sorted order so that output order does not depend on the file system
+            dirnames.sort()
+            for filename in sorted(filenames):
+                if ParserFactory.is_supported(filename):
                     files.append(os.path.join(root, filename))
         return files
     
     return []
 
 
-def extract_data(input_files: List[str], config: Dict[str, Any]) -> List[Dict[str, Any]]:
+def extract_data(
+    input_files: List[str], 
+    config: Dict[str, Any], 
+    workers: int = 1,
+    cache: Optional[ExtractionCache] = None
+) -> List[Dict[str, Any]]:
     """
     Extract data from input files.
     
     Args:
         input_files: List of input file paths
         config: Input configuration
+        workers: Number of worker processes used to parse the files
+        cache: Extraction cache used to skip files parsed before, if any
         
     Returns:
         List of dictionaries containing extracted data
     """
-    all_data = []
-    parser_factory = ParserFactory(config)
+    return list(iter_extracted(input_files, config, workers, cache))
+
+
+def extract_incremental(
+    input_files: List[str], 
+    config: Dict[str, Any], 
+    manifest: ExtractionManifest,
+    workers: int = 1,
+    cache: Optional[ExtractionCache] = None
+) -> List[Dict[str, Any]]:
+    """
+    Extract data from input files, parsing only files that changed since the previous run.
+    
+    Args:
+        input_files: List of input file paths
+        config: Input configuration
+        manifest: Manifest of the previous run, updated and saved by this function
+        workers: Number of worker processes used to parse the files
+        cache: Extraction cache used to skip files parsed before, if any
+        
+    Returns:
+        List of dictionaries containing extracted data
+    """
+    file_data = {}
+    changed_files = []
     
     for file_path in input_files:
-        data = parser_factory.parse_file(file_path)
+        data = manifest.lookup(file_path)
+        if data is None:
+            changed_files.append(file_path)
+        else:
+            file_data[file_path] = data
+    
+    parser_factory = ParserFactory(config, cache)
+    
+    for file_path, data in parser_factory.parse_files(changed_files, workers):
+        file_data[file_path] = data
+        
+        # Parsers report errors by returning no records, so files without
+        # data are not remembered and are retried on the next run
         if data:
-            all_data.extend(data)
+            manifest.update(file_path, data)
+    
+    manifest.save(input_files)
+    
+    # Merge the results in input file order
+    all_data = []
+    for file_path in input_files:
+        all_data.extend(file_data[file_path])
     
     return all_data
 
@@ -142,7 +314,7 @@ def determine_export_formats(formats_str: str) -> List[str]:
         List of format names
     """
     if formats_str.lower() == 'all':
-        return ['excel', 'word', 'text']
+        return list(DEFAULT_FORMATS)
     
     return [fmt.strip().lower() for fmt in formats_str.split(',')]
 
@@ -155,7 +327,7 @@ def export_data(
     export_config: Dict[str, Any]
 ) -> Dict[str, str]:
     """
-    Export data to specified formats.
+    Export data to specified formats, running the exporters concurrently.
     
     Args:
         data: List of dictionaries containing structured data
@@ -167,29 +339,7 @@ def export_data(
     Returns:
         Dictionary mapping format names to output file paths
     """
-    results = {}
-    
-    # Combine configurations for exporters
-    combined_config = {
-        **output_config,
-        **export_config
-    }
-    
-    # Export to Excel
-    if 'excel' in formats:
-        exporter = ExcelExporter(combined_config)
-        results['excel'] = exporter.export(data, output_dir)
-    
-    # Export to Word
-    if 'word' in formats:
-        exporter = WordExporter(combined_config)
-        results['word'] = exporter.export(data, output_dir)
-    
-    # Export to Text
-    if 'text' in formats:
-        exporter = TextExporter(combined_config)
-        results['text'] = exporter.export(data, output_dir)
-    
+    results, _ = export_stream(data, output_dir, formats, output_config, export_config, concurrent=True)
     return results
 
 
@@ -0,0 +1,59 @@
+"""
+Parquet exporter module.
+Exports structured data to Parquet format.
+"""
+from typing import Any, Iterable
+
+from .arrow_exporter import ArrowExporter
+
+try:
+    import pyarrow.parquet as pq
+except ImportError:
+    pq = None
+
+
+class ParquetExporter(ArrowExporter):
+    """Exporter for creating Parquet files with typed columns from structured data."""
+    
+    # Section of the export configuration, output file name and format name used in messages
+    CONFIG_SECTION = 'parquet'
+    FILE_NAME = 'extracted_data.parquet'
+    FORMAT_NAME = 'Parquet'
+    
+    # Configuration key and default number of records written per row group
+    BATCH_SIZE_KEY = 'row_group_size'
+    DEFAULT_BATCH_SIZE = 100000
+    
+    # Default compression codec ('none', 'snappy', 'gzip', 'zstd', ...)
+    DEFAULT_COMPRESSION = 'snappy'
+    
+    def _new_writer(self, schema: 'pa.Schema', file_name: str) -> Any:
+        """
+        Create the writer of the output file.
+        
+        Args:
+            schema: Schema of the exported columns
+            file_name: Path of the file to write
+            
+        Returns:
+            Parquet file writer
+        """
+        return pq.ParquetWriter(file_name, schema, compression=self.compression)
+    
+    def _write_table(self, table: 'pa.Table') -> None:
+        """Write a table of records as one row group."""
+        self.writer.write_table(table, row_group_size=self.batch_size)
+    
+    def _read_tables(self, file_name: str) -> Iterable['pa.Table']:
+        """
+        Read back a written file a row group at a time.
+        
+        Args:
+            file_name: Path of the file
+            
+        Yields:
+            Tables of the records of each row group
+        """
+        parquet_file = pq.ParquetFile(file_name)
+        for index in range(parquet_file.num_row_groups):
+            yield parquet_file.read_row_group(index)
@@ -3,25 +3,152 @@ Parser factory module.
 Creates appropriate parser instances based on file type.
 """
 import os
-from typing import Dict, List, Any, Optional
+import signal
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterator, List, Any, Optional, Tuple, Union
 
-from .text_parser import TextParser
-from .excel_parser import ExcelParser
-from .csv_parser import CSVParser
-from .word_parser import WordParser
+from .extraction_cache import ExtractionCache
+from ..utils.plugin_registry import PluginRegistry
+
+# Parser classes by file extension. Parser modules (and the libraries they use,
+# such as pandas and python-docx) are imported the first time a file of their
+# type is parsed; other packages add parsers through the entry point group.
+PARSERS = PluginRegistry('text_extractor.parsers', {
+    'txt': '.text_parser:TextParser',
+    'xlsx': '.excel_parser:ExcelParser',
+    'xls': '.excel_parser:ExcelParser',
+    'csv': '.csv_parser:CSVParser',
+    'docx': '.word_parser:WordParser',
+}, package=__package__)
+
+# Number of files submitted to the worker processes ahead of the results being
+# consumed, per worker; bounds the parsed records waiting in memory
+PENDING_FILES_PER_WORKER = 2
+
+# Parser factory of the current worker process, set up by _init_worker
+_worker_factory = None
+
+
+def _init_worker(
+    config: Dict[str, Any],
+    cache: Optional[ExtractionCache],
+    content_hashes: Optional[Dict[str, str]] = None
+) -> None:
+    """
+    Create the parser factory used by a worker process.
+    
+    Args:
+        config: Dictionary containing parser configurations
+        cache: Extraction cache shared with the parent process, if any
+        content_hashes: Known content hashes of the files by path, if any
+    """
+    global _worker_factory
+    _worker_factory = ParserFactory(config, cache, content_hashes)
+    
+    # A broken pool stops its remaining workers with SIGTERM, so a handler
+    # inherited from a parent that catches it (such as the watch command) is removed
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+
+
+def _parse_in_worker(file_path: str) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """
+    Parse a single file inside a worker process.
+    
+    Args:
+        file_path: Path to the file to parse
+        
+    Returns:
+        Tuple of the extracted records and an error message (None on success)
+    """
+    try:
+        return _worker_factory.parse_file(file_path), None
+    except Exception as e:
+        return [], str(e)
 
 
 class ParserFactory:
     """Factory for creating appropriate parser instances based on file type."""
     
-    def __init__(self, config: Dict[str, Any]):
+    def __init__(
+        self,
+        config: Dict[str, Any],
+        cache: Optional[ExtractionCache] = None,
+        content_hashes: Optional[Dict[str, str]] = None,
+        parsers: Optional[Dict[type, object]] = None
+    ):
         """
         Initialize the parser factory with configuration.
         
         Args:
             config: Dictionary containing parser configurations
+            cache: Extraction cache used to skip files parsed before, if any
+            content_hashes: SHA-256 digests of file contents by path, used as
+                cache keys instead of reading the files again to hash them
+            parsers: Parser instances by class, shared with other factories of
+                the same configuration (see ConfigCache); by default each
+                factory creates its own
         """
         self.config = config
+        self.cache = cache
+        self.content_hashes = content_hashes or {}
+        self.parsers = parsers if parsers is not None else {}
+    
+    @staticmethod
+    def parser_versions() -> Dict[str, int]:
+        """
+        Get the version of every parser.
+        
+        This imports every parser module, including those of plugins.
+        
+        Returns:
+            Dictionary mapping parser class names to their versions
+        """
+        versions = {}
+        
+        for extension in PARSERS.names():
+            parser_class = PARSERS.get(extension)
+            if parser_class is not None:
+                versions[parser_class.__name__] = getattr(parser_class, 'VERSION', 0)
+        
+        return versions
+    
+    @staticmethod
+    def is_supported(file_path: str) -> bool:
+        """
+        Check whether a file has a parser, without importing the parser.
+        
+        Args:
+            file_path: Path to the file
+            
+        Returns:
+            True if the file extension has a parser
+        """
+        _, ext = os.path.splitext(file_path.lower())
+        return bool(ext) and ext in PARSERS
+    
+    @staticmethod
+    def supported_extensions() -> List[str]:
+        """
+        Get the file extensions that have a parser, including those of plugins.
+        
+        Returns:
+            List of lowercase extensions with their leading dot
+        """
+        return [f".{extension}" for extension in PARSERS.names()]
+    
+    @staticmethod
+    def register_parser(extension: str, parser_class: Union[type, str]) -> None:
+        """
+        Register the parser of a file extension, replacing any existing one.
+        
+        Args:
+            extension: File extension, with or without the leading dot
+            parser_class: Parser class, taking the input configuration and
+                providing parse(file_path) (and optionally iter_records), or
+                its import path as 'module:ClassName' to import it on first use
+        """
+        PARSERS.register(extension, parser_class)
     
     def get_parser(self, file_path: str) -> Optional[object]:
         """
@@ -35,17 +162,18 @@ class ParserFactory:
         """
         _, ext = os.path.splitext(file_path.lower())
         
-        if ext == '.txt':
-            return TextParser(self.config)
-        elif ext in ['.xlsx', '.xls']:
-            return ExcelParser(self.config)
-        elif ext == '.csv':
-            return CSVParser(self.config)
-        elif ext == '.docx':
-            return WordParser(self.config)
-        else:
+        parser_class = PARSERS.get(ext) if ext else None
+        if parser_class is None:
             print(f"Unsupported file type: {ext}")
             return None
+        
+        # Parsers keep no state between files, so one instance (with its compiled
+        # patterns and mapping plans) serves every file of its type
+        parser = self.parsers.get(parser_class)
+        if parser is None:
+            parser = self.parsers.setdefault(parser_class, parser_class(self.config))
+        
+        return parser
     
     def parse_file(self, file_path: str) -> List[Dict[str, Any]]:
         """
@@ -58,6 +186,196 @@ class ParserFactory:
             List of dictionaries containing extracted data
         """
         parser = self.get_parser(file_path)
-        if parser:
+        if not parser:
+            return []
+        
+        if self.cache is None:
             return parser.parse(file_path)
-        return []
+        
+        key = self.cache.make_key(file_path, parser, self.config, self.content_hashes.get(file_path))
+        data = self.cache.get(key)
+        if data is not None:
+            return data
+        
+        data = parser.parse(file_path)
+        
+        # Parsers report errors by returning no records, so empty results are
+        # not cached to avoid remembering a transient failure
+        if data:
+            self.cache.put(key, data)
+        
+        return data
+    
+    def iter_file(self, file_path: str) -> Iterator[Dict[str, Any]]:
+        """
+        Stream records from a file using the appropriate parser.
+        
+        Parsers that support streaming (such as the CSV parser) yield records
+        as they are read; all others fall back to their parse method.
+        
+        Args:
+            file_path: Path to the file to parse
+            
+        Yields:
+            Dictionaries containing extracted data
+        """
+        parser = self.get_parser(file_path)
+        if not parser:
+            return
+        
+        if not hasattr(parser, 'iter_records'):
+            yield from parser.parse(file_path)
+            return
+        
+        try:
+            yield from parser.iter_records(file_path)
+        except Exception as e:
+            print(f"Error parsing file {file_path}: {str(e)}")
+    
+    def iter_file_chunks(self, file_paths: List[str]) -> Iterator[Any]:
+        """
+        Stream the records of several files in chunks, in the order of file_paths.
+        
+        Parsers that read files as DataFrames (the CSV and Excel parsers) yield
+        their frames as they are read, so that the records can be processed a
+        column at a time; the records of other files are yielded as one iterable
+        per file. The cache is not used, as it holds records rather than frames.
+        
+        Args:
+            file_paths: Paths of the files to parse
+            
+        Yields:
+            DataFrames, or iterables of dictionaries containing extracted data
+        """
+        for file_path in file_paths:
+            parser = self.get_parser(file_path)
+            if not parser:
+                continue
+            
+            if not hasattr(parser, 'iter_frames'):
+                yield self.iter_file(file_path)
+                continue
+            
+            try:
+                yield from parser.iter_frames(file_path)
+            except Exception as e:
+                print(f"Error parsing file {file_path}: {str(e)}")
+    
+    def iter_files(self, file_paths: List[str], workers: int = 1) -> Iterator[Dict[str, Any]]:
+        """
+        Stream the records of several files, in the order of file_paths.
+        
+        Without worker processes or a cache, files are streamed record by record
+        through iter_file. Otherwise the records of each file are parsed as a
+        whole by parse_files.
+        
+        Args:
+            file_paths: Paths of the files to parse
+            workers: Number of worker processes (1 parses in this process)
+            
+        Yields:
+            Dictionaries containing extracted data
+        """
+        if workers <= 1 and self.cache is None:
+            for file_path in file_paths:
+                yield from self.iter_file(file_path)
+            return
+        
+        for _, data in self.parse_files(file_paths, workers):
+            yield from data
+    
+    def create_executor(self, workers: int, mp_context: Optional[Any] = None) -> ProcessPoolExecutor:
+        """
+        Create a pool of worker processes, each with a parser factory of this configuration.
+        
+        A pool passed to parse_files can be reused for several calls, so that
+        long-running callers start the workers and load the parsers once.
+        
+        Args:
+            workers: Number of worker processes
+            mp_context: multiprocessing context the workers are started with, or None
+                for the default one; multithreaded callers must use a 'forkserver' or
+                'spawn' context, as forking a process while other threads hold locks
+                can deadlock the child
+            
+        Returns:
+            Process pool executor, to be shut down by the caller
+        """
+        return ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=mp_context,
+            initializer=_init_worker,
+            initargs=(self.config, self.cache, self.content_hashes)
+        )
+    
+    def parse_files(
+        self,
+        file_paths: List[str],
+        workers: int = 1,
+        executor: Optional[ProcessPoolExecutor] = None,
+        mp_context: Optional[Any] = None
+    ) -> Iterator[Tuple[str, List[Dict[str, Any]]]]:
+        """
+        Parse several files, optionally spread across a pool of worker processes.
+        
+        Results are yielded in the order of file_paths whatever the number of
+        workers. At most PENDING_FILES_PER_WORKER files per worker are submitted
+        ahead of the result being yielded, and the next file is submitted as each
+        result is taken, so a slow consumer holds back parsing instead of the
+        records of every file piling up. A file that fails to parse is reported
+        and yields no records instead of stopping the batch.
+        
+        Args:
+            file_paths: Paths of the files to parse
+            workers: Number of worker processes (1 parses in this process)
+            executor: Pool created by create_executor to parse the files in,
+                left running; without it, a pool is started for this call
+            mp_context: multiprocessing context of the pool started for this call
+                (see create_executor)
+            
+        Yields:
+            Tuples of file path and the list of dictionaries extracted from it
+        """
+        if workers <= 1 or (executor is None and len(file_paths) <= 1):
+            for file_path in file_paths:
+                yield file_path, self.parse_file(file_path)
+            return
+        
+        if executor is not None:
+            yield from self._parse_in_pool(executor, file_paths, workers)
+            return
+        
+        with self.create_executor(min(workers, len(file_paths)), mp_context) as executor:
+            yield from self._parse_in_pool(executor, file_paths, workers)
+    
+    def _parse_in_pool(
+        self,
+        executor: ProcessPoolExecutor,
+        file_paths: List[str],
+        workers: int
+    ) -> Iterator[Tuple[str, List[Dict[str, Any]]]]:
+        """Parse files in a pool of worker processes, keeping a bounded number of them submitted ahead."""
+        remaining = iter(file_paths)
+        pending = deque()
+        
+        for file_path in remaining:
+            pending.append((file_path, executor.submit(_parse_in_worker, file_path)))
+            if len(pending) >= workers * PENDING_FILES_PER_WORKER:
+                break
+        
+        while pending:
+            file_path, future = pending.popleft()
+            try:
+                data, error = future.result()
+            except Exception as e:
+                data, error = [], str(e)
+            
+            # Keep the window full while this result is consumed
+            next_path = next(remaining, None)
+            if next_path is not None:
+                pending.append((next_path, executor.submit(_parse_in_worker, next_path)))
+            
+            if error:
+                print(f"Error parsing file {file_path}: {error}")
+            
+            yield file_path, data
@@ -0,0 +1,333 @@
+"""
+Pattern matcher module.
+Compiles the text patterns defined in the configuration once and matches them in a single pass.
+"""
+import re
+from typing import Dict, Iterable, Iterator, List, Any, Optional, Tuple
+
+try:
+    from re import _parser as sre_parse
+except ImportError:
+    # Python < 3.11
+    import sre_parse
+
+
+# Patterns using backreferences cannot be merged, as their group numbers shift
+BACKREFERENCE = re.compile(r'\\[1-9]|\(\?P=')
+
+# Regex nodes that only contain other nodes, with a function returning their node lists
+CONTAINER_NODES = {
+    sre_parse.MAX_REPEAT: lambda value: [value[2]],
+    sre_parse.MIN_REPEAT: lambda value: [value[2]],
+    sre_parse.BRANCH: lambda value: value[1],
+    sre_parse.ASSERT: lambda value: [value[1]],
+    sre_parse.ASSERT_NOT: lambda value: [value[1]],
+    sre_parse.GROUPREF_EXISTS: lambda value: [nodes for nodes in value[1:] if nodes],
+}
+if hasattr(sre_parse, 'POSSESSIVE_REPEAT'):
+    # Python 3.11 and later
+    CONTAINER_NODES[sre_parse.POSSESSIVE_REPEAT] = lambda value: [value[2]]
+    CONTAINER_NODES[sre_parse.ATOMIC_GROUP] = lambda value: [value]
+
+# Character classes that match a line break
+LINE_BREAK_CATEGORIES = {sre_parse.CATEGORY_SPACE, sre_parse.CATEGORY_NOT_DIGIT, sre_parse.CATEGORY_NOT_WORD}
+
+
+def matches_within_line(regex: 're.Pattern') -> bool:
+    """
+    Check whether a regex finds the same matches in a text as in each of its lines.
+    
+    This holds when no match can contain a line break or be empty, and the
+    regex uses no anchors tied to the start or end of the whole text (^ and $
+    without the MULTILINE flag, \\A and \\Z).
+    
+    Args:
+        regex: Compiled regular expression
+        
+    Returns:
+        True if the text can be matched line by line
+    """
+    try:
+        nodes = sre_parse.parse(regex.pattern, regex.flags)
+    except Exception:
+        return False
+    
+    # Empty matches could also be found at the end of every line
+    if nodes.getwidth()[0] == 0:
+        return False
+    
+    return _nodes_within_line(nodes, regex.flags)
+
+
+def _nodes_within_line(nodes: Iterable[Tuple[Any, Any]], flags: int) -> bool:
+    """Check a list of parsed regex nodes for line breaks and whole-text anchors; unknown nodes fail."""
+    for op, value in nodes:
+        if op == sre_parse.LITERAL:
+            if value == ord('\n'):
+                return False
+        elif op == sre_parse.NOT_LITERAL:
+            if value != ord('\n'):
+                return False
+        elif op == sre_parse.ANY:
+            if flags & re.DOTALL:
+                return False
+        elif op == sre_parse.IN:
+            if _set_matches_line_break(value):
+                return False
+        elif op == sre_parse.AT:
+            if value in (sre_parse.AT_BEGINNING_STRING, sre_parse.AT_END_STRING):
+                return False
+            if value in (sre_parse.AT_BEGINNING, sre_parse.AT_END) and not flags & re.MULTILINE:
+                return False
+        elif op == sre_parse.SUBPATTERN:
+            _, add_flags, del_flags, group_nodes = value
+            if not _nodes_within_line(group_nodes, (flags | add_flags) & ~del_flags):
+                return False
+        elif op in CONTAINER_NODES:
+            if not all(_nodes_within_line(child, flags) for child in CONTAINER_NODES[op](value)):
+                return False
+        elif op != sre_parse.GROUPREF:
+            return False
+    
+    return True
+
+
+def _set_matches_line_break(items: List[Tuple[Any, Any]]) -> bool:
+    """Check whether a parsed character set matches a line break."""
+    negate = False
+    matches = False
+    
+    for op, value in items:
+        if op == sre_parse.NEGATE:
+            negate = True
+        elif op == sre_parse.LITERAL:
+            matches = matches or value == ord('\n')
+        elif op == sre_parse.RANGE:
+            matches = matches or value[0] <= ord('\n') <= value[1]
+        elif op == sre_parse.CATEGORY:
+            matches = matches or value in LINE_BREAK_CATEGORIES
+        else:
+            # Unknown set item; assume the worst
+            return True
+    
+    return matches != negate
+
+
+class PatternRule:
+    """A single compiled text pattern."""
+    
+    def __init__(self, name: str, regex: 're.Pattern', group: Any, value_type: str):
+        """
+        Initialize the pattern rule.
+        
+        Args:
+            name: Field name for the extracted data
+            regex: Compiled regular expression
+            group: Capture group (number or name) holding the value
+            value_type: Data type conversion ('str', 'int' or 'float')
+        """
+        self.name = name
+        self.regex = regex
+        self.group = group
+        self.value_type = value_type
+    
+    def convert(self, match: 're.Match', group: Any) -> Any:
+        """
+        Get the value of a match converted to the rule's type.
+        
+        Args:
+            match: Match object containing the value
+            group: Group of the match object holding the value
+            
+        Returns:
+            Converted value
+            
+        Raises:
+            IndexError: If the group does not exist
+            ValueError: If the value cannot be converted
+        """
+        value = match.group(group)
+        
+        if self.value_type == 'int':
+            value = int(value)
+        elif self.value_type == 'float':
+            value = float(value)
+        
+        return value
+
+
+class PatternMatcher:
+    """Matcher that extracts every configured text pattern from content."""
+    
+    def __init__(self, patterns: List[Dict[str, Any]], single_pass: bool = False):
+        """
+        Compile the configured text patterns.
+        
+        Args:
+            patterns: List of text pattern configurations
+            single_pass: Whether to merge the patterns into one alternation. The
+                alternation consumes the text it matches, so a pattern matching
+                text that overlaps the match of another pattern (such as two
+                fields on one line when the first pattern ends with '.*') is
+                missed; only enable it for patterns whose matches never overlap
+        """
+        self.rules = []
+        
+        for pattern_config in patterns:
+            name = pattern_config.get('name')
+            pattern = pattern_config.get('pattern')
+            
+            if not name or not pattern:
+                continue
+            
+            try:
+                regex = re.compile(pattern)
+            except re.error as e:
+                print(f"Invalid pattern for '{name}': {str(e)}")
+                continue
+            
+            self.rules.append(PatternRule(
+                name,
+                regex,
+                pattern_config.get('group', 1),
+                pattern_config.get('type', 'str')
+            ))
+        
+        # Whether the content can be searched line by line with the same results
+        self.line_safe = all(matches_within_line(rule.regex) for rule in self.rules)
+        
+        self.combined = None
+        self.group_table = []
+        if single_pass:
+            self._combine()
+    
+    def _combine(self) -> None:
+        """
+        Merge all rules into one regex alternation.
+        
+        The rules are joined without wrapping capture groups, which would stop
+        the regex engine from skipping ahead to positions where a rule can start.
+        The rule behind a match is looked up from the index of its last closed group.
+        
+        Falls back to matching the rules one by one when they cannot be merged
+        safely: when there are fewer than two rules, a rule uses backreferences
+        or can match the empty string, or the merged regex does not compile.
+        """
+        if len(self.rules) < 2:
+            return
+        
+        # Entry i holds the rule owning group i of the merged regex and the
+        # merged group that holds the rule's value
+        group_table = [None]
+        
+        for rule in self.rules:
+            if BACKREFERENCE.search(rule.regex.pattern) or rule.regex.match(''):
+                return
+            
+            # Numbered groups of the rule are shifted by the groups of the rules before it
+            group = rule.group
+            if isinstance(group, int) and group > 0:
+                group = len(group_table) + group - 1 if group <= rule.regex.groups else None
+            
+            group_table.extend([(rule, group)] * rule.regex.groups)
+        
+        try:
+            self.combined = re.compile('|'.join(f'(?:{rule.regex.pattern})' for rule in self.rules))
+        except re.error:
+            return
+        
+        self.group_table = group_table
+    
+    def _rematch(self, content: str, position: int) -> Tuple[Optional[PatternRule], Optional['re.Match']]:
+        """
+        Find the rule behind a merged match in which no capture group took part.
+        
+        Args:
+            content: Text being searched
+            position: Start position of the merged match
+            
+        Returns:
+            Tuple of the rule and its own match, or (None, None)
+        """
+        # The alternation picks the first rule that matches, so do the same
+        for rule in self.rules:
+            rule_match = rule.regex.match(content, position)
+            if rule_match:
+                return rule, rule_match
+        
+        return None, None
+    
+    def iter_matches(self, content: str) -> Iterator[Tuple[str, Any]]:
+        """
+        Find every pattern match in the content.
+        
+        Args:
+            content: Text to search
+            
+        Yields:
+            Tuples of field name and converted value, in the order they should be applied
+        """
+        if self.combined is None:
+            for rule in self.rules:
+                for match in rule.regex.finditer(content):
+                    try:
+                        yield rule.name, rule.convert(match, rule.group)
+                    except (IndexError, ValueError):
+                        continue
+            return
+        
+        group_table = self.group_table
+        
+        for match in self.combined.finditer(content):
+            index = match.lastindex
+            if index is None:
+                rule, match = self._rematch(content, match.start())
+                group = rule.group if rule else None
+            else:
+                rule, group = group_table[index]
+            
+            if group is None:
+                continue
+            
+            try:
+                yield rule.name, rule.convert(match, group)
+            except (IndexError, ValueError):
+                continue
+    
+    def extract(self, segments: Iterable[str]) -> Dict[str, Any]:
+        """
+        Extract a record from content given as consecutive segments.
+        
+        The content can be passed whole or, when line_safe is set, as its
+        individual lines. Both give the same record.
+        
+        Args:
+            segments: Consecutive pieces of the text to search
+            
+        Returns:
+            Dictionary mapping field names to their extracted values
+        """
+        record = {}
+        
+        if self.combined is not None:
+            for segment in segments:
+                for name, value in self.iter_matches(segment):
+                    record[name] = value
+            return record
+        
+        # Keep the last value of each rule and apply them in rule order, as a
+        # full scan per rule would, whatever the segments are
+        last_values = {}
+        
+        for segment in segments:
+            for index, rule in enumerate(self.rules):
+                for match in rule.regex.finditer(segment):
+                    try:
+                        last_values[index] = rule.convert(match, rule.group)
+                    except (IndexError, ValueError):
+                        continue
+        
+        for index in sorted(last_values):
+            record[self.rules[index].name] = last_values[index]
+        
+        return record
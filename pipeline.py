@@ -0,0 +1,630 @@
+"""
+Pipeline module for the Text Extractor tool.
+Streams records from the parsers through the data processor to the exporters in batches.
+"""
+import os
+import gc
+import pickle
+import queue
+import threading
+import multiprocessing
+from multiprocessing import resource_tracker, shared_memory
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Any, Optional, Tuple
+
+from .parser.parser_factory import ParserFactory
+from .parser.extraction_cache import ExtractionCache
+from .utils.data_processor import DataProcessor
+from .utils.plugin_registry import PluginRegistry
+
+
+# Exporter classes by export format name. Exporter modules are imported the first
+# time their format is requested; other packages add formats through the entry point group.
+EXPORTERS = PluginRegistry('text_extractor.exporters', {
+    'excel': '.exporters.excel_exporter:ExcelExporter',
+    'word': '.exporters.word_exporter:WordExporter',
+    'text': '.exporters.text_exporter:TextExporter',
+    'parquet': '.exporters.parquet_exporter:ParquetExporter',
+    'arrow': '.exporters.arrow_exporter:ArrowExporter',
+}, package=__package__)
+
+# Export formats used for "all"; Parquet and Arrow need the optional pyarrow package
+DEFAULT_FORMATS = ['excel', 'word', 'text']
+
+# Number of records handed to the exporters at a time
+DEFAULT_BATCH_SIZE = 1000
+
+# Export formats whose exporter runs in a process of its own when exporting concurrently;
+# they build their documents in pure Python and would hold the GIL. The others run in threads.
+PROCESS_FORMATS = {'excel', 'word'}
+
+# Maximum number of batches waiting to be written by each concurrent exporter
+MAX_PENDING_BATCHES = 4
+
+# Seconds between checks that an exporter process is still running while waiting for it
+WORKER_POLL_INTERVAL = 1.0
+
+
+def iter_extracted(
+    input_files: List[str],
+    config: Dict[str, Any],
+    workers: int = 1,
+    cache: Optional[ExtractionCache] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Stream the records extracted from the input files, in input file order.
+    
+    Args:
+        input_files: List of input file paths
+        config: Input configuration
+        workers: Number of worker processes used to parse the files
+        cache: Extraction cache used to skip files parsed before, if any
+        
+    Yields:
+        Dictionaries containing extracted data
+    """
+    parser_factory = ParserFactory(config, cache)
+    yield from parser_factory.iter_files(input_files, workers)
+
+
+def iter_structured(records: Iterable[Dict[str, Any]], output_config: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """
+    Structure extracted records lazily according to the output configuration.
+    
+    Values are left unformatted: export_stream applies the format strings of
+    the fields for the exporters that show formatted values (see ExportFormatter).
+    
+    Args:
+        records: Dictionaries containing extracted data
+        output_config: Output configuration
+        
+    Yields:
+        Dictionaries containing structured data
+    """
+    processor = DataProcessor(output_config, format_values=False)
+    yield from processor.iter_process(records)
+
+
+def iter_structured_files(
+    input_files: List[str],
+    input_config: Dict[str, Any],
+    output_config: Dict[str, Any],
+    workers: int = 1,
+    cache: Optional[ExtractionCache] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Stream the structured records of the input files, in input file order.
+    
+    Without worker processes or a cache, the frames read by the CSV and Excel
+    parsers are structured a column at a time by the data processor; otherwise
+    the extracted records are structured one at a time. Both give the same
+    records, with values left unformatted as by iter_structured.
+    
+    Args:
+        input_files: List of input file paths
+        input_config: Input configuration
+        output_config: Output configuration
+        workers: Number of worker processes used to parse the files
+        cache: Extraction cache used to skip files parsed before, if any
+        
+    Yields:
+        Dictionaries containing structured data
+    """
+    if workers > 1 or cache is not None:
+        yield from iter_structured(iter_extracted(input_files, input_config, workers, cache), output_config)
+        return
+    
+    parser_factory = ParserFactory(input_config)
+    processor = DataProcessor(output_config, format_values=False)
+    yield from processor.iter_process_chunks(parser_factory.iter_file_chunks(input_files))
+
+
+def iter_batches(records: Iterable[Dict[str, Any]], batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Group records into lists of at most batch_size records.
+    
+    Args:
+        records: Dictionaries to group
+        batch_size: Maximum number of records per batch
+        
+    Yields:
+        Lists of records
+    """
+    records = iter(records)
+    
+    while True:
+        batch = list(islice(records, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+def create_exporters(formats: List[str], output_config: Dict[str, Any], export_config: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Create the exporters of the requested formats.
+    
+    Args:
+        formats: List of export formats; unknown formats are ignored
+        output_config: Output configuration
+        export_config: Export configuration
+        
+    Returns:
+        Dictionary mapping format names to exporters, in EXPORTERS order
+    """
+    # Combine configurations for exporters
+    combined_config = {
+        **output_config,
+        **export_config
+    }
+    
+    # Only the modules of the requested formats are imported, and entry points
+    # are only looked up for formats that are not built in
+    exporter_classes = {EXPORTERS.normalize(format_name): EXPORTERS.get(format_name) for format_name in formats}
+    
+    return {
+        format_name: exporter_classes[format_name](combined_config)
+        for format_name in EXPORTERS.names(discover=False) if exporter_classes.get(format_name)
+    }
+
+
+def register_exporter(format_name: str, exporter_class: Any) -> None:
+    """
+    Register the exporter of an export format, replacing any existing one.
+    
+    Args:
+        format_name: Export format name, as given to create_exporters
+        exporter_class: Exporter class, taking the combined output and export
+            configuration and providing open(output_dir), write(batch) and
+            close() returning the output file path, or its import path as
+            'module:ClassName' to import it on first use
+    """
+    EXPORTERS.register(format_name, exporter_class)
+
+
+class ExportFormatter:
+    """Formatting of the batches of structured records given to each exporter."""
+    
+    def __init__(self, exporters: Dict[str, Any], output_config: Dict[str, Any]):
+        """
+        Args:
+            exporters: Dictionary mapping format names to exporters. Exporters
+                whose FORMATTED_VALUES attribute is False (those writing typed
+                columns) get the values before formatting; the others get the
+                values formatted by the format strings of the output structure.
+            output_config: Output configuration
+        """
+        self.processor = DataProcessor(output_config)
+        self.exporters = exporters
+        self.formatted_formats = {
+            format_name for format_name, exporter in exporters.items()
+            if getattr(exporter, 'FORMATTED_VALUES', True)
+        }
+    
+    def batches(self, batch: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Get the batch to give each exporter, formatting the records once for all exporters that need it.
+        
+        Args:
+            batch: Structured records, not formatted
+            
+        Returns:
+            Dictionary mapping format names to the records for their exporter
+        """
+        formatted = self.processor.format_batch(batch) if self.formatted_formats else batch
+        return {
+            format_name: formatted if format_name in self.formatted_formats else batch
+            for format_name in self.exporters
+        }
+    
+    def report(self) -> None:
+        """Print one warning per field for the values that could not be formatted."""
+        self.processor.report()
+
+
+def export_stream(
+    records: Iterable[Dict[str, Any]],
+    output_dir: str,
+    formats: List[str],
+    output_config: Dict[str, Any],
+    export_config: Dict[str, Any],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    concurrent: bool = False,
+    start_method: Optional[str] = None
+) -> Tuple[Dict[str, str], int]:
+    """
+    Export a stream of records to every requested format in a single pass.
+    
+    Records are consumed batch by batch and each batch is written to all
+    exporters before the next one is read, so memory use depends on the
+    batch size rather than on the total number of records. Values are
+    formatted by ExportFormatter for the exporters that show formatted values.
+    
+    Args:
+        records: Dictionaries containing structured data
+        output_dir: Output directory path
+        formats: List of export formats
+        output_config: Output configuration
+        export_config: Export configuration
+        batch_size: Number of records written at a time
+        concurrent: Run the exporters concurrently (see export_concurrently) if
+            more than one CPU is available
+        start_method: multiprocessing start method of the exporter processes
+            when exporting concurrently (default: the platform's default)
+        
+    Returns:
+        Tuple of the dictionary mapping format names to output file paths
+        and the number of records exported
+    """
+    exporters = create_exporters(formats, output_config, export_config)
+    
+    if concurrent and len(exporters) > 1 and available_cpus() > 1:
+        return export_concurrently(records, output_dir, exporters, batch_size, start_method, output_config)
+    
+    formatter = ExportFormatter(exporters, output_config)
+    for exporter in exporters.values():
+        exporter.open(output_dir)
+    
+    count = 0
+    try:
+        for batch in iter_batches(records, batch_size):
+            batches = formatter.batches(batch)
+            for format_name, exporter in exporters.items():
+                exporter.write(batches[format_name])
+            count += len(batch)
+    finally:
+        # Close the exporters even if reading the records failed
+        results = {format_name: exporter.close() for format_name, exporter in exporters.items()}
+    
+    formatter.report()
+    return results, count
+
+
+def available_cpus() -> int:
+    """
+    Get the number of CPUs this process may run on.
+    
+    Returns:
+        Number of usable CPUs
+    """
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    
+    return os.cpu_count() or 1
+
+
+def export_concurrently(
+    records: Iterable[Dict[str, Any]],
+    output_dir: str,
+    exporters: Dict[str, Any],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    start_method: Optional[str] = None,
+    output_config: Optional[Dict[str, Any]] = None
+) -> Tuple[Dict[str, str], int]:
+    """
+    Export a stream of records with every exporter running concurrently.
+    
+    The exporters of PROCESS_FORMATS run in processes of their own, the others
+    in threads, so the export takes about as long as the slowest exporter
+    rather than the sum of all of them. Threads receive the batches
+    themselves. For the processes, each batch is pickled once into a block of
+    shared memory that every exporter process reads, and the block is freed
+    once all of them have read it. At most MAX_PENDING_BATCHES batches wait
+    for each exporter, which holds back the reading of records while the
+    slowest exporter catches up.
+    
+    Args:
+        records: Dictionaries containing structured data
+        output_dir: Output directory path
+        exporters: Dictionary mapping format names to exporters, as created by create_exporters
+        batch_size: Number of records written at a time
+        start_method: multiprocessing start method of the exporter processes;
+            multithreaded callers must use 'forkserver' or 'spawn', as forking
+            a process while other threads hold locks can deadlock the child
+        output_config: Output configuration whose format strings are applied
+            as by export_stream; without it, records are exported as they are
+        
+    Returns:
+        Tuple of the dictionary mapping format names to output file paths
+        and the number of records exported
+    """
+    context = multiprocessing.get_context(start_method)
+    events = context.Queue()
+    process_workers = {}
+    thread_workers = {}
+    
+    # The exporter processes must share this process's tracker of shared memory blocks,
+    # or their own trackers would report the blocks they read as leaked
+    if any(format_name in PROCESS_FORMATS for format_name in exporters):
+        resource_tracker.ensure_running()
+    
+    # Processes are started first, before this process runs any exporter thread
+    for format_name, exporter in exporters.items():
+        if format_name in PROCESS_FORMATS:
+            batches = context.Queue(MAX_PENDING_BATCHES)
+            process = context.Process(
+                target=_run_exporter_process,
+                args=(format_name, exporter, output_dir, batches, events),
+                daemon=True
+            )
+            
+            # Forked processes would otherwise have their garbage collector scan, and copy,
+            # every object inherited from this process
+            gc.freeze()
+            try:
+                process.start()
+            finally:
+                gc.unfreeze()
+            process_workers[format_name] = (process, batches)
+    
+    for format_name, exporter in exporters.items():
+        if format_name not in PROCESS_FORMATS:
+            batches = queue.Queue(MAX_PENDING_BATCHES)
+            worker = _ExporterThread(format_name, exporter, output_dir, batches)
+            worker.start()
+            thread_workers[format_name] = (worker, batches)
+    
+    formatter = ExportFormatter(exporters, output_config or {})
+    shared_batches = _SharedBatches(events)
+    count = 0
+    
+    try:
+        for batch in iter_batches(records, batch_size):
+            exporter_batches = formatter.batches(batch)
+            
+            if process_workers:
+                # Exporters given the same records read the same block; exporter processes
+                # that failed or ended are no longer given batches
+                readers = {}
+                for format_name in shared_batches.readers(process_workers):
+                    readers.setdefault(id(exporter_batches[format_name]), []).append(format_name)
+                
+                for format_names in readers.values():
+                    block = shared_batches.share(exporter_batches[format_names[0]], format_names)
+                    for format_name in format_names:
+                        process, batches = process_workers[format_name]
+                        _put_batch(batches, block, process)
+                shared_batches.release()
+            
+            for format_name, (worker, batches) in thread_workers.items():
+                batches.put(exporter_batches[format_name])
+            
+            count += len(batch)
+    finally:
+        # Let the exporters finish and close even if reading the records failed
+        for process, batches in process_workers.values():
+            _put_batch(batches, None, process)
+        for worker, batches in thread_workers.values():
+            batches.put(None)
+        
+        results = shared_batches.wait_results(process_workers)
+        for format_name, (worker, batches) in thread_workers.items():
+            worker.join()
+            results[format_name] = worker.result
+        
+        for process, batches in process_workers.values():
+            process.join()
+        shared_batches.close()
+    
+    formatter.report()
+    
+    # Report the results in EXPORTERS order, as export_stream does
+    return {format_name: results.get(format_name, "") for format_name in exporters}, count
+
+
+class _ExporterThread(threading.Thread):
+    """Thread running an exporter on the batches of a queue, until it gets None."""
+    
+    def __init__(self, format_name: str, exporter: Any, output_dir: str, batches: queue.Queue):
+        super().__init__(daemon=True)
+        self.format_name = format_name
+        self.exporter = exporter
+        self.output_dir = output_dir
+        self.batches = batches
+        self.result = ""
+    
+    def run(self) -> None:
+        try:
+            self.exporter.open(self.output_dir)
+            for batch in iter(self.batches.get, None):
+                self.exporter.write(batch)
+        except Exception as e:
+            print(f"Error exporting to {self.format_name}: {str(e)}")
+            
+            # Keep taking the batches until the end, or the producer would block on the full queue
+            for _ in iter(self.batches.get, None):
+                pass
+            
+            try:
+                self.exporter.close()
+            except Exception:
+                pass
+            return
+        
+        try:
+            self.result = self.exporter.close()
+        except Exception as e:
+            print(f"Error exporting to {self.format_name}: {str(e)}")
+
+
+class _SharedBatches:
+    """Batches of records shared with the exporter processes through shared memory."""
+    
+    def __init__(self, events: Any):
+        """
+        Args:
+            events: Queue on which the exporter processes report read batches and results
+        """
+        self.events = events
+        
+        # Shared memory blocks by name, with the formats of the processes yet to read them
+        self.blocks = {}
+        self.results = {}
+    
+    def share(self, batch: List[Dict[str, Any]], readers: List[str]) -> Tuple[str, int]:
+        """
+        Copy a batch into a new block of shared memory.
+        
+        Args:
+            batch: Records to share
+            readers: Format names of the exporter processes reading the batch
+            
+        Returns:
+            Name of the block and size of the pickled batch in it
+        """
+        data = pickle.dumps(batch, protocol=pickle.HIGHEST_PROTOCOL)
+        block = shared_memory.SharedMemory(create=True, size=len(data))
+        block.buf[:len(data)] = data
+        self.blocks[block.name] = [block, set(readers)]
+        return block.name, len(data)
+    
+    def release(self, timeout: Optional[float] = None) -> bool:
+        """
+        Handle the events reported by the exporter processes, freeing the blocks read by all of them.
+        
+        Args:
+            timeout: Seconds to wait for a first event, or None to only handle pending events
+            
+        Returns:
+            Whether any event was handled
+        """
+        handled = False
+        
+        while True:
+            try:
+                if timeout is None or handled:
+                    event = self.events.get_nowait()
+                else:
+                    event = self.events.get(timeout=timeout)
+            except queue.Empty:
+                return handled
+            
+            handled = True
+            kind, name, value = event
+            
+            if kind == 'read':
+                entry = self.blocks.get(name)
+                if entry is not None:
+                    entry[1].discard(value)
+                    if not entry[1]:
+                        self._free(name)
+            else:
+                # A process reports its result once done with the batches, or at once when
+                # its exporter failed; the blocks it has not read are no longer waited for
+                self.results[name] = value
+                self._drop(name)
+    
+    def readers(self, process_workers: Dict[str, Tuple[Any, Any]]) -> List[str]:
+        """
+        Get the format names of the exporter processes still reading batches.
+        
+        Processes that reported a result or ended are left out, and the blocks
+        they have not read are freed once the other processes have read them.
+        
+        Args:
+            process_workers: Dictionary mapping format names to exporter processes and their queues
+            
+        Returns:
+            List of format names
+        """
+        readers = []
+        
+        for format_name, (process, batches) in process_workers.items():
+            if format_name not in self.results and not process.is_alive():
+                # Pick up a result sent just before the process ended
+                self.release()
+                if format_name not in self.results:
+                    print(f"Error exporting to {format_name}: exporter process ended unexpectedly")
+                    self.results[format_name] = ""
+                    self._drop(format_name)
+                    batches.cancel_join_thread()
+            
+            if format_name not in self.results:
+                readers.append(format_name)
+        
+        return readers
+    
+    def wait_results(self, process_workers: Dict[str, Tuple[Any, Any]]) -> Dict[str, str]:
+        """
+        Wait for the results of the exporter processes.
+        
+        Args:
+            process_workers: Dictionary mapping format names to exporter processes and their queues
+            
+        Returns:
+            Dictionary mapping format names to output file paths
+        """
+        while self.readers(process_workers):
+            self.release(WORKER_POLL_INTERVAL)
+        
+        return dict(self.results)
+    
+    def close(self) -> None:
+        """Free all remaining blocks."""
+        for name in list(self.blocks):
+            self._free(name)
+    
+    def _drop(self, format_name: str) -> None:
+        """Stop waiting for an exporter process to read the blocks, freeing those no other process reads."""
+        for name, (block, readers) in list(self.blocks.items()):
+            readers.discard(format_name)
+            if not readers:
+                self._free(name)
+    
+    def _free(self, name: str) -> None:
+        block = self.blocks.pop(name)[0]
+        block.close()
+        block.unlink()
+
+
+def _put_batch(batches: Any, item: Any, process: Any) -> None:
+    """Queue an item for an exporter process, unless the process has ended."""
+    while process.is_alive():
+        try:
+            batches.put(item, timeout=WORKER_POLL_INTERVAL)
+            return
+        except queue.Full:
+            continue
+
+
+def _run_exporter_process(format_name: str, exporter: Any, output_dir: str, batches: Any, events: Any) -> None:
+    """
+    Run an exporter on the shared batches of a queue, until it gets None.
+    
+    Args:
+        format_name: Export format name
+        exporter: Exporter to run
+        output_dir: Output directory path
+        batches: Queue of shared memory block names and sizes
+        events: Queue on which read batches and the result are reported
+    """
+    try:
+        exporter.open(output_dir)
+        for name, size in iter(batches.get, None):
+            block = shared_memory.SharedMemory(name=name)
+            try:
+                batch = pickle.loads(block.buf[:size])
+            finally:
+                block.close()
+            events.put(('read', name, format_name))
+            
+            exporter.write(batch)
+    except Exception as e:
+        print(f"Error exporting to {format_name}: {str(e)}")
+        try:
+            exporter.close()
+        except Exception:
+            pass
+        
+        # Report the failure at once, so that no more batches are shared with this process,
+        # and keep taking the queued ones until the end, or the producer would block on the full queue
+        events.put(('result', format_name, ""))
+        for _ in iter(batches.get, None):
+            pass
+        return
+    
+    try:
+        result = exporter.close()
+    except Exception as e:
+        print(f"Error exporting to {format_name}: {str(e)}")
+        result = ""
+    events.put(('result', format_name, result))
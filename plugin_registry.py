@@ -0,0 +1,160 @@
+"""
+Plugin registry module.
+Maps names to parser or exporter classes that are imported the first time they are needed.
+"""
+import importlib
+from typing import Dict, List, Optional, Union
+
+
+class PluginRegistry:
+    """Registry of plugin classes by name, imported lazily and extensible through entry points."""
+    
+    def __init__(self, entry_point_group: str, builtins: Dict[str, str], package: Optional[str] = None):
+        """
+        Initialize the registry.
+        
+        Args:
+            entry_point_group: Entry point group under which installed packages
+                register plugins, the entry point name being the plugin name
+            builtins: Import paths of the built-in plugins by name, written as
+                'module:ClassName'; built-in plugins take precedence over
+                entry points of the same name
+            package: Package that relative module names are resolved against
+        """
+        self.entry_point_group = entry_point_group
+        self.package = package
+        
+        # Import paths, entry points or classes by plugin name, in registration order
+        self._plugins: Dict[str, object] = {}
+        self._classes: Dict[str, type] = {}
+        self._discovered = False
+        
+        for name, import_path in builtins.items():
+            self.register(name, import_path)
+    
+    @staticmethod
+    def normalize(name: str) -> str:
+        """
+        Normalize a plugin name, so that '.TXT' and 'txt' name the same plugin.
+        
+        Args:
+            name: Plugin name, such as a file extension or an export format
+            
+        Returns:
+            Lowercase name without a leading dot
+        """
+        return name.lower().lstrip('.')
+    
+    def register(self, name: str, plugin: Union[type, str]) -> None:
+        """
+        Register a plugin, replacing any plugin of the same name.
+        
+        Args:
+            name: Plugin name
+            plugin: Plugin class, or its import path as 'module:ClassName'
+                to import it when it is first needed
+        """
+        name = self.normalize(name)
+        self._plugins[name] = plugin
+        self._classes.pop(name, None)
+    
+    def __contains__(self, name: str) -> bool:
+        """Check whether a plugin is registered, looking up entry points only for unknown names."""
+        name = self.normalize(name)
+        
+        if name not in self._plugins:
+            self.discover()
+        return name in self._plugins
+    
+    def get(self, name: str) -> Optional[type]:
+        """
+        Get the class of a plugin, importing its module if needed.
+        
+        Entry points are only looked up when a name is not registered, so
+        lookups of built-in plugins never scan the installed packages.
+        
+        Args:
+            name: Plugin name
+            
+        Returns:
+            Plugin class, or None if no plugin has that name or its module
+            cannot be imported
+        """
+        name = self.normalize(name)
+        
+        plugin_class = self._classes.get(name)
+        if plugin_class is not None:
+            return plugin_class
+        
+        if name not in self._plugins:
+            self.discover()
+        
+        plugin = self._plugins.get(name)
+        if plugin is None:
+            return None
+        
+        try:
+            plugin_class = self._load(plugin)
+        except Exception as e:
+            # Typically a missing optional dependency of the plugin; it is dropped
+            # so that the error is reported once
+            print(f"Error loading plugin '{name}' ({self.entry_point_group}): {str(e)}")
+            del self._plugins[name]
+            return None
+        
+        self._classes[name] = plugin_class
+        return plugin_class
+    
+    def names(self, discover: bool = True) -> List[str]:
+        """
+        Get the names of the registered plugins.
+        
+        Args:
+            discover: Whether to look up entry points first; otherwise only the
+                plugins registered so far are listed
+                
+        Returns:
+            Plugin names in registration order, built-in plugins first
+        """
+        if discover:
+            self.discover()
+        return list(self._plugins)
+    
+    def discover(self) -> None:
+        """Register the plugins of the installed packages' entry points, once."""
+        if self._discovered:
+            return
+        self._discovered = True
+        
+        # Imported here as importlib.metadata takes tens of milliseconds to import
+        try:
+            from importlib import metadata
+        except ImportError:
+            # Python 3.7 has no importlib.metadata
+            return
+        
+        try:
+            entry_points = metadata.entry_points()
+            if hasattr(entry_points, 'select'):
+                entry_points = entry_points.select(group=self.entry_point_group)
+            else:
+                entry_points = entry_points.get(self.entry_point_group, [])
+        except Exception as e:
+            print(f"Error looking up plugins ({self.entry_point_group}): {str(e)}")
+            return
+        
+        for entry_point in entry_points:
+            self._plugins.setdefault(self.normalize(entry_point.name), entry_point)
+    
+    def _load(self, plugin: object) -> type:
+        """Import a plugin class from its import path or entry point."""
+        if isinstance(plugin, type):
+            return plugin
+        
+        if isinstance(plugin, str):
+            module_name, _, class_name = plugin.partition(':')
+            module = importlib.import_module(module_name, self.package)
+            return getattr(module, class_name)
+        
+        # Entry point
+        return plugin.load()
@@ -0,0 +1,53 @@
+"""
+Rule index module.
+Finds which of many substring markers occur in a text with a single regex scan.
+"""
+import re
+from typing import List
+
+
+class RuleIndex:
+    """Multi-substring index mapping the markers found in a text to the rules that use them."""
+    
+    def __init__(self, markers: List[str]):
+        """
+        Build the index over the markers of a list of rules.
+        
+        Args:
+            markers: Marker of each rule; rule i is reported when markers[i] occurs in a text
+        """
+        distinct = sorted(set(markers), key=len, reverse=True)
+        
+        # At any position the alternation picks the longest marker, as longer
+        # markers come first; every shorter marker starting there is its prefix
+        self.regex = re.compile('|'.join(re.escape(marker) for marker in distinct)) if distinct else None
+        
+        self.rules_by_marker = {}
+        for marker in distinct:
+            self.rules_by_marker[marker] = sorted(
+                index for index, other in enumerate(markers) if marker.startswith(other)
+            )
+    
+    def match(self, text: str) -> List[int]:
+        """
+        Find the rules whose marker occurs in a text.
+        
+        Args:
+            text: Text to search
+            
+        Returns:
+            Sorted indices of the matching rules
+        """
+        if self.regex is None:
+            return []
+        
+        found = set()
+        search = self.regex.search
+        match = search(text)
+        
+        # Search again from the next character so that overlapping markers are found
+        while match:
+            found.update(self.rules_by_marker[match.group()])
+            match = search(text, match.start() + 1)
+        
+        return sorted(found)
@@ -17,6 +17,12 @@ setup(
         "click>=8.0.0",
         "xlrd>=2.0.1",
     ],
+    extras_require={
+        # Parquet and Arrow export
+        "columnar": ["pyarrow>=6.0.0"],
+        # zstd compression of text exports
+        "zstd": ["zstandard>=0.15.0"],
+    },
     entry_points={
         "console_scripts": [
             "text-extractor=text_extractor.src.main:main",
@@ -17,6 +17,8 @@ from src.utils.data_processor import DataProcessor
 from src.exporters.excel_exporter import ExcelExporter
 from src.exporters.word_exporter import WordExporter
 from src.exporters.text_exporter import TextExporter
+from src.exporters.parquet_exporter import ParquetExporter
+from src.exporters.arrow_exporter import ArrowExporter
 
 
 def main(input_path, config_path, output_path, formats='all'):
@@ -27,7 +29,7 @@ def main(input_path, config_path, output_path, formats='all'):
         input_path: Input file or directory path
         config_path: Configuration file path
         output_path: Output directory path
-        formats: Output formats (comma-separated: excel,word,text or "all")
+        formats: Output formats (comma-separated: excel,word,text,parquet,arrow or "all")
     """
     try:
         # Load configuration
@@ -49,8 +51,8 @@ def main(input_path, config_path, output_path, formats='all'):
             print("No data extracted from input files")
             return
         
-        # Process and structure the data
-        processor = DataProcessor(config_handler.get_output_config())
+        # Process and structure the data; values are formatted by export_data
+        processor = DataProcessor(config_handler.get_output_config(), format_values=False)
         structured_data = processor.process(extracted_data)
         
         # Determine export formats
@@ -158,7 +160,7 @@ def export_data(
     Export data to specified formats.
     
     Args:
-        data: List of dictionaries containing structured data
+        data: List of dictionaries containing structured data, not formatted
         output_dir: Output directory path
         formats: List of export formats
         output_config: Output configuration
@@ -175,21 +177,36 @@ def export_data(
         **export_config
     }
     
+    # Excel, Word and text exports show formatted values; Parquet and Arrow keep typed values
+    formatter = DataProcessor(output_config)
+    formatted_data = formatter.format_batch(data)
+    
     # Export to Excel
     if 'excel' in formats:
         exporter = ExcelExporter(combined_config)
-        results['excel'] = exporter.export(data, output_dir)
+        results['excel'] = exporter.export(formatted_data, output_dir)
     
     # Export to Word
     if 'word' in formats:
         exporter = WordExporter(combined_config)
-        results['word'] = exporter.export(data, output_dir)
+        results['word'] = exporter.export(formatted_data, output_dir)
     
     # Export to Text
     if 'text' in formats:
         exporter = TextExporter(combined_config)
-        results['text'] = exporter.export(data, output_dir)
+        results['text'] = exporter.export(formatted_data, output_dir)
+    
+    # Export to Parquet
+    if 'parquet' in formats:
+        exporter = ParquetExporter(combined_config)
+        results['parquet'] = exporter.export(data, output_dir)
+    
+    # Export to Arrow
+    if 'arrow' in formats:
+        exporter = ArrowExporter(combined_config)
+        results['arrow'] = exporter.export(data, output_dir)
     
+    formatter.report()
     return results
 
 
@@ -0,0 +1,89 @@
+"""
+Tests for the Parquet and Arrow exporters.
+Checks that columns without a configured type are widened when a later batch holds values of another type.
+"""
+import io
+import os
+import sys
+import contextlib
+import tempfile
+import unittest
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+# Add the parent directory to sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.exporters.arrow_exporter import ArrowExporter
+from src.exporters.parquet_exporter import ParquetExporter
+
+
+class ColumnarExportersTest(unittest.TestCase):
+    """Schemas of files written in several batches."""
+    
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+    
+    def tearDown(self):
+        self.directory.cleanup()
+    
+    def export(self, exporter_class, batches, structure=None) -> pa.Table:
+        # Every batch of two records is written out before the next one is added
+        config = {exporter_class.CONFIG_SECTION: {exporter_class.BATCH_SIZE_KEY: 2}, 'structure': structure or []}
+        exporter = exporter_class(config)
+        output_dir = tempfile.mkdtemp(dir=self.directory.name)
+        
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            exporter.open(output_dir)
+            for batch in batches:
+                exporter.write(batch)
+            file_name = exporter.close()
+        
+        self.assertEqual(output.getvalue(), "")
+        self.assertEqual(os.listdir(output_dir), [exporter_class.FILE_NAME])
+        if exporter_class is ParquetExporter:
+            return pq.read_table(file_name)
+        with pa.memory_map(file_name) as source:
+            return pa.ipc.open_file(source).read_all()
+    
+    def test_widened_columns(self):
+        batches = [
+            [{'amount': 1, 'note': None, 'code': 1}, {'amount': 2, 'note': None, 'code': 2}],
+            [{'amount': 2.5, 'note': None, 'code': 3}, {'amount': 3, 'note': 'late', 'code': 'X4'}],
+        ]
+        
+        for exporter_class in (ArrowExporter, ParquetExporter):
+            with self.subTest(exporter_class.FORMAT_NAME):
+                table = self.export(exporter_class, batches)
+                
+                self.assertEqual(table.schema.field('amount').type, pa.float64())
+                self.assertEqual(table.schema.field('note').type, pa.string())
+                self.assertEqual(table.schema.field('code').type, pa.string())
+                self.assertEqual(table.column('amount').to_pylist(), [1.0, 2.0, 2.5, 3.0])
+                self.assertEqual(table.column('note').to_pylist(), [None, None, None, 'late'])
+                self.assertEqual(table.column('code').to_pylist(), ['1', '2', '3', 'X4'])
+    
+    def test_missing_values_first(self):
+        batches = [[{'count': None}, {'count': float('nan')}], [{'count': 3}]]
+        
+        for exporter_class in (ArrowExporter, ParquetExporter):
+            with self.subTest(exporter_class.FORMAT_NAME):
+                table = self.export(exporter_class, batches)
+                
+                self.assertEqual(table.schema.field('count').type, pa.int64())
+                self.assertEqual(table.column('count').to_pylist(), [None, None, 3])
+    
+    def test_configured_type_kept(self):
+        structure = [{'field': 'amount', 'type': 'float'}]
+        batches = [[{'amount': 1}, {'amount': 2}], [{'amount': '3'}]]
+        
+        table = self.export(ParquetExporter, batches, structure)
+        
+        self.assertEqual(table.schema.field('amount').type, pa.float64())
+        self.assertEqual(table.column('amount').to_pylist(), [1.0, 2.0, 3.0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+"""
+Tests for the configuration cache.
+Checks that configurations are reused by content, evicted least recently used first and share their parsers.
+"""
+import os
+import sys
+import tempfile
+import unittest
+
+# Add the parent directory to sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.config.config_cache import ConfigCache
+from src.parser.extraction_cache import ExtractionCache
+
+
+CONFIG = '''
+input:
+  text_patterns:
+    - name: "{name}"
+      pattern: "Name: (.*)"
+output:
+  structure:
+    - field: "{name}"
+export: {{}}
+'''
+
+
+class ConfigCacheTest(unittest.TestCase):
+    """Configurations loaded from files through the cache."""
+    
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+    
+    def tearDown(self):
+        self.directory.cleanup()
+    
+    def write_config(self, file_name: str, name: str) -> str:
+        path = os.path.join(self.directory.name, file_name)
+        with open(path, 'w') as file:
+            file.write(CONFIG.format(name=name))
+        return path
+    
+    def test_hit_by_content(self):
+        config_cache = ConfigCache()
+        config = config_cache.load(self.write_config('first.yaml', 'customer_name'))
+        
+        # Another file with the same content is the same configuration
+        self.assertIs(config_cache.load(self.write_config('second.yaml', 'customer_name')), config)
+        self.assertIsNot(config_cache.load(self.write_config('third.yaml', 'order_id')), config)
+        
+        # A known content hash is trusted without reading the file
+        path = self.write_config('first.yaml', 'customer_name')
+        self.assertIs(config_cache.load(path, ExtractionCache.hash_file(path)), config)
+    
+    def test_eviction(self):
+        config_cache = ConfigCache(max_entries=2)
+        paths = [self.write_config(f'{name}.yaml', name) for name in ('a', 'b', 'c')]
+        
+        first = config_cache.load(paths[0])
+        second = config_cache.load(paths[1])
+        
+        # Using the first configuration makes the second the least recently used one
+        config_cache.load(paths[0])
+        config_cache.load(paths[2])
+        
+        self.assertIs(config_cache.load(paths[0]), first)
+        self.assertIsNot(config_cache.load(paths[1]), second)
+    
+    def test_invalid_not_cached(self):
+        config_cache = ConfigCache()
+        path = os.path.join(self.directory.name, 'invalid.yaml')
+        with open(path, 'w') as file:
+            file.write('input: {}\n')
+        
+        with self.assertRaises(ValueError):
+            config_cache.load(path)
+        with self.assertRaises(ValueError):
+            config_cache.load(os.path.join(self.directory.name, 'missing.yaml'))
+        self.assertEqual(len(config_cache._entries), 0)
+    
+    def test_shared_parsers(self):
+        config = ConfigCache().load(self.write_config('config.yaml', 'customer_name'))
+        input_path = os.path.join(self.directory.name, 'order.txt')
+        with open(input_path, 'w') as file:
+            file.write('Name: John\n')
+        
+        first = config.parser_factory()
+        self.assertEqual(first.parse_file(input_path), [{'customer_name': 'John'}])
+        
+        # Parser factories of the same configuration reuse its parser instances
+        second = config.parser_factory()
+        self.assertEqual(second.parse_file(input_path), [{'customer_name': 'John'}])
+        self.assertEqual(len(config.parsers), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
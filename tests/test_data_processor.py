@@ -0,0 +1,79 @@
+"""
+Tests for the data processor.
+Checks that structuring DataFrame chunks a column at a time gives the same records
+as structuring their records one at a time.
+"""
+import io
+import os
+import sys
+import contextlib
+import unittest
+
+import pandas as pd
+
+# Add the parent directory to sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.utils.data_processor import DataProcessor
+
+
+STRUCTURE = [
+    {'field': 'customer_name', 'required': True},
+    {'field': 'order_id', 'required': True},
+    {'field': 'quantity', 'format': '{:d}'},
+    {'field': 'total_amount', 'format': '${:.2f}', 'required': True},
+]
+
+
+class DataProcessorChunksTest(unittest.TestCase):
+    """iter_process_chunks compared with iter_process over the same records."""
+    
+    def process(self, method, data) -> tuple:
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            records = list(method(data))
+        
+        # NaN is not equal to itself, so missing values are compared as None
+        records = [{key: None if value != value else value for key, value in record.items()} for record in records]
+        return records, output.getvalue()
+    
+    def test_frames_match_records(self):
+        frames = [
+            pd.DataFrame({'customer_name': ['A', 'B'], 'order_id': ['1', '2'], 'total_amount': [1.5, float('nan')]}),
+            pd.DataFrame({'customer_name': ['C'], 'quantity': [3.5], 'total_amount': [2.0]}),
+            pd.DataFrame({'unmapped': [1, 2]}),
+            pd.DataFrame(index=range(2)),
+        ]
+        records = [{'customer_name': 'D', 'total_amount': 'n/a'}, {}]
+        
+        expected = self.process(
+            DataProcessor({'structure': STRUCTURE}).iter_process,
+            [record for frame in frames for record in frame.to_dict('records')] + records
+        )
+        result = self.process(DataProcessor({'structure': STRUCTURE}).iter_process_chunks, frames + [records])
+        
+        self.assertEqual(result, expected)
+        self.assertIsNone(result[0][1]['total_amount'])
+    
+    def test_format_batch(self):
+        records = [{'customer_name': 'A', 'quantity': 2, 'total_amount': 1.5}, {'total_amount': float('nan')}]
+        expected, _ = self.process(DataProcessor({'structure': STRUCTURE}).iter_process, records)
+        
+        raw = list(DataProcessor({'structure': STRUCTURE}, format_values=False).iter_process(records))
+        result, _ = self.process(DataProcessor({'structure': STRUCTURE}).format_batch, raw)
+        
+        # The values before formatting are kept for the exporters of typed columns
+        self.assertEqual(result, expected)
+        self.assertEqual(raw[0]['total_amount'], 1.5)
+    
+    def test_without_structure(self):
+        frame = pd.DataFrame({'order_id': ['1', '2']})
+        records = [{'order_id': '3'}, {}]
+        
+        expected = list(DataProcessor({}).iter_process(frame.to_dict('records') + records))
+        
+        self.assertEqual(list(DataProcessor({}).iter_process_chunks([frame, records])), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+"""
+Tests for the extraction cache.
+Checks cache hits and misses, least recently used eviction and what the cache key covers.
+"""
+import os
+import sys
+import tempfile
+import unittest
+
+# Add the parent directory to sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.parser.extraction_cache import ExtractionCache
+
+
+class SampleParser:
+    """Parser reading one configuration key."""
+    
+    CONFIG_KEYS = ('text_patterns',)
+    VERSION = 1
+
+
+class NewerSampleParser(SampleParser):
+    VERSION = 2
+
+
+class ExtractionCacheTest(unittest.TestCase):
+    """Entries stored, read back and evicted."""
+    
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache = ExtractionCache(os.path.join(self.directory.name, 'cache'))
+        self.path = os.path.join(self.directory.name, 'input.txt')
+        with open(self.path, 'w') as file:
+            file.write('Name: John')
+    
+    def tearDown(self):
+        self.directory.cleanup()
+    
+    def test_hit_and_miss(self):
+        key = self.cache.make_key(self.path, SampleParser(), {'text_patterns': []})
+        self.assertIsNone(self.cache.get(key))
+        
+        self.cache.put(key, [{'name': 'John'}])
+        self.assertEqual(self.cache.get(key), [{'name': 'John'}])
+        
+        # A file with other content misses the cache
+        with open(self.path, 'w') as file:
+            file.write('Name: Jane')
+        self.assertIsNone(self.cache.get(self.cache.make_key(self.path, SampleParser(), {'text_patterns': []})))
+    
+    def test_key(self):
+        config = {'text_patterns': [{'name': 'name', 'pattern': 'Name: (.*)'}], 'excel_mappings': []}
+        key = self.cache.make_key(self.path, SampleParser(), config)
+        
+        # Known content hashes give the same key without reading the file
+        self.assertEqual(key, self.cache.make_key(self.path, SampleParser(), config, ExtractionCache.hash_file(self.path)))
+        
+        # Keys the parser does not read leave the key unchanged
+        self.assertEqual(key, self.cache.make_key(self.path, SampleParser(), dict(config, excel_mappings=[{}])))
+        
+        self.assertNotEqual(key, self.cache.make_key(self.path, SampleParser(), dict(config, text_patterns=[])))
+        self.assertNotEqual(key, self.cache.make_key(self.path, NewerSampleParser(), config))
+    
+    def test_lru_eviction(self):
+        keys = [f'{index:02d}' + '0' * 62 for index in range(3)]
+        for key in keys[:2]:
+            self.cache.put(key, [{'name': 'John'}])
+        
+        # Room for two entries, the first of which was used most recently
+        entry_size = os.path.getsize(self.cache._entry_path(keys[0]))
+        self.cache.max_size = 2 * entry_size
+        os.utime(self.cache._entry_path(keys[0]), (1, 1))
+        os.utime(self.cache._entry_path(keys[1]), (2, 2))
+        self.assertIsNotNone(self.cache.get(keys[0]))
+        
+        self.cache.put(keys[2], [{'name': 'John'}])
+        
+        self.assertIsNotNone(self.cache.get(keys[0]))
+        self.assertIsNone(self.cache.get(keys[1]))
+        self.assertIsNotNone(self.cache.get(keys[2]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+"""
+Tests for the extraction manifest.
+Checks that records are kept per file outside the manifest and that removed files count as changed.
+"""
+import os
+import sys
+import tempfile
+import unittest
+
+# Add the parent directory to sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.utils.extraction_manifest import ExtractionManifest
+
+
+class ExtractionManifestTest(unittest.TestCase):
+    """Manifest entries and records across runs."""
+    
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.manifest_path = os.path.join(self.directory.name, ExtractionManifest.FILE_NAME)
+        self.paths = []
+        for name in ('a.txt', 'b.txt'):
+            path = os.path.join(self.directory.name, name)
+            with open(path, 'w') as file:
+                file.write(name)
+            self.paths.append(path)
+    
+    def tearDown(self):
+        self.directory.cleanup()
+    
+    def save_run(self) -> ExtractionManifest:
+        manifest = ExtractionManifest(self.manifest_path, {})
+        for path in self.paths:
+            manifest.update(path, [{'name': os.path.basename(path)}])
+        manifest.save(self.paths)
+        return manifest
+    
+    def test_records_reused(self):
+        self.save_run()
+        manifest = ExtractionManifest(self.manifest_path, {})
+        
+        self.assertEqual(manifest.lookup(self.paths[0]), [{'name': 'a.txt'}])
+        self.assertEqual(len(os.listdir(manifest.records_dir)), 2)
+        
+        # The manifest itself only names the record files
+        for entry in manifest.entries.values():
+            self.assertIsInstance(entry['records'], str)
+    
+    def test_changed_file(self):
+        self.save_run()
+        with open(self.paths[0], 'w') as file:
+            file.write('changed')
+        
+        manifest = ExtractionManifest(self.manifest_path, {})
+        self.assertIsNone(manifest.lookup(self.paths[0]))
+        
+        # The records of the previous content are removed once the new ones are saved
+        manifest.update(self.paths[0], [{'name': 'changed'}])
+        manifest.save(self.paths)
+        self.assertEqual(len(os.listdir(manifest.records_dir)), 2)
+        self.assertEqual(ExtractionManifest(self.manifest_path, {}).lookup(self.paths[0]), [{'name': 'changed'}])
+    
+    def test_removed_file(self):
+        self.save_run()
+        os.remove(self.paths[0])
+        
+        manifest = ExtractionManifest(self.manifest_path, {})
+        self.assertIsNone(manifest.lookup(self.paths[0]))
+        manifest.update(self.paths[0], [{'name': 'a.txt'}])
+        manifest.save(self.paths)
+        
+        self.assertEqual(len(os.listdir(manifest.records_dir)), 1)
+    
+    def test_changed_while_parsing(self):
+        manifest = ExtractionManifest(self.manifest_path, {})
+        self.assertIsNone(manifest.lookup(self.paths[0]))
+        
+        # Rewritten after lookup, as if while it was parsed
+        with open(self.paths[0], 'w') as file:
+            file.write('rewritten')
+        manifest.update(self.paths[0], [{'name': 'a.txt'}])
+        manifest.save(self.paths)
+        
+        self.assertIsNone(ExtractionManifest(self.manifest_path, {}).lookup(self.paths[0]))
+    
+    def test_other_configuration(self):
+        self.save_run()
+        
+        self.assertIsNone(ExtractionManifest(self.manifest_path, {'input': 1}).lookup(self.paths[0]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+"""
+Tests for the job queue of the web interface.
+Checks the order jobs are claimed in, the running and queued jobs limits and jobs left running by ended processes.
+"""
+import io
+import os
+import sys
+import contextlib
+import subprocess
+import tempfile
+import unittest
+
+# Add the parent directory to sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from web.job_queue import JobQueue, JobWorkerPool
+
+
+class JobQueueTest(unittest.TestCase):
+    """Jobs queued, claimed and finished in one database."""
+    
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.directory.name, 'jobs.sqlite3')
+    
+    def tearDown(self):
+        self.directory.cleanup()
+    
+    def test_claim_order_and_running_limit(self):
+        job_queue = JobQueue(self.db_path, max_running=1)
+        first = job_queue.enqueue({'name': 'first'})
+        second = job_queue.enqueue({'name': 'second'})
+        
+        self.assertEqual(job_queue.get(first)['position'], 1)
+        self.assertEqual(job_queue.get(second)['position'], 2)
+        
+        self.assertEqual(job_queue.claim(), {'id': first, 'payload': {'name': 'first'}})
+        self.assertEqual(job_queue.get(first)['status'], JobQueue.RUNNING)
+        self.assertEqual(job_queue.get(second)['position'], 1)
+        
+        # The running job holds the only slot until it is over
+        self.assertIsNone(job_queue.claim())
+        
+        job_queue.finish(first, {'excel': 'extracted_data.xlsx'})
+        self.assertEqual(job_queue.get(first)['result'], {'excel': 'extracted_data.xlsx'})
+        self.assertEqual(job_queue.claim()['id'], second)
+        self.assertIsNone(job_queue.get('unknown'))
+    
+    def test_queue_full(self):
+        # The web interface answers 503 when no job can be queued
+        job_queue = JobQueue(self.db_path, max_queued=1)
+        
+        self.assertIsNotNone(job_queue.enqueue({}))
+        self.assertIsNone(job_queue.enqueue({}))
+        
+        # Running jobs no longer count as waiting
+        job_queue.claim()
+        self.assertIsNotNone(job_queue.enqueue({}))
+    
+    def test_stale_job_failed(self):
+        job_queue = JobQueue(self.db_path, max_running=1)
+        stale = job_queue.enqueue({'name': 'stale'})
+        waiting = job_queue.enqueue({'name': 'waiting'})
+        job_queue.claim()
+        
+        # Mark the job as run by a process that has ended since
+        process = subprocess.Popen([sys.executable, '-c', 'pass'])
+        process.wait()
+        with job_queue._connect() as connection:
+            connection.execute('UPDATE jobs SET worker_pid = ? WHERE id = ?', (process.pid, stale))
+        
+        self.assertEqual(job_queue.claim()['id'], waiting)
+        self.assertEqual(job_queue.get(stale)['status'], JobQueue.FAILED)
+        self.assertEqual(job_queue.get(stale)['error'], 'The job was interrupted')
+
+
+class JobWorkerPoolTest(unittest.TestCase):
+    """Claimed jobs run by the worker pool's handler."""
+    
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.job_queue = JobQueue(os.path.join(self.directory.name, 'jobs.sqlite3'), max_running=2)
+    
+    def tearDown(self):
+        self.directory.cleanup()
+    
+    @staticmethod
+    def handler(payload, progress):
+        progress(50, 'Halfway')
+        if payload.get('fail'):
+            raise ValueError('Invalid input')
+        return {'text': 'extracted_data.txt'}
+    
+    def test_run_job(self):
+        done = self.job_queue.enqueue({})
+        failed = self.job_queue.enqueue({'fail': True})
+        
+        # The jobs are run as a worker thread runs them, without starting the threads
+        pool = JobWorkerPool(self.job_queue, self.handler)
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            pool._run_job(self.job_queue.claim())
+            pool._run_job(self.job_queue.claim())
+        
+        self.assertEqual(self.job_queue.get(done)['status'], JobQueue.DONE)
+        self.assertEqual(self.job_queue.get(done)['result'], {'text': 'extracted_data.txt'})
+        self.assertEqual(self.job_queue.get(failed)['status'], JobQueue.FAILED)
+        self.assertEqual(self.job_queue.get(failed)['error'], 'Invalid input')
+        self.assertEqual(self.job_queue.get(failed)['message'], 'Halfway')
+        self.assertIn('Invalid input', output.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+"""
+Tests for the text pattern matcher.
+Checks that the default matcher gives the same records as scanning the text once
+per pattern, including when the matches of different patterns overlap.
+"""
+import os
+import re
+import sys
+import random
+import unittest
+from typing import Dict, List, Any
+
+# Add the parent directory to sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.parser.pattern_matcher import PatternMatcher
+
+
+# Patterns of sample_config.yaml; the first one ends with '.*' and overlaps the second
+SAMPLE_PATTERNS = [
+    {'name': 'customer_name', 'pattern': 'Customer Name: (.*)', 'group': 1},
+    {'name': 'order_id', 'pattern': 'Order ID: ([A-Z0-9]+)', 'group': 1},
+    {'name': 'total_amount', 'pattern': 'Total Amount: \\$(\\d+\\.\\d{2})', 'group': 1, 'type': 'float'},
+]
+
+
+def match_per_pattern(patterns: List[Dict[str, Any]], content: str) -> Dict[str, Any]:
+    """The original extraction loop, scanning the content once per pattern."""
+    record = {}
+    for pattern_config in patterns:
+        for match in re.finditer(pattern_config['pattern'], content):
+            value = match.group(pattern_config.get('group', 1))
+            if pattern_config.get('type') == 'float':
+                value = float(value)
+            record[pattern_config['name']] = value
+    return record
+
+
+class PatternMatcherTest(unittest.TestCase):
+    """Default and single-pass matching compared with the per-pattern scan."""
+    
+    def test_overlapping_matches(self):
+        content = 'Customer Name: John Smith   Order ID: ORD1\nTotal Amount: $12.50\n'
+        expected = match_per_pattern(SAMPLE_PATTERNS, content)
+        
+        self.assertEqual(expected['order_id'], 'ORD1')
+        self.assertEqual(PatternMatcher(SAMPLE_PATTERNS).extract([content]), expected)
+    
+    def test_overlapping_matches_fuzz(self):
+        generator = random.Random(0)
+        words = ['Customer Name: ', 'Order ID: ', 'Total Amount: $', 'ORD7', 'John', '12.50', ' ', '\n', '$3.00']
+        
+        for _ in range(500):
+            content = ''.join(generator.choice(words) for _ in range(generator.randint(1, 20)))
+            with self.subTest(content=content):
+                self.assertEqual(
+                    PatternMatcher(SAMPLE_PATTERNS).extract([content]),
+                    match_per_pattern(SAMPLE_PATTERNS, content)
+                )
+    
+    def test_single_pass_without_overlap(self):
+        patterns = [{'name': f'field_{i}', 'pattern': f'Field {i:03d}: (\\d+)'} for i in range(20)]
+        content = '\n'.join(f'INFO Field {i % 20:03d}: {i}' for i in range(1000))
+        
+        self.assertEqual(
+            PatternMatcher(patterns, single_pass=True).extract([content]),
+            match_per_pattern(patterns, content)
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+"""
+Tests for the plugin registry.
+Checks that plugin modules are imported on first use and that entry points are only looked up for unknown names.
+"""
+import io
+import os
+import sys
+import contextlib
+import tempfile
+import unittest
+from importlib import metadata
+from unittest import mock
+
+# Add the parent directory to sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.utils.plugin_registry import PluginRegistry
+
+
+GROUP = 'text_extractor.test_plugins'
+
+
+class PluginRegistryTest(unittest.TestCase):
+    """Plugins registered by import path and by entry point."""
+    
+    def setUp(self):
+        # A plugin module of its own, so that the test sees when it is imported
+        self.directory = tempfile.TemporaryDirectory()
+        self.module_name = f'sample_plugins_{id(self)}'
+        with open(os.path.join(self.directory.name, self.module_name + '.py'), 'w') as file:
+            file.write('class BuiltinPlugin:\n    pass\n\nclass InstalledPlugin:\n    pass\n')
+        sys.path.insert(0, self.directory.name)
+    
+    def tearDown(self):
+        sys.path.remove(self.directory.name)
+        sys.modules.pop(self.module_name, None)
+        self.directory.cleanup()
+    
+    def entry_points(self, *names: str) -> mock.Mock:
+        entry_points = metadata.EntryPoints(
+            metadata.EntryPoint(name=name, value=f'{self.module_name}:InstalledPlugin', group=GROUP)
+            for name in names
+        )
+        return mock.patch.object(metadata, 'entry_points', return_value=entry_points)
+    
+    def test_lazy_import(self):
+        registry = PluginRegistry(GROUP, {'txt': f'{self.module_name}:BuiltinPlugin'})
+        
+        self.assertIn('.TXT', registry)
+        self.assertNotIn(self.module_name, sys.modules)
+        
+        plugin_class = registry.get('txt')
+        self.assertEqual(plugin_class.__name__, 'BuiltinPlugin')
+        self.assertIn(self.module_name, sys.modules)
+        self.assertIs(registry.get('.txt'), plugin_class)
+    
+    def test_entry_points(self):
+        registry = PluginRegistry(GROUP, {'txt': f'{self.module_name}:BuiltinPlugin'})
+        
+        with self.entry_points('TXT', 'xml') as entry_points:
+            # Built-in plugins are found without scanning the installed packages
+            self.assertEqual(registry.get('txt').__name__, 'BuiltinPlugin')
+            entry_points.assert_not_called()
+            
+            self.assertEqual(registry.get('xml').__name__, 'InstalledPlugin')
+            self.assertIsNone(registry.get('pdf'))
+            entry_points.assert_called_once()
+        
+        # Built-in plugins take precedence over entry points of the same name
+        self.assertEqual(registry.names(), ['txt', 'xml'])
+        self.assertEqual(registry.get('txt').__name__, 'BuiltinPlugin')
+    
+    def test_unloadable_plugin(self):
+        registry = PluginRegistry(GROUP, {'txt': f'{self.module_name}_missing:BuiltinPlugin'})
+        
+        output = io.StringIO()
+        with self.entry_points(), contextlib.redirect_stdout(output):
+            self.assertIsNone(registry.get('txt'))
+            self.assertIsNone(registry.get('txt'))
+        
+        # The error is reported once, and the plugin is no longer listed
+        self.assertEqual(output.getvalue().count("Error loading plugin 'txt'"), 1)
+        self.assertEqual(registry.names(), [])
+    
+    def test_registered_class(self):
+        registry = PluginRegistry(GROUP, {})
+        registry.register('.CSV', PluginRegistryTest)
+        
+        self.assertIs(registry.get('csv'), PluginRegistryTest)
+        self.assertEqual(registry.names(discover=False), ['csv'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+"""
+Tests for the text parser.
+Checks that streaming a text file line by line gives the same records as reading it whole.
+"""
+import os
+import sys
+import random
+import tempfile
+import unittest
+
+# Add the parent directory to sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.parser.text_parser import TextParser
+
+
+# Patterns that match within a line, and patterns that do not (anchors, \s, [^x], DOTALL)
+PATTERNS = [
+    'Status: (\\w+)',
+    '(?m)^Total: (\\d+)$',
+    'Name: (.*)',
+    '^Status: (\\w+)',
+    'Total:\\s*(\\d+)',
+    'Name: ([^;]+)',
+    '(?s)Note: (.+?)\\.',
+    '(\\d+)\\Z',
+]
+
+
+class TextStreamLinesTest(unittest.TestCase):
+    """text_stream_lines compared with whole-file parsing."""
+    
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'input.txt')
+    
+    def tearDown(self):
+        self.directory.cleanup()
+    
+    def parse(self, content: str, patterns: list, stream_lines: bool) -> list:
+        with open(self.path, 'w', encoding='utf-8') as file:
+            file.write(content)
+        
+        config = {
+            'text_patterns': [{'name': f'field_{i}', 'pattern': pattern} for i, pattern in enumerate(patterns)],
+            'text_stream_lines': stream_lines,
+        }
+        return TextParser(config).parse(self.path)
+    
+    def test_multiline_patterns(self):
+        content = 'Header\nStatus: ok\nTotal:\n 42\n'
+        patterns = ['^Status: (\\w+)', 'Total:\\s*(\\d+)']
+        
+        self.assertEqual(self.parse(content, patterns, True), self.parse(content, patterns, False))
+    
+    def test_stream_lines_fuzz(self):
+        generator = random.Random(0)
+        words = ['Status: ', 'Total: ', 'Name: ', 'Note: ', 'ok', '42', 'John Smith', ';', '.', ' ', '\n', '\n']
+        
+        for _ in range(300):
+            patterns = generator.sample(PATTERNS, generator.randint(1, 4))
+            content = ''.join(generator.choice(words) for _ in range(generator.randint(1, 30)))
+            with self.subTest(patterns=patterns, content=content):
+                self.assertEqual(self.parse(content, patterns, True), self.parse(content, patterns, False))
+    
+    def test_stream_lines_key_affects_cache(self):
+        self.assertIn('text_stream_lines', TextParser.CONFIG_KEYS)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,123 @@
+"""
+Tests for the streaming upload of the web interface.
+Checks that the files of a multipart body are written to disk with their SHA-256 digest
+as the body is read, and parsed as soon as both they and the configuration are received.
+"""
+import io
+import os
+import sys
+import random
+import hashlib
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from werkzeug.datastructures import FileStorage
+from werkzeug.test import encode_multipart
+
+# Add the parent directory to sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.config.config_cache import ConfigCache
+from src.parser.extraction_cache import ExtractionCache
+from web.upload_stream import StreamingUpload, UploadParser
+
+
+CONFIG = '''
+input:
+  text_patterns:
+    - name: "customer_name"
+      pattern: "Customer Name: (.*)"
+output:
+  structure:
+    - field: "customer_name"
+export: {}
+'''
+
+
+class StreamingUploadTest(unittest.TestCase):
+    """Files and fields of a multipart body read in small chunks."""
+    
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+    
+    def tearDown(self):
+        self.directory.cleanup()
+    
+    def file_path(self, field_name: str, file_name: str):
+        if file_name.endswith('.exe'):
+            return None
+        return os.path.join(self.directory.name, file_name)
+    
+    def receive(self, values: dict, on_file=None) -> StreamingUpload:
+        boundary, body = encode_multipart(values)
+        upload = StreamingUpload(self.file_path, on_file)
+        
+        # Chunks smaller than the files and the boundary, so that both span several reads
+        upload.CHUNK_SIZE = 7
+        upload.receive(io.BytesIO(body), boundary.encode('latin-1'))
+        return upload
+    
+    def test_files_saved(self):
+        content = random.Random(1).randbytes(5000)
+        received = []
+        
+        upload = self.receive({
+            'exportFormats': 'text,excel',
+            'inputFiles': FileStorage(io.BytesIO(content), 'data.bin'),
+            'skipped': FileStorage(io.BytesIO(b'MZ'), 'tool.exe'),
+            'configFile': FileStorage(io.BytesIO(b'input: {}\n'), 'config.yaml'),
+        }, received.append)
+        
+        self.assertEqual(upload.fields, {'exportFormats': ['text,excel']})
+        self.assertEqual(received, upload.files)
+        self.assertEqual([file['filename'] for file in upload.files], ['data.bin', 'config.yaml'])
+        self.assertEqual(sorted(os.listdir(self.directory.name)), ['config.yaml', 'data.bin'])
+        
+        data_file = upload.files[0]
+        self.assertEqual(data_file['field'], 'inputFiles')
+        self.assertEqual(data_file['size'], len(content))
+        self.assertEqual(data_file['sha256'], hashlib.sha256(content).hexdigest())
+        with open(data_file['path'], 'rb') as file:
+            self.assertEqual(file.read(), content)
+        
+        self.assertEqual(upload.files[1]['sha256'], hashlib.sha256(b'input: {}\n').hexdigest())
+    
+    def test_read_ending_in_closing_boundary(self):
+        boundary, body = encode_multipart({'configFile': FileStorage(io.BytesIO(b'input: {}\n'), 'config.yaml')})
+        upload = StreamingUpload(self.file_path)
+        
+        # The first read ends between the two dashes closing the last boundary
+        self.assertTrue(body.endswith(b'--\r\n'))
+        upload.CHUNK_SIZE = len(body) - 3
+        upload.receive(io.BytesIO(body), boundary.encode('latin-1'))
+        
+        with open(upload.files[0]['path'], 'rb') as file:
+            self.assertEqual(file.read(), b'input: {}\n')
+    
+    def test_invalid_body(self):
+        upload = StreamingUpload(self.file_path)
+        
+        with self.assertRaises(ValueError):
+            upload.receive(io.BytesIO(b'--other\r\nno headers'), b'boundary')
+    
+    def test_parsed_on_arrival(self):
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            cache = ExtractionCache(os.path.join(self.directory.name, 'cache'))
+            upload_parser = UploadParser(executor, cache, ConfigCache(), 'configFile')
+            
+            # The input file arrives before the configuration and waits for it
+            self.receive({
+                'inputFiles': FileStorage(io.BytesIO(b'Customer Name: John\n'), 'order.txt'),
+                'configFile': FileStorage(io.BytesIO(CONFIG.encode('utf-8')), 'config.yaml'),
+            }, upload_parser.file_received)
+            
+            self.assertEqual(len(upload_parser.futures), 1)
+            self.assertEqual(upload_parser.futures[0].result(), [{'customer_name': 'John'}])
+        
+        input_path = os.path.join(self.directory.name, 'order.txt')
+        self.assertEqual(upload_parser.content_hashes[input_path], ExtractionCache.hash_file(input_path))
+
+
+if __name__ == '__main__':
+    unittest.main()
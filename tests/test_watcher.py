@@ -0,0 +1,165 @@
+"""
+Tests for the watch command.
+Checks that files are reported once their content has settled, that ready files are
+extracted in micro-batches and that a restarted watcher skips the files it extracted before.
+"""
+import io
+import os
+import sys
+import time
+import signal
+import contextlib
+import tempfile
+import unittest
+
+# Add the parent directory to sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.parser.parser_factory import ParserFactory
+from src.watcher import DirectoryWatcher, ExtractionWatcher, RollingOutput
+
+
+INPUT_CONFIG = {'text_patterns': [{'name': 'customer_name', 'pattern': 'Customer Name: (.*)'}]}
+OUTPUT_CONFIG = {'structure': [{'field': 'customer_name'}]}
+EXPORT_CONFIG = {'text': {'include_header': False}}
+
+
+class DirectoryWatcherTest(unittest.TestCase):
+    """Files reported by polling the watched directory."""
+    
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.watcher = DirectoryWatcher(
+            [self.directory.name], ParserFactory.is_supported, settle=0.2, poll_interval=0.05, use_inotify=False
+        )
+    
+    def tearDown(self):
+        self.watcher.close()
+        self.directory.cleanup()
+    
+    def write(self, name: str, content: str, mode: str = 'w') -> str:
+        path = os.path.join(self.directory.name, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, mode) as file:
+            file.write(content)
+        return path
+    
+    def test_settle(self):
+        path = self.write('order.txt', 'Customer Name: ')
+        self.write('notes.bin', 'ignored')
+        
+        # A new file is only reported once it has stayed unchanged for the settle time
+        self.assertEqual(self.watcher.poll(0), [])
+        self.write('order.txt', 'John', 'a')
+        self.assertEqual(self.watcher.poll(0.1), [])
+        
+        started = time.monotonic()
+        self.assertEqual(self.watcher.poll(2), [path])
+        self.assertGreaterEqual(time.monotonic() - started, 0.1)
+        
+        self.assertEqual(self.watcher.poll(0.3), [])
+    
+    def test_changed_and_nested_files(self):
+        path = self.write('order.txt', 'Customer Name: John')
+        self.assertEqual(self.watcher.poll(2), [path])
+        
+        # Changed content and files in subdirectories are reported too
+        os.utime(path, ns=(0, 0))
+        nested = self.write(os.path.join('archive', 'old.txt'), 'Customer Name: Jane')
+        self.assertEqual(self.watcher.poll(2), sorted([path, nested]))
+
+
+class ExtractionWatcherTest(unittest.TestCase):
+    """Runs of the extraction watcher over a directory of text files."""
+    
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.input_dir = os.path.join(self.directory.name, 'input')
+        self.output_dir = os.path.join(self.directory.name, 'output')
+        os.makedirs(self.input_dir)
+        os.makedirs(self.output_dir)
+        
+        self.paths = []
+        for index in range(5):
+            path = os.path.join(self.input_dir, f'order{index}.txt')
+            with open(path, 'w') as file:
+                file.write(f'Customer Name: Customer {index}\n')
+            self.paths.append(path)
+        
+        # run() installs its own handlers of SIGINT and SIGTERM
+        self.handlers = {
+            signal_number: signal.getsignal(signal_number) for signal_number in (signal.SIGINT, signal.SIGTERM)
+        }
+    
+    def tearDown(self):
+        for signal_number, handler in self.handlers.items():
+            signal.signal(signal_number, handler)
+        self.directory.cleanup()
+    
+    def run_watcher(self, ready: list) -> list:
+        """Run a watcher to which the given files are ready at once, returning the files of each micro-batch."""
+        batches = []
+        
+        class StubWatcher:
+            pending = list(ready)
+            
+            def poll(self, timeout):
+                # Report the files once, then stop once their micro-batches are extracted
+                files, self.pending = self.pending, []
+                extraction_watcher.stopping = not files
+                return files
+            
+            def close(self):
+                pass
+        
+        class RecordingWatcher(ExtractionWatcher):
+            def process(self, file_paths):
+                batches.append(list(file_paths))
+                super().process(file_paths)
+        
+        output = RollingOutput(self.output_dir, ['text'], OUTPUT_CONFIG, EXPORT_CONFIG, roll_interval=3600)
+        extraction_watcher = RecordingWatcher(StubWatcher(), output, INPUT_CONFIG, max_batch_files=2)
+        with contextlib.redirect_stdout(io.StringIO()):
+            extraction_watcher.run()
+        
+        return batches
+    
+    def segments(self) -> list:
+        """Records of the complete segments, by segment name."""
+        records = []
+        for name in sorted(os.listdir(self.output_dir)):
+            path = os.path.join(self.output_dir, name, 'extracted_data.txt')
+            if os.path.exists(path):
+                with open(path) as file:
+                    records.append(sorted(file.read().splitlines()))
+        return records
+    
+    def test_micro_batches(self):
+        batches = self.run_watcher(self.paths)
+        
+        self.assertEqual(batches, [self.paths[0:2], self.paths[2:4], self.paths[4:]])
+        self.assertEqual(self.segments(), [[f'Customer {index}' for index in range(5)]])
+    
+    def test_restart_from_manifest(self):
+        self.run_watcher(self.paths)
+        
+        # An unfinished segment of an interrupted run is removed on start
+        os.makedirs(os.path.join(self.output_dir, 'segment-interrupted' + RollingOutput.PARTIAL_SUFFIX))
+        
+        # After a restart only the changed file is extracted again
+        with open(self.paths[1], 'w') as file:
+            file.write('Customer Name: Changed\n')
+        self.run_watcher(self.paths)
+        
+        segments = self.segments()
+        self.assertEqual(len(segments), 2)
+        self.assertIn(['Changed'], segments)
+        self.assertFalse(any(name.endswith(RollingOutput.PARTIAL_SUFFIX) for name in os.listdir(self.output_dir)))
+        
+        # Nothing is extracted when nothing changed
+        self.run_watcher(self.paths)
+        self.assertEqual(len(self.segments()), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
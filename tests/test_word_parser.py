@@ -0,0 +1,85 @@
+"""
+Tests for the Word parser.
+Checks that a table column whose values cannot be cast is left out without losing the rest of the document.
+"""
+import io
+import os
+import sys
+import contextlib
+import tempfile
+import unittest
+
+import docx
+
+# Add the parent directory to sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.parser.word_parser import WordParser
+
+
+CONFIG = {
+    'word_extraction': [
+        {'name': 'customer_name', 'paragraph_contains': 'Customer Name', 'extract_after': 'Customer Name:'},
+    ],
+    'word_tables': [
+        {'source_column': 'Item', 'target_field': 'item'},
+        {'source_column': 'Qty', 'target_field': 'quantity', 'type': 'int'},
+        {'source_column': 'Price', 'target_field': 'price', 'type': 'float'},
+    ],
+}
+
+
+class WordTablesTest(unittest.TestCase):
+    """Records of the paragraphs and tables of a document."""
+    
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'input.docx')
+    
+    def tearDown(self):
+        self.directory.cleanup()
+    
+    def write_document(self, rows: list) -> None:
+        document = docx.Document()
+        document.add_paragraph('Customer Name: John')
+        table = document.add_table(rows=len(rows), cols=len(rows[0]))
+        for row_index, row in enumerate(rows):
+            for column_index, text in enumerate(row):
+                table.cell(row_index, column_index).text = text
+        document.save(self.path)
+    
+    def parse(self) -> tuple:
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            records = WordParser(CONFIG).parse(self.path)
+        return records, output.getvalue()
+    
+    def test_table_rows(self):
+        self.write_document([['Item', 'Qty', 'Price'], ['A', '2', '1.5'], ['B', '', '2']])
+        
+        records, output = self.parse()
+        
+        self.assertEqual(output, "")
+        self.assertEqual(records[0], {'customer_name': 'John'})
+        self.assertEqual(records[1], {'item': 'A', 'quantity': 2, 'price': 1.5})
+        self.assertEqual(records[2]['item'], 'B')
+        
+        # Empty cells are missing values, which may come out as NaN
+        quantity = records[2]['quantity']
+        self.assertTrue(quantity is None or quantity != quantity)
+    
+    def test_uncastable_column(self):
+        self.write_document([['Item', 'Qty', 'Price'], ['A', '2', '1.5'], ['B', 'two', '2']])
+        
+        records, output = self.parse()
+        
+        self.assertIn("'Qty'", output)
+        self.assertEqual(records, [
+            {'customer_name': 'John'},
+            {'item': 'A', 'price': 1.5},
+            {'item': 'B', 'price': 2.0},
+        ])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,13 +2,33 @@
 Text exporter module.
 Exports structured data to plain text format.
 """
+import io
 import os
-from typing import Dict, List, Any
+import csv
+import gzip
+from itertools import chain, islice
+from operator import itemgetter
+from typing import Callable, Dict, Iterable, List, Any, Optional
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
 
 
 class TextExporter:
     """Exporter for creating text files from structured data."""
     
+    # Size of the write buffer of the output file
+    BUFFER_SIZE = 1024 * 1024
+    
+    # Number of records converted to rows at a time
+    ROWS_PER_WRITE = 10000
+    
+    # File name suffixes and default levels of the supported compressions
+    COMPRESSION_SUFFIXES = {'gzip': '.gz', 'zstd': '.zst'}
+    DEFAULT_COMPRESSION_LEVELS = {'gzip': 6, 'zstd': 3}
+    
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize the text exporter with configuration.
@@ -18,6 +38,10 @@ class TextExporter:
         """
         self.config = config.get('text', {})
         self.output_structure = config.get('structure', [])
+        
+        # Output file and CSV writer, between open() and close()
+        self.file = None
+        self.writer = None
     
     def export(self, data: List[Dict[str, Any]], output_path: str) -> str:
         """
@@ -30,50 +54,231 @@ class TextExporter:
         Returns:
             Path to the created text file
         """
-        try:
-            # Get text-specific settings
-            delimiter = self.config.get('delimiter', '|')
-            include_header = self.config.get('include_header', True)
-            
-            # Create mapping of field names to display names
-            field_to_display = {
-                item.get('field'): item.get('display_name', item.get('field'))
-                for item in self.output_structure if 'field' in item
-            }
-            
-            # Get ordered list of fields
-            ordered_fields = [item.get('field') for item in self.output_structure if 'field' in item]
-            
-            # If no structure defined, use all fields from first record
-            if not ordered_fields and data:
-                ordered_fields = list(data[0].keys())
+        return self.export_records(data, output_path)
+    
+    def export_records(self, records: Iterable[Dict[str, Any]], output_path: str) -> str:
+        """
+        Export records to text format as they are consumed.
+        
+        Args:
+            records: Dictionaries containing structured data
+            output_path: Directory path where the output file will be saved
             
-            # Create output file path
-            file_name = os.path.join(output_path, 'extracted_data.txt')
+        Returns:
+            Path to the created text file, or an empty string on error
+        """
+        self.open(output_path)
+        self.write(records)
+        return self.close()
+    
+    def open(self, output_path: str) -> None:
+        """
+        Create the text file and prepare it for writing records in batches.
+        
+        Rows are written with the csv module: fields containing the delimiter,
+        quotes or line breaks are quoted and embedded quotes are doubled.
+        
+        Args:
+            output_path: Directory path where the output file will be saved
+        """
+        # Get text-specific settings
+        self.delimiter = self.config.get('delimiter', '|')
+        self.include_header = self.config.get('include_header', True)
+        self.compression = self.config.get('compression')
+        
+        # Create mapping of field names to display names
+        self.field_to_display = {
+            item.get('field'): item.get('display_name', item.get('field'))
+            for item in self.output_structure if 'field' in item
+        }
+        
+        # Get ordered list of fields
+        self.ordered_fields = [item.get('field') for item in self.output_structure if 'field' in item]
+        
+        # Create output file path
+        self.file_name = os.path.join(output_path, 'extracted_data.txt')
+        if self.compression:
+            self.file_name += self.COMPRESSION_SUFFIXES.get(self.compression, '')
+        self.started = False
+        
+        try:
+            self.file = self._open_file()
+            self.writer = csv.writer(self.file, delimiter=self.delimiter, lineterminator='\n')
+        except Exception as e:
+            self._fail(e)
+    
+    def write(self, records: Iterable[Dict[str, Any]]) -> None:
+        """
+        Write a batch of records to the text file.
+        
+        Args:
+            records: Dictionaries containing structured data
+        """
+        if self.file is None:
+            return
+        
+        records = iter(records)
+        
+        try:
+            if not self.started:
+                first_record = next(records, None)
+                if first_record is None:
+                    return
+                self._start(first_record)
+                records = chain([first_record], records)
             
-            with open(file_name, 'w', encoding='utf-8') as file:
-                # Write header if requested
-                if include_header:
-                    header = delimiter.join([field_to_display.get(field, field) for field in ordered_fields])
-                    file.write(header + '\n')
+            # Write data rows
+            while True:
+                batch = list(islice(records, self.ROWS_PER_WRITE))
+                if not batch:
+                    break
                 
-                # Write data rows
-                for record in data:
-                    row_values = []
-                    for field in ordered_fields:
-                        if field in record:
-                            # Convert value to string and escape delimiter if present
-                            value = str(record[field])
-                            if delimiter in value:
-                                value = f'"{value}"'
-                            row_values.append(value)
-                        else:
-                            row_values.append('')
-                    
-                    file.write(delimiter.join(row_values) + '\n')
-            
-            return file_name
-            
+                try:
+                    rows = list(map(self._get_row, batch))
+                except KeyError:
+                    # Some records lack fields, which are written as empty values
+                    rows = [[record.get(field, '') for field in self.ordered_fields] for record in batch]
+                
+                self._write_rows(rows)
         except Exception as e:
-            print(f"Error exporting to text: {str(e)}")
+            self._fail(e)
+    
+    def close(self) -> str:
+        """
+        Finish and close the text file.
+        
+        Returns:
+            Path to the created text file, or an empty string on error
+        """
+        if self.file is None:
             return ""
+        
+        try:
+            if not self.started:
+                self._start(None)
+            self.file.close()
+        except Exception as e:
+            self._fail(e)
+            return ""
+        
+        self.file = None
+        self.writer = None
+        return self.file_name
+    
+    def _write_rows(self, rows: List[Any]) -> None:
+        """
+        Write rows of field values to the file.
+        
+        Rows of plain strings that need no quoting are joined and written in
+        one call, which gives the same text as the CSV writer in a fraction of
+        the time. Any other batch is written by the CSV writer.
+        
+        Args:
+            rows: Sequences of field values, one per record
+        """
+        field_count = len(self.ordered_fields)
+        
+        # A lone empty field is quoted by the CSV writer, so single fields always go through it
+        if field_count > 1:
+            try:
+                text = '\n'.join(map(self.delimiter.join, rows))
+            except TypeError:
+                # Not all values are strings
+                text = None
+            
+            # Every delimiter and line break in the text must be one the rows were joined with
+            if (
+                text is not None
+                and '"' not in text
+                and '\r' not in text
+                and text.count('\n') == len(rows) - 1
+                and text.count(self.delimiter) == len(rows) * (field_count - 1)
+            ):
+                self.file.write(text)
+                self.file.write('\n')
+                return
+        
+        self.writer.writerows(rows)
+    
+    def _open_file(self) -> io.TextIOBase:
+        """
+        Open the output file for writing text, compressed if configured.
+        
+        Returns:
+            Buffered text stream writing to the output file
+            
+        Raises:
+            ValueError: If the compression is not supported
+            ImportError: If zstd compression is used without the zstandard package
+        """
+        if not self.compression:
+            return open(self.file_name, 'w', encoding='utf-8', newline='', buffering=self.BUFFER_SIZE)
+        
+        if self.compression not in self.COMPRESSION_SUFFIXES:
+            raise ValueError(f"Unsupported compression: {self.compression}")
+        
+        level = self.config.get('compression_level', self.DEFAULT_COMPRESSION_LEVELS[self.compression])
+        
+        if self.compression == 'zstd' and zstandard is None:
+            raise ImportError("zstd compression requires the 'zstandard' package")
+        
+        if self.compression == 'gzip':
+            compressed = gzip.GzipFile(self.file_name, mode='wb', compresslevel=level)
+        else:
+            # The stream writer closes the file when it is closed
+            compressed = zstandard.ZstdCompressor(level=level).stream_writer(open(self.file_name, 'wb'))
+        
+        return io.TextIOWrapper(
+            io.BufferedWriter(compressed, self.BUFFER_SIZE),
+            encoding='utf-8',
+            newline=''
+        )
+    
+    def _start(self, first_record: Optional[Dict[str, Any]]) -> None:
+        """
+        Write the header, once the first record (if any) is known.
+        
+        Args:
+            first_record: First record to be written, or None if there are none
+        """
+        # If no structure defined, use all fields from first record
+        if not self.ordered_fields and first_record:
+            self.ordered_fields = list(first_record.keys())
+        
+        self._get_row = self._row_getter(self.ordered_fields)
+        
+        # Write header if requested
+        if self.include_header:
+            self.writer.writerow([self.field_to_display.get(field, field) for field in self.ordered_fields])
+        
+        self.started = True
+    
+    @staticmethod
+    def _row_getter(fields: List[str]) -> Callable[[Dict[str, Any]], Any]:
+        """
+        Build the function getting the row values of a record.
+        
+        Args:
+            fields: Ordered output fields
+            
+        Returns:
+            Function returning the values of the fields in a record; it raises
+            KeyError if the record lacks one of them
+        """
+        if len(fields) == 1:
+            field = fields[0]
+            return lambda record: (record[field],)
+        
+        if not fields:
+            return lambda record: ()
+        
+        return itemgetter(*fields)
+    
+    def _fail(self, error: Exception) -> None:
+        """Report an export error and stop writing."""
+        print(f"Error exporting to text: {str(error)}")
+        
+        if self.file is not None:
+            self.file.close()
+        self.file = None
+        self.writer = None
@@ -3,12 +3,20 @@ Parser module for text files.
 Extracts data from text files based on regex patterns defined in the configuration.
 """
 import re
-from typing import Dict, List, Any
+from typing import Dict, Iterable, Iterator, List, Any, Optional
+
+from .pattern_matcher import PatternMatcher
 
 
 class TextParser:
     """Parser for extracting data from text files using regex patterns."""
     
+    # Version of the records produced; bump it when parsing results change
+    VERSION = 2
+    
+    # Input configuration keys that affect the records produced
+    CONFIG_KEYS = ('text_patterns', 'text_single_pass', 'text_stream_lines', 'text_record_delimiter')
+    
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize the text parser with configuration.
@@ -17,6 +25,35 @@ class TextParser:
             config: Dictionary containing text pattern configurations
         """
         self.patterns = config.get('text_patterns', [])
+        self.matcher = PatternMatcher(self.patterns, config.get('text_single_pass', False))
+        self.stream_lines = config.get('text_stream_lines', False)
+        
+        # Streaming lines only gives the same records as reading the text whole
+        # for patterns that always match within a single line
+        if self.stream_lines and not self.matcher.line_safe:
+            print("Reading text files whole: some text patterns can match across lines or use ^, $, \\A or \\Z without (?m)")
+            self.stream_lines = False
+        self.record_delimiter = self._compile_delimiter(config.get('text_record_delimiter'))
+    
+    @staticmethod
+    def _compile_delimiter(pattern: Optional[str]) -> Optional['re.Pattern']:
+        """
+        Compile the regex matching the lines that separate records.
+        
+        Args:
+            pattern: Record delimiter pattern from the configuration
+            
+        Returns:
+            Compiled regex, or None if records are not split
+        """
+        if not pattern:
+            return None
+        
+        try:
+            return re.compile(pattern)
+        except re.error as e:
+            print(f"Invalid record delimiter '{pattern}': {str(e)}")
+            return None
     
     def parse(self, file_path: str) -> List[Dict[str, Any]]:
         """
@@ -29,41 +66,78 @@ class TextParser:
             List of dictionaries containing extracted data
         """
         results = []
-        record = {}
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                content = file.read()
-                
-                for pattern_config in self.patterns:
-                    name = pattern_config.get('name')
-                    pattern = pattern_config.get('pattern')
-                    group = pattern_config.get('group', 1)
-                    value_type = pattern_config.get('type', 'str')
-                    
-                    if not name or not pattern:
-                        continue
-                    
-                    matches = re.finditer(pattern, content)
-                    for match in matches:
-                        try:
-                            value = match.group(group)
-                            
-                            # Convert value to specified type
-                            if value_type == 'int':
-                                value = int(value)
-                            elif value_type == 'float':
-                                value = float(value)
-                            
-                            record[name] = value
-                        except (IndexError, ValueError):
-                            continue
-            
-            # If we found any data, add it to results
-            if record:
+            for record in self.iter_records(file_path):
                 results.append(record)
                 
         except Exception as e:
             print(f"Error parsing text file {file_path}: {str(e)}")
         
         return results
+    
+    def iter_records(self, file_path: str) -> Iterator[Dict[str, Any]]:
+        """
+        Stream records from a text file.
+        
+        Without a record delimiter the whole file forms a single record. With one,
+        the file is read in a single pass and every block of lines between two
+        delimiter lines yields its own record.
+        
+        Args:
+            file_path: Path to the text file
+            
+        Yields:
+            Dictionaries containing extracted data
+        """
+        with open(file_path, 'r', encoding='utf-8') as file:
+            if self.record_delimiter is None:
+                blocks = [file] if self.stream_lines else [[file.read()]]
+            else:
+                blocks = self._iter_blocks(file)
+            
+            for block in blocks:
+                record = self._extract(block)
+                
+                # If we found any data, yield it
+                if record:
+                    yield record
+    
+    def _iter_blocks(self, lines: Iterable[str]) -> Iterator[List[str]]:
+        """
+        Split lines into blocks separated by record delimiter lines.
+        
+        Args:
+            lines: Lines of the text file
+            
+        Yields:
+            Lists of consecutive non-delimiter lines
+        """
+        block = []
+        
+        for line in lines:
+            if self.record_delimiter.search(line.rstrip('\n')):
+                if block:
+                    yield block
+                block = []
+            else:
+                block.append(line)
+        
+        if block:
+            yield block
+    
+    def _extract(self, lines: Iterable[str]) -> Dict[str, Any]:
+        """
+        Extract a record from a block of text.
+        
+        Args:
+            lines: Text of the block, as its lines or as a single string
+            
+        Returns:
+            Dictionary containing extracted data
+        """
+        # Matching line by line keeps only one line in memory at a time
+        if self.stream_lines:
+            return self.matcher.extract(lines)
+        
+        return self.matcher.extract([''.join(lines)])
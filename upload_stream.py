@@ -0,0 +1,208 @@
+"""
+Upload stream module for the Text Extractor web interface.
+Saves the files of a multipart upload as the request body is received, and
+starts parsing each input file as soon as it is complete.
+"""
+import hashlib
+from concurrent.futures import Executor, Future
+from typing import BinaryIO, Callable, Dict, List, Any, Optional
+
+from werkzeug.sansio.multipart import Data, Epilogue, Field, File, MultipartDecoder, NeedData
+
+from src.config.config_cache import ConfigCache
+from src.parser.extraction_cache import ExtractionCache
+
+
+class StreamingUpload:
+    """Multipart request body whose files are written straight to their destination as they arrive."""
+    
+    # Size of the chunks read from the request body
+    CHUNK_SIZE = 256 * 1024
+    
+    # Maximum size of a form field that is not a file
+    MAX_FIELD_SIZE = 1024 * 1024
+    
+    def __init__(
+        self,
+        file_path: Callable[[str, str], Optional[str]],
+        on_file: Optional[Callable[[Dict[str, Any]], None]] = None
+    ):
+        """
+        Initialize the upload.
+        
+        Args:
+            file_path: Function returning the path to save a file under from its
+                form field name and file name, or None to skip the file
+            on_file: Function called with the description of each saved file
+                (see files) as soon as it is complete, if any
+        """
+        self.file_path = file_path
+        self.on_file = on_file
+        
+        # Values of the form fields by name, and descriptions of the saved files
+        self.fields: Dict[str, List[str]] = {}
+        self.files: List[Dict[str, Any]] = []
+    
+    def receive(self, stream: BinaryIO, boundary: bytes) -> None:
+        """
+        Read a multipart request body, saving its files and collecting its fields.
+        
+        Every saved file is described by a dictionary with its form 'field'
+        name, the uploaded 'filename', the 'path' it was saved to, its 'size'
+        and the 'sha256' digest of its content, computed while writing it.
+        
+        Args:
+            stream: Request body stream
+            boundary: Multipart boundary of the request
+            
+        Raises:
+            ValueError: If the request body is not valid multipart data
+        """
+        decoder = MultipartDecoder(boundary, max_form_memory_size=self.MAX_FIELD_SIZE)
+        self._part = None
+        self._output = None
+        
+        # The decoder adds a line break character to the last part when the data it has
+        # ends between the two dashes of the closing boundary, so such a dash is held
+        # back until the next chunk; the end of the data received so far is kept to
+        # recognize a boundary split across chunks
+        closing = b'--' + boundary + b'-'
+        received = b''
+        held = b''
+        
+        try:
+            for chunk in iter(lambda: stream.read(self.CHUNK_SIZE), b''):
+                data, held = held + chunk, b''
+                if (received + data).endswith(closing):
+                    data, held = data[:-1], data[-1:]
+                received = (received + data)[-len(closing):]
+                
+                decoder.receive_data(data)
+                self._handle_events(decoder)
+            
+            # Signal the end of the body
+            decoder.receive_data(held)
+            decoder.receive_data(None)
+            self._handle_events(decoder)
+        finally:
+            if self._output is not None:
+                self._output.close()
+                self._output = None
+    
+    def _handle_events(self, decoder: MultipartDecoder) -> None:
+        """Handle the parts and data decoded so far."""
+        event = decoder.next_event()
+        
+        while not isinstance(event, (Epilogue, NeedData)):
+            if isinstance(event, File):
+                self._start_file(event)
+            elif isinstance(event, Field):
+                self._part = event
+                self._value = []
+            elif isinstance(event, Data):
+                self._add_data(event)
+            
+            event = decoder.next_event()
+    
+    def _start_file(self, part: File) -> None:
+        """Open the destination of a file part, unless the file is skipped."""
+        self._part = part
+        path = self.file_path(part.name, part.filename or '')
+        
+        if path is not None:
+            self._output = open(path, 'wb')
+            self._digest = hashlib.sha256()
+            self._path = path
+            self._size = 0
+    
+    def _add_data(self, data: Data) -> None:
+        """Write or collect a piece of the current part."""
+        if isinstance(self._part, File):
+            if self._output is not None:
+                self._output.write(data.data)
+                self._digest.update(data.data)
+                self._size += len(data.data)
+                if not data.more_data:
+                    self._finish_file()
+        else:
+            self._value.append(data.data)
+            if not data.more_data:
+                value = b''.join(self._value).decode('utf-8', 'replace')
+                self.fields.setdefault(self._part.name, []).append(value)
+    
+    def _finish_file(self) -> None:
+        """Close a complete file and report it."""
+        self._output.close()
+        self._output = None
+        
+        upload = {
+            'field': self._part.name,
+            'filename': self._part.filename,
+            'path': self._path,
+            'size': self._size,
+            'sha256': self._digest.hexdigest(),
+        }
+        self.files.append(upload)
+        
+        if self.on_file is not None:
+            self.on_file(upload)
+
+
+class UploadParser:
+    """Parser of the input files of an upload into an extraction cache, started as each file is received."""
+    
+    def __init__(self, executor: Executor, cache: ExtractionCache, config_cache: ConfigCache, config_field: str):
+        """
+        Initialize the upload parser.
+        
+        Input files that arrive before the configuration file are parsed once
+        it has been received.
+        
+        Args:
+            executor: Executor running the parses
+            cache: Extraction cache receiving the parsed records
+            config_cache: Cache of loaded configurations and their parsers
+            config_field: Form field name of the configuration file
+        """
+        self.executor = executor
+        self.cache = cache
+        self.config_cache = config_cache
+        self.config_field = config_field
+        
+        # Content hashes of the uploaded files by path, computed while saving them
+        self.content_hashes: Dict[str, str] = {}
+        self.factory = None
+        self.pending: List[str] = []
+        self.futures: List[Future] = []
+    
+    def file_received(self, upload: Dict[str, Any]) -> None:
+        """
+        Start parsing a complete file of the upload.
+        
+        Args:
+            upload: Description of the saved file, as given by StreamingUpload
+        """
+        self.content_hashes[upload['path']] = upload['sha256']
+        
+        if upload['field'] != self.config_field:
+            if self.factory is not None:
+                self._submit(upload['path'])
+            else:
+                self.pending.append(upload['path'])
+            return
+        
+        try:
+            config = self.config_cache.load(upload['path'], upload['sha256'])
+        except Exception as e:
+            # The extraction job reports invalid configurations
+            print(f"Not parsing uploaded files early: {str(e)}")
+            return
+        
+        self.factory = config.parser_factory(self.cache, self.content_hashes)
+        for file_path in self.pending:
+            self._submit(file_path)
+        self.pending = []
+    
+    def _submit(self, file_path: str) -> None:
+        """Parse a file in the executor; errors are reported again when the job parses it."""
+        self.futures.append(self.executor.submit(self.factory.parse_file, file_path))
@@ -0,0 +1,522 @@
+"""
+Watcher module for the Text Extractor tool.
+Keeps one process running that extracts input files as they appear in watched
+directories, in micro-batches appended to rolling output segments.
+"""
+import os
+import time
+import shutil
+import signal
+import select
+from itertools import chain
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Dict, List, Any, Optional, Tuple
+
+from .parser.parser_factory import ParserFactory
+from .utils.extraction_manifest import ExtractionManifest
+from .pipeline import DEFAULT_BATCH_SIZE, ExportFormatter, create_exporters, iter_batches, iter_structured
+
+
+class _Inotify:
+    """Minimal inotify binding (Linux) used to wake the watcher up when a watched directory changes."""
+    
+    # Events that may make a file new, changed or complete: IN_MODIFY, IN_CLOSE_WRITE,
+    # IN_MOVED_TO and IN_CREATE
+    EVENT_MASK = 0x002 | 0x008 | 0x080 | 0x100
+    
+    def __init__(self):
+        """
+        Create the inotify instance.
+        
+        Raises:
+            OSError: If inotify is not available
+        """
+        import ctypes
+        import ctypes.util
+        
+        self._libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        if not hasattr(self._libc, 'inotify_init1'):
+            raise OSError("inotify is not available on this platform")
+        
+        self._get_errno = ctypes.get_errno
+        self.fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(self._get_errno(), "inotify_init1 failed")
+        
+        self.directories = set()
+    
+    def add(self, directory: str) -> None:
+        """
+        Watch a directory, unless it is already watched.
+        
+        Args:
+            directory: Directory path
+            
+        Raises:
+            OSError: If the directory cannot be watched (e.g. the watch limit is reached)
+        """
+        if directory in self.directories:
+            return
+        
+        if self._libc.inotify_add_watch(self.fd, os.fsencode(directory), self.EVENT_MASK) < 0:
+            raise OSError(self._get_errno(), f"Cannot watch {directory}")
+        self.directories.add(directory)
+    
+    def wait(self, timeout: float) -> bool:
+        """
+        Wait for events in the watched directories, and discard them.
+        
+        Args:
+            timeout: Maximum number of seconds to wait
+            
+        Returns:
+            True if any event occurred
+        """
+        readable, _, _ = select.select([self.fd], [], [], max(timeout, 0))
+        if not readable:
+            return False
+        
+        # The events only tell that something changed; the next scan finds out what
+        try:
+            while os.read(self.fd, 65536):
+                pass
+        except BlockingIOError:
+            pass
+        
+        return True
+    
+    def close(self) -> None:
+        """Close the inotify instance."""
+        os.close(self.fd)
+
+
+class DirectoryWatcher:
+    """Detector of files that are new or changed in a set of directories, once their content has settled."""
+    
+    # Seconds between full scans when inotify reports changes, to catch any missed event
+    RESCAN_INTERVAL = 60.0
+    
+    def __init__(
+        self,
+        directories: List[str],
+        accept: Callable[[str], bool],
+        settle: float = 1.0,
+        poll_interval: float = 2.0,
+        use_inotify: bool = True
+    ):
+        """
+        Initialize the watcher.
+        
+        Files present when the watcher starts are reported like new files.
+        
+        Args:
+            directories: Directories watched, with their subdirectories
+            accept: Function telling whether a file path is of interest
+            settle: Seconds a file's size and modification time must stay
+                unchanged before it is reported, so that files still being
+                written are not read
+            poll_interval: Seconds between scans when inotify is not used
+            use_inotify: Use inotify to be woken up by changes when available,
+                instead of scanning every poll_interval seconds
+        """
+        self.directories = [os.path.abspath(directory) for directory in directories]
+        self.accept = accept
+        self.settle = settle
+        self.poll_interval = poll_interval
+        
+        # Signatures (size, modification time) of the reported files, and of the
+        # files waiting to settle with the time they were last seen changing
+        self.reported: Dict[str, Tuple[int, int]] = {}
+        self.pending: Dict[str, Tuple[Tuple[int, int], float]] = {}
+        
+        self.inotify = None
+        if use_inotify:
+            try:
+                self.inotify = _Inotify()
+            except OSError as e:
+                print(f"Watching by polling every {poll_interval} s: {str(e)}")
+        
+        self._next_scan = 0.0
+    
+    def poll(self, timeout: float) -> List[str]:
+        """
+        Wait for files to become ready.
+        
+        Args:
+            timeout: Maximum number of seconds to wait
+            
+        Returns:
+            Sorted paths of the files that are new or changed since they were
+            last reported, possibly empty if none became ready in time
+        """
+        deadline = time.monotonic() + timeout
+        changed = False
+        
+        while True:
+            now = time.monotonic()
+            if changed or now >= self._next_scan:
+                ready = self._scan(now)
+                
+                if self.pending:
+                    self._next_scan = now + self.settle
+                elif self.inotify is not None:
+                    self._next_scan = now + self.RESCAN_INTERVAL
+                else:
+                    self._next_scan = now + self.poll_interval
+                
+                if ready:
+                    return ready
+            
+            if now >= deadline:
+                return []
+            
+            wait = min(deadline, self._next_scan) - now
+            if self.inotify is not None:
+                changed = self.inotify.wait(wait)
+            else:
+                time.sleep(max(wait, 0))
+    
+    def close(self) -> None:
+        """Stop watching."""
+        if self.inotify is not None:
+            self.inotify.close()
+            self.inotify = None
+    
+    def _scan(self, now: float) -> List[str]:
+        """Scan the directories and return the files that settled since the last scan."""
+        signatures = {}
+        for directory in self.directories:
+            self._scan_directory(directory, signatures)
+        
+        ready = []
+        for path, signature in signatures.items():
+            if self.reported.get(path) == signature:
+                continue
+            
+            pending = self.pending.get(path)
+            if pending is not None and pending[0] == signature and now - pending[1] >= self.settle:
+                del self.pending[path]
+                self.reported[path] = signature
+                ready.append(path)
+            elif pending is None or pending[0] != signature:
+                self.pending[path] = (signature, now)
+        
+        # Forget deleted files, so that a file created again under the same name is reported
+        for files in (self.reported, self.pending):
+            for path in [path for path in files if path not in signatures]:
+                del files[path]
+        
+        return sorted(ready)
+    
+    def _scan_directory(self, directory: str, signatures: Dict[str, Tuple[int, int]]) -> None:
+        """Collect the signatures of the accepted files of a directory tree."""
+        if self.inotify is not None:
+            try:
+                self.inotify.add(directory)
+            except OSError as e:
+                print(f"Watching by polling every {self.poll_interval} s: {str(e)}")
+                self.inotify.close()
+                self.inotify = None
+        
+        try:
+            entries = list(os.scandir(directory))
+        except OSError as e:
+            print(f"Error scanning directory {directory}: {str(e)}")
+            return
+        
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    self._scan_directory(entry.path, signatures)
+                elif entry.is_file() and self.accept(entry.path):
+                    stat = entry.stat()
+                    signatures[entry.path] = (stat.st_size, stat.st_mtime_ns)
+            except OSError:
+                # Deleted while scanning
+                continue
+
+
+class RollingOutput:
+    """Output segments of a watch run, each one a directory with one file per export format."""
+    
+    # Suffix of the directory of the segment being written
+    PARTIAL_SUFFIX = '.partial'
+    
+    def __init__(
+        self,
+        output_dir: str,
+        formats: List[str],
+        output_config: Dict[str, Any],
+        export_config: Dict[str, Any],
+        roll_interval: float = 60.0,
+        roll_records: int = 100000
+    ):
+        """
+        Initialize the rolling output.
+        
+        Records are appended to the exporters of the current segment, which is
+        written to a directory ending with .partial. When the segment rolls over,
+        its exporters are closed and the directory is renamed without the suffix,
+        so that complete segments appear atomically.
+        
+        Args:
+            output_dir: Directory holding the segment directories
+            formats: List of export formats
+            output_config: Output configuration
+            export_config: Export configuration
+            roll_interval: Seconds after which a segment rolls over (0 closes a
+                segment after every micro-batch)
+            roll_records: Number of records after which a segment rolls over
+        """
+        self.output_dir = output_dir
+        self.formats = formats
+        self.output_config = output_config
+        self.export_config = export_config
+        self.roll_interval = roll_interval
+        self.roll_records = roll_records
+        
+        # Directory, exporters, their formatter, opening time and record count of the current segment
+        self.segment_dir = None
+        self.exporters = {}
+        self.formatter = None
+        self.opened = 0.0
+        self.count = 0
+    
+    def remove_partial_segments(self) -> None:
+        """Remove the segments left unfinished by an interrupted run; their files are extracted again."""
+        for name in os.listdir(self.output_dir):
+            path = os.path.join(self.output_dir, name)
+            if name.endswith(self.PARTIAL_SUFFIX) and os.path.isdir(path):
+                print(f"Removing unfinished segment {path}")
+                shutil.rmtree(path, ignore_errors=True)
+    
+    def write(self, batch: List[Dict[str, Any]]) -> None:
+        """
+        Append a batch of structured records to the current segment, opening one if needed.
+        
+        Args:
+            batch: Dictionaries containing structured data, not formatted
+        """
+        if self.segment_dir is None:
+            self._open()
+        
+        batches = self.formatter.batches(batch)
+        for format_name, exporter in self.exporters.items():
+            exporter.write(batches[format_name])
+        self.count += len(batch)
+    
+    def roll_due(self) -> bool:
+        """
+        Check whether the current segment should be closed.
+        
+        Returns:
+            True if a segment is open and has reached its age or size limit
+        """
+        if self.segment_dir is None:
+            return False
+        
+        return self.count >= self.roll_records or time.monotonic() - self.opened >= self.roll_interval
+    
+    def time_to_roll(self) -> Optional[float]:
+        """
+        Get the number of seconds until the current segment is due to roll over.
+        
+        Returns:
+            Seconds left, or None if no segment is open
+        """
+        if self.segment_dir is None:
+            return None
+        
+        return max(self.opened + self.roll_interval - time.monotonic(), 0)
+    
+    def close(self) -> Dict[str, str]:
+        """
+        Close the current segment, if any.
+        
+        Returns:
+            Dictionary mapping format names to the paths of the segment's output files
+        """
+        if self.segment_dir is None:
+            return {}
+        
+        results = {format_name: exporter.close() for format_name, exporter in self.exporters.items()}
+        self.formatter.report()
+        
+        final_dir = self.segment_dir[:-len(self.PARTIAL_SUFFIX)]
+        os.replace(self.segment_dir, final_dir)
+        results = {
+            format_name: os.path.join(final_dir, os.path.relpath(file_path, self.segment_dir)) if file_path else ""
+            for format_name, file_path in results.items()
+        }
+        
+        self.segment_dir = None
+        self.exporters = {}
+        self.formatter = None
+        return results
+    
+    def _open(self) -> None:
+        """Create the directory and exporters of a new segment."""
+        name = time.strftime('segment-%Y%m%d-%H%M%S')
+        sequence = 0
+        while True:
+            segment_name = f"{name}-{sequence:03d}"
+            if not any(
+                os.path.exists(os.path.join(self.output_dir, segment_name + suffix))
+                for suffix in ('', self.PARTIAL_SUFFIX)
+            ):
+                break
+            sequence += 1
+        
+        self.segment_dir = os.path.join(self.output_dir, segment_name + self.PARTIAL_SUFFIX)
+        os.makedirs(self.segment_dir)
+        
+        self.exporters = create_exporters(self.formats, self.output_config, self.export_config)
+        self.formatter = ExportFormatter(self.exporters, self.output_config)
+        for exporter in self.exporters.values():
+            exporter.open(self.segment_dir)
+        
+        self.opened = time.monotonic()
+        self.count = 0
+
+
+class ExtractionWatcher:
+    """Long-running extraction of the files that appear in watched directories."""
+    
+    # Name of the manifest of the files already extracted, in the output directory
+    MANIFEST_NAME = '.watch_manifest'
+    
+    # Maximum number of seconds between checks for a stop request
+    STOP_CHECK_INTERVAL = 1.0
+    
+    def __init__(
+        self,
+        watcher: DirectoryWatcher,
+        output: RollingOutput,
+        input_config: Dict[str, Any],
+        workers: int = 1,
+        max_batch_files: int = 100,
+        batch_size: int = DEFAULT_BATCH_SIZE
+    ):
+        """
+        Initialize the extraction watcher.
+        
+        The parsers, and with several workers the pool of worker processes
+        started by run(), are created once and reused for every micro-batch. Files are
+        recorded in the manifest when the segment holding their records is
+        complete, so files whose records were lost by an interrupted run are
+        extracted again on the next start, and files extracted before are not.
+        
+        Args:
+            watcher: Watcher of the input directories
+            output: Rolling output receiving the records
+            input_config: Input configuration
+            workers: Number of worker processes used to parse a micro-batch
+            max_batch_files: Maximum number of files extracted per micro-batch
+            batch_size: Number of records handed to the exporters at a time
+        """
+        self.watcher = watcher
+        self.output = output
+        self.workers = workers
+        self.max_batch_files = max_batch_files
+        self.batch_size = batch_size
+        
+        self.parser_factory = ParserFactory(input_config)
+        self.executor = None
+        self.manifest = ExtractionManifest(
+            os.path.join(output.output_dir, self.MANIFEST_NAME),
+            {'input': input_config, 'parsers': ParserFactory.parser_versions()}
+        )
+        self.stopping = False
+    
+    def run(self) -> None:
+        """Extract new and changed files until SIGINT or SIGTERM is received, then close the current segment."""
+        for signal_number in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(signal_number, self._stop)
+        
+        self.output.remove_partial_segments()
+        
+        if self.workers > 1:
+            self.executor = self.parser_factory.create_executor(self.workers)
+        
+        try:
+            while not self.stopping:
+                timeout = self.STOP_CHECK_INTERVAL
+                time_to_roll = self.output.time_to_roll()
+                if time_to_roll is not None:
+                    timeout = min(timeout, time_to_roll)
+                
+                ready = self.watcher.poll(timeout)
+                for start in range(0, len(ready), self.max_batch_files):
+                    self.process(ready[start:start + self.max_batch_files])
+                    if self.output.roll_due():
+                        self.roll()
+                
+                if self.output.roll_due():
+                    self.roll()
+        finally:
+            self.roll()
+            self.watcher.close()
+            if self.executor is not None:
+                self.executor.shutdown()
+                self.executor = None
+    
+    def process(self, file_paths: List[str]) -> None:
+        """
+        Extract a micro-batch of files and append their records to the current segment.
+        
+        Args:
+            file_paths: Paths of the files to extract
+        """
+        # Files deleted since they were reported are skipped
+        changed_files = [
+            file_path for file_path in file_paths
+            if os.path.exists(file_path) and self.manifest.lookup(file_path) is None
+        ]
+        
+        if not changed_files:
+            return
+        
+        extracted = []
+        remaining = changed_files
+        
+        # A second attempt parses the files left when a worker process died
+        for _ in range(2):
+            try:
+                for file_path, data in self.parser_factory.parse_files(remaining, self.workers, self.executor):
+                    extracted.append(data)
+                    remaining = remaining[1:]
+                    
+                    # Only the fact that the file was extracted is remembered, not its records.
+                    # Files without data are retried when they change or on the next start.
+                    if data:
+                        self.manifest.update(file_path, [])
+                break
+            except BrokenProcessPool as e:
+                print(f"Error parsing files: {str(e)}")
+                if self.executor is None:
+                    break
+                
+                # The broken pool cannot run anything anymore, so a new one is started
+                self.executor.shutdown()
+                self.executor = self.parser_factory.create_executor(self.workers)
+        
+        count = 0
+        for batch in iter_batches(iter_structured(chain.from_iterable(extracted), self.output.output_config), self.batch_size):
+            self.output.write(batch)
+            count += len(batch)
+        
+        print(f"Processed {len(changed_files)} files and extracted {count} records")
+    
+    def roll(self) -> None:
+        """Close the current segment and record its files in the manifest."""
+        results = self.output.close()
+        for format_name, file_path in results.items():
+            if file_path:
+                print(f"Exported to {format_name}: {file_path}")
+        
+        # Forget the files that no longer exist
+        self.manifest.save([path for path in self.manifest.entries if os.path.exists(path)])
+    
+    def _stop(self, signal_number: int, frame: Any) -> None:
+        """Signal handler requesting the watcher to stop after the current micro-batch."""
+        self.stopping = True
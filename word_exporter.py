@@ -3,10 +3,16 @@ Word exporter module.
 Exports structured data to Word document format.
 """
 import os
+from copy import deepcopy
 import docx
+from docx.oxml.ns import qn
 from docx.shared import Pt, RGBColor
 from docx.enum.text import WD_ALIGN_PARAGRAPH
-from typing import Dict, List, Any
+from typing import Dict, Iterable, List, Any
+
+
+# Tag of the table cell elements of a table row
+TC_TAG = qn('w:tc')
 
 
 class WordExporter:
@@ -21,6 +27,9 @@ class WordExporter:
         """
         self.config = config.get('word', {})
         self.output_structure = config.get('structure', [])
+        
+        # Document being written, between open() and close()
+        self.doc = None
     
     def export(self, data: List[Dict[str, Any]], output_path: str) -> str:
         """
@@ -33,67 +42,164 @@ class WordExporter:
         Returns:
             Path to the created Word document
         """
+        return self.export_records(data, output_path)
+    
+    def export_records(self, records: Iterable[Dict[str, Any]], output_path: str) -> str:
+        """
+        Export records to Word document format as they are consumed.
+        
+        Args:
+            records: Dictionaries containing structured data
+            output_path: Directory path where the output file will be saved
+            
+        Returns:
+            Path to the created Word document, or an empty string on error
+        """
+        self.open(output_path)
+        self.write(records)
+        return self.close()
+    
+    def open(self, output_path: str) -> None:
+        """
+        Start a Word document whose records are written in batches.
+        
+        Args:
+            output_path: Directory path where the output file will be saved
+        """
+        # Create output file path
+        self.file_name = os.path.join(output_path, 'extracted_data.docx')
+        self.count = 0
+        self.table = None
+        self.summary = None
+        
         try:
             # Create a new Word document
-            doc = docx.Document()
+            self.doc = docx.Document()
             
             # Add title
             title = self.config.get('title', 'Extracted Data Report')
-            title_paragraph = doc.add_paragraph()
+            title_paragraph = self.doc.add_paragraph()
             title_run = title_paragraph.add_run(title)
             title_run.bold = True
             title_run.font.size = Pt(16)
             title_paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
             
-            # Add summary if requested
+            # Add summary if requested; the record count is filled in by close()
             if self.config.get('include_summary', True):
-                doc.add_paragraph(f"Total records: {len(data)}")
-                doc.add_paragraph()
+                self.summary = self.doc.add_paragraph()
+                self.doc.add_paragraph()
             
-            # Add table if requested
-            if self.config.get('include_table', True) and data:
-                # Create mapping of field names to display names
-                field_to_display = {
-                    item.get('field'): item.get('display_name', item.get('field'))
-                    for item in self.output_structure if 'field' in item
-                }
-                
-                # Get ordered list of fields
-                ordered_fields = [item.get('field') for item in self.output_structure if 'field' in item]
-                
-                # If no structure defined, use all fields from first record
-                if not ordered_fields and data:
-                    ordered_fields = list(data[0].keys())
-                
-                # Create table
-                table = doc.add_table(rows=1, cols=len(ordered_fields))
-                table.style = 'Table Grid'
+            # Create mapping of field names to display names
+            self.field_to_display = {
+                item.get('field'): item.get('display_name', item.get('field'))
+                for item in self.output_structure if 'field' in item
+            }
+            
+            # Get ordered list of fields
+            self.ordered_fields = [item.get('field') for item in self.output_structure if 'field' in item]
+        except Exception as e:
+            self._fail(e)
+    
+    def write(self, records: Iterable[Dict[str, Any]]) -> None:
+        """
+        Add a batch of records to the Word document.
+        
+        Args:
+            records: Dictionaries containing structured data
+        """
+        if self.doc is None:
+            return
+        
+        include_table = self.config.get('include_table', True)
+        
+        try:
+            for record in records:
+                self.count += 1
+                if not include_table:
+                    continue
                 
-                # Add header row
-                header_cells = table.rows[0].cells
-                for i, field in enumerate(ordered_fields):
-                    display_name = field_to_display.get(field, field)
-                    header_cells[i].text = display_name
-                    # Make header bold
-                    for paragraph in header_cells[i].paragraphs:
-                        for run in paragraph.runs:
-                            run.bold = True
+                if self.table is None:
+                    self._add_table(record)
                 
-                # Add data rows
-                for record in data:
-                    row_cells = table.add_row().cells
-                    for i, field in enumerate(ordered_fields):
-                        if field in record:
-                            row_cells[i].text = str(record[field])
-            
-            # Create output file path
-            file_name = os.path.join(output_path, 'extracted_data.docx')
+                # Add data row
+                self._append_row(record)
+        except Exception as e:
+            self._fail(e)
+    
+    def close(self) -> str:
+        """
+        Finish and save the Word document.
+        
+        Returns:
+            Path to the created Word document, or an empty string on error
+        """
+        if self.doc is None:
+            return ""
+        
+        try:
+            if self.summary is not None:
+                self.summary.add_run(f"Total records: {self.count}")
             
             # Save the document
-            doc.save(file_name)
-            
-            return file_name
-            
+            self.doc.save(self.file_name)
         except Exception as e:
-            print(f"Error exporting to Word: {str(e)}")
+            self._fail(e)
             return ""
+        
+        self.doc = None
+        return self.file_name
+    
+    def _add_table(self, first_record: Dict[str, Any]) -> None:
+        """
+        Add the data table and its header row, once the first record is known.
+        
+        Args:
+            first_record: First record to be written
+        """
+        # If no structure defined, use all fields from first record
+        if not self.ordered_fields:
+            self.ordered_fields = list(first_record.keys())
+        
+        # Create table
+        self.table = self.doc.add_table(rows=1, cols=len(self.ordered_fields))
+        self.table.style = 'Table Grid'
+        
+        # Add header row
+        header_cells = self.table.rows[0].cells
+        for i, field in enumerate(self.ordered_fields):
+            display_name = self.field_to_display.get(field, field)
+            header_cells[i].text = display_name
+            # Make header bold
+            for paragraph in header_cells[i].paragraphs:
+                for run in paragraph.runs:
+                    run.bold = True
+        
+        # Data rows are copied from an empty row, built the way table.add_row() builds it
+        self.row_template = self.table.add_row()._tr
+        self.table._tbl.remove(self.row_template)
+    
+    def _append_row(self, record: Dict[str, Any]) -> None:
+        """
+        Append a data row to the table by writing its XML directly.
+        
+        Going through table.add_row().cells makes python-docx rescan the whole
+        table for every row, so the time per row grows with the table. Copying
+        the row template keeps it constant while producing the same XML as
+        setting cell.text on each cell.
+        
+        Args:
+            record: Record to write
+        """
+        tr = deepcopy(self.row_template)
+        
+        for field, tc in zip(self.ordered_fields, tr.iterchildren(TC_TAG)):
+            if field in record:
+                # The empty paragraph of the cell receives a single run with the text
+                tc.p_lst[0].add_r().text = str(record[field])
+        
+        self.table._tbl.append(tr)
+    
+    def _fail(self, error: Exception) -> None:
+        """Report an export error and stop writing."""
+        print(f"Error exporting to Word: {str(error)}")
+        self.doc = None
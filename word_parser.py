@@ -2,13 +2,50 @@
 Parser module for Word documents.
 Extracts data from Word documents based on paragraph content defined in the configuration.
 """
+import zipfile
+import xml.etree.ElementTree as ET
 import docx
-from typing import Dict, List, Any
+import pandas as pd
+from typing import Dict, Iterable, Iterator, List, Any, Tuple
+
+from .column_mapper import ColumnMapper
+from .rule_index import RuleIndex
+
+# WordprocessingML namespace and the tags read by the streaming parser
+W_NAMESPACE = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+W_BODY = W_NAMESPACE + 'body'
+W_P = W_NAMESPACE + 'p'
+W_R = W_NAMESPACE + 'r'
+W_HYPERLINK = W_NAMESPACE + 'hyperlink'
+W_T = W_NAMESPACE + 't'
+W_BR = W_NAMESPACE + 'br'
+W_TYPE = W_NAMESPACE + 'type'
+W_TBL = W_NAMESPACE + 'tbl'
+W_TR = W_NAMESPACE + 'tr'
+W_TC = W_NAMESPACE + 'tc'
+W_TC_PR = W_NAMESPACE + 'tcPr'
+W_GRID_SPAN = W_NAMESPACE + 'gridSpan'
+W_V_MERGE = W_NAMESPACE + 'vMerge'
+W_VAL = W_NAMESPACE + 'val'
+
+# Text equivalents of the run content elements, as used by python-docx
+RUN_CONTENT_TEXT = {
+    W_NAMESPACE + 'tab': '\t',
+    W_NAMESPACE + 'ptab': '\t',
+    W_NAMESPACE + 'cr': '\n',
+    W_NAMESPACE + 'noBreakHyphen': '-',
+}
 
 
 class WordParser:
     """Parser for extracting data from Word documents."""
     
+    # Version of the records produced; bump it when parsing results change
+    VERSION = 1
+    
+    # Input configuration keys that affect the records produced
+    CONFIG_KEYS = ('word_extraction', 'word_tables')
+    
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize the Word parser with configuration.
@@ -17,11 +54,24 @@ class WordParser:
             config: Dictionary containing Word extraction configurations
         """
         self.extraction_rules = config.get('word_extraction', [])
+        
+        # Drop incomplete rules once instead of re-checking them for every paragraph
+        self.rules = [
+            rule for rule in self.extraction_rules
+            if rule.get('name') and rule.get('paragraph_contains') and rule.get('extract_after')
+        ]
+        self.rule_index = RuleIndex([str(rule['paragraph_contains']) for rule in self.rules])
+        
+        # Table columns are mapped to fields the same way as Excel/CSV columns
+        self.table_mapper = ColumnMapper(config.get('word_tables', []))
     
     def parse(self, file_path: str) -> List[Dict[str, Any]]:
         """
         Parse a Word document and extract data based on configured extraction rules.
         
+        The document XML is streamed directly from the .docx archive. Documents the
+        streaming reader cannot handle are opened with python-docx instead.
+        
         Args:
             file_path: Path to the Word document
             
@@ -29,52 +79,269 @@ class WordParser:
             List of dictionaries containing extracted data
         """
         results = []
-        record = {}
         
         try:
-            # Open the Word document
-            doc = docx.Document(file_path)
-            
-            # Process each paragraph
-            for paragraph in doc.paragraphs:
-                text = paragraph.text.strip()
-                if not text:
-                    continue
-                
-                for rule in self.extraction_rules:
-                    name = rule.get('name')
-                    contains = rule.get('paragraph_contains')
-                    extract_after = rule.get('extract_after')
-                    value_type = rule.get('type', 'str')
-                    
-                    if not name or not contains or not extract_after:
-                        continue
-                    
-                    if contains in text:
-                        # Extract the text after the specified marker
-                        parts = text.split(extract_after, 1)
-                        if len(parts) > 1:
-                            value = parts[1].strip()
-                            
-                            # Convert value to specified type
-                            if value_type == 'int':
-                                try:
-                                    value = int(value)
-                                except ValueError:
-                                    continue
-                            elif value_type == 'float':
-                                try:
-                                    value = float(value)
-                                except ValueError:
-                                    continue
-                            
-                            record[name] = value
+            try:
+                record, table_records = self._extract_body(self._iter_xml_body(file_path))
+            except (KeyError, ValueError, zipfile.BadZipFile, ET.ParseError):
+                # Open the Word document with python-docx
+                doc = docx.Document(file_path)
+                record, table_records = self._extract_body(self._iter_docx_body(doc))
             
             # If we found any data, add it to results
             if record:
                 results.append(record)
+            
+            # Every mapped table row forms a record of its own
+            results.extend(table_records)
                 
         except Exception as e:
             print(f"Error parsing Word document {file_path}: {str(e)}")
         
         return results
+    
+    def _extract_body(self, items: Iterable[Tuple[str, Any]]) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        """
+        Extract data from the paragraphs and tables of a document body.
+        
+        Args:
+            items: ('paragraph', text) and ('table', rows) tuples, in document order
+            
+        Returns:
+            Tuple of the record built from the paragraphs and the records of the table rows
+        """
+        record = {}
+        table_records = []
+        
+        for kind, content in items:
+            if kind == 'paragraph':
+                self._apply_rules(content, record)
+            else:
+                table_records.extend(self._map_table(content))
+        
+        return record, table_records
+    
+    def _apply_rules(self, text: str, record: Dict[str, Any]) -> None:
+        """
+        Apply the extraction rules to the text of one paragraph.
+        
+        Args:
+            text: Paragraph text
+            record: Record receiving the extracted values
+        """
+        text = text.strip()
+        if not text:
+            return
+        
+        # Only the rules whose marker occurs in the paragraph are applied
+        for index in self.rule_index.match(text):
+            rule = self.rules[index]
+            name = rule['name']
+            extract_after = rule['extract_after']
+            value_type = rule.get('type', 'str')
+            
+            # Extract the text after the specified marker
+            parts = text.split(extract_after, 1)
+            if len(parts) > 1:
+                value = parts[1].strip()
+                
+                # Convert value to specified type
+                if value_type == 'int':
+                    try:
+                        value = int(value)
+                    except ValueError:
+                        continue
+                elif value_type == 'float':
+                    try:
+                        value = float(value)
+                    except ValueError:
+                        continue
+                
+                record[name] = value
+    
+    def _map_table(self, rows: List[List[str]]) -> List[Dict[str, Any]]:
+        """
+        Map the rows of a table to records using the 'word_tables' mappings.
+        
+        The first row holds the column headers, which are resolved into a
+        mapping plan. The values of the mapped columns are gathered and cast a
+        column at a time, like Excel/CSV columns. A column whose values cannot
+        be cast is reported and left out, like paragraph values that cannot be
+        converted, so the rest of the document is still extracted.
+        
+        Args:
+            rows: Cell text of each table row
+            
+        Returns:
+            List of dictionaries containing extracted data, one per table row
+        """
+        if len(rows) < 2:
+            return []
+        
+        plan = self.table_mapper.plan([name.strip() for name in rows[0]])
+        if not plan.fields:
+            return []
+        
+        # Empty cells are missing values, so they are left alone by the casts
+        columns = {
+            position: pd.Series([
+                (row[position].strip() or None) if position < len(row) else None
+                for row in rows[1:]
+            ])
+            for position in plan.positions
+        }
+        
+        mapped = {}
+        for target_field, position, cast in plan.fields:
+            try:
+                mapped[target_field] = cast(columns[position])
+            except (ValueError, TypeError) as e:
+                print(f"Error converting Word table column '{plan.header[position]}': {str(e)}")
+        
+        return self.table_mapper.to_records(pd.DataFrame(mapped))
+    
+    def _iter_xml_body(self, file_path: str) -> Iterator[Tuple[str, Any]]:
+        """
+        Stream the paragraphs and tables of the body from the document XML.
+        
+        Produces the same paragraph text as python-docx's doc.paragraphs, without
+        building the document object model. Each top-level body element is cleared
+        once it has been read, so memory use does not grow with the document size.
+        Tables are only read when 'word_tables' mappings are configured.
+        
+        Args:
+            file_path: Path to the Word document
+            
+        Yields:
+            ('paragraph', text) and ('table', rows) tuples, in document order
+            
+        Raises:
+            KeyError: If the archive has no word/document.xml part
+            ValueError: If the document has no WordprocessingML body
+        """
+        read_tables = bool(self.table_mapper.mappings)
+        
+        with zipfile.ZipFile(file_path) as archive:
+            with archive.open('word/document.xml') as document_xml:
+                body = None
+                depth = 0
+                
+                for event, element in ET.iterparse(document_xml, events=('start', 'end')):
+                    if event == 'start':
+                        depth += 1
+                        if depth == 2 and element.tag == W_BODY:
+                            body = element
+                        continue
+                    
+                    depth -= 1
+                    
+                    # Only direct children of the body are handled, like doc.paragraphs
+                    if body is None or depth != 2:
+                        continue
+                    
+                    if element.tag == W_P:
+                        yield 'paragraph', self._paragraph_text(element)
+                    elif element.tag == W_TBL and read_tables:
+                        yield 'table', self._table_rows(element)
+                    
+                    body.clear()
+                
+                if body is None:
+                    raise ValueError("Document has no WordprocessingML body")
+    
+    def _iter_docx_body(self, doc: 'docx.document.Document') -> Iterator[Tuple[str, Any]]:
+        """
+        Get the paragraphs and tables of a document opened with python-docx.
+        
+        Args:
+            doc: python-docx document
+            
+        Yields:
+            ('paragraph', text) and ('table', rows) tuples
+        """
+        for paragraph in doc.paragraphs:
+            yield 'paragraph', paragraph.text
+        
+        if self.table_mapper.mappings:
+            for table in doc.tables:
+                yield 'table', [[cell.text for cell in row.cells] for row in table.rows]
+    
+    @classmethod
+    def _table_rows(cls, table: ET.Element) -> List[List[str]]:
+        """
+        Read the cell text of each row of a table element.
+        
+        Horizontally merged cells are repeated across the columns they span and
+        vertically merged cells repeat the text of the cell above, as python-docx's
+        row.cells does.
+        
+        Args:
+            table: w:tbl element
+            
+        Returns:
+            Cell text of each table row
+        """
+        rows = []
+        previous = []
+        
+        for table_row in table.findall(W_TR):
+            row = []
+            
+            for cell in table_row.findall(W_TC):
+                span = 1
+                merged = False
+                
+                properties = cell.find(W_TC_PR)
+                if properties is not None:
+                    grid_span = properties.find(W_GRID_SPAN)
+                    if grid_span is not None:
+                        span = int(grid_span.get(W_VAL, 1))
+                    v_merge = properties.find(W_V_MERGE)
+                    if v_merge is not None:
+                        merged = v_merge.get(W_VAL, 'continue') == 'continue'
+                
+                if merged and len(row) < len(previous):
+                    text = previous[len(row)]
+                else:
+                    text = '\n'.join(cls._paragraph_text(paragraph) for paragraph in cell.findall(W_P))
+                
+                row.extend([text] * span)
+            
+            rows.append(row)
+            previous = row
+        
+        return rows
+    
+    @staticmethod
+    def _paragraph_text(paragraph: ET.Element) -> str:
+        """
+        Rebuild the text of a paragraph element from its runs.
+        
+        Args:
+            paragraph: w:p element
+            
+        Returns:
+            Paragraph text, as python-docx's Paragraph.text would return it
+        """
+        parts = []
+        
+        for child in paragraph:
+            if child.tag == W_R:
+                runs = [child]
+            elif child.tag == W_HYPERLINK:
+                runs = child.findall(W_R)
+            else:
+                continue
+            
+            for run in runs:
+                for content in run:
+                    if content.tag == W_T:
+                        parts.append(content.text or '')
+                    elif content.tag == W_BR:
+                        # Only line breaks are text; page and column breaks are not
+                        if content.get(W_TYPE, 'textWrapping') == 'textWrapping':
+                            parts.append('\n')
+                    elif content.tag in RUN_CONTENT_TEXT:
+                        parts.append(RUN_CONTENT_TEXT[content.tag])
+        
+        return ''.join(parts)